@@ -0,0 +1,322 @@
+"""
+Benchmark the placement pipeline on synthetic jobs from 100 to 100k parts.
+
+Generates an Altium-style pick-and-place export, BOM and footprint library
+per size, times parsing, footprint matching and placement geometry, and,
+when a display is available (e.g. under xvfb-run), the GUI stages on a real
+ProjectionGUI window. Results are written as JSON.
+
+    xvfb-run python benchmark.py --sizes 100 1000 10000 --output bench.json
+"""
+import argparse
+import contextlib
+import csv
+import io
+import json
+import math
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from board import Board, Placement
+from bom import Bom
+from footprints import FootprintLibrary
+from readpickandplace import read_pick_and_place
+from scene import ComponentScene
+from sequence import plan_pages
+
+DEFAULT_SIZES = [100, 1000, 10000, 100000]
+
+# Footprint families used by the generator: designator prefix, library name, shape, width, height, values
+PART_FAMILIES = [
+    ("C", "Capacitor,_0402_Imperial_(1005_Metric)", "rectangle", 1.0, 0.5, ["100 nF", "1 uF", "10 nF", "18 pF"]),
+    ("C", "Capacitor,_0603_Imperial_(1608_Metric)", "rectangle", 1.6, 0.8, ["1 uF", "10 uF", "4.7 uF"]),
+    ("R", "Resistor,_0402_Imperial_(1005_Metric)", "rectangle", 1.0, 0.5, ["10k", "4k7", "100R", "1k", "0R"]),
+    ("R", "Resistor,_0603_Imperial_(1608_Metric)", "rectangle", 1.6, 0.8, ["22R", "47k", "330R"]),
+    ("LED", "LED,_0603_Imperial_(1608_Metric)", "rectangle", 1.6, 0.8, ["Green", "Red"]),
+    ("U", "SOIC-8_3.9x4.9mm_P1.27mm", "rectangle", 6.0, 4.9, ["LM358", "NE555", "24LC256"]),
+    ("U", "QFN-32-1EP_5x5mm_P0.5mm", "rectangle", 5.0, 5.0, ["STM32G031", "ATmega328P"]),
+    ("SW", "Switch,_C&K_,_RM104772BCB", "circle", 9.2, 9.2, ["Tactile"]),
+]
+
+# Share of parts whose footprint string differs from the library name, or is not in it at all
+VARIANT_SHARE = 0.2
+MISSING_SHARE = 0.01
+
+# Extra unused library entries, so matching runs against a realistically sized library
+LIBRARY_PADDING = 500
+
+
+def generate_job(directory, count, seed=0):
+    """
+    Write inputdata.csv, BOM.csv and footprints.csv for a count-part board into directory.
+    Returns the board width and length in mm.
+    """
+    rng = random.Random(seed)
+    board_length = math.ceil(math.sqrt(count * 12 / 1.6))
+    board_width = math.ceil(board_length * 1.6)
+
+    rows = []
+    counters = {}
+    bom_lines = {}
+    for _ in range(count):
+        prefix, footprint, shape, width, height, values = rng.choice(PART_FAMILIES)
+        counters[prefix] = counters.get(prefix, 0) + 1
+        designator = f"{prefix}{counters[prefix]}"
+        comment = rng.choice(values)
+
+        # Altium footprint strings drift from the library names, e.g. spaces for underscores
+        roll = rng.random()
+        if roll < MISSING_SHARE:
+            footprint = f"Unknown_{prefix}_{rng.randrange(20)}"
+        elif roll < VARIANT_SHARE:
+            footprint = footprint.replace("_", " ").replace(",", "")
+
+        rows.append(["TopLayer", designator, f"{rng.uniform(2, board_length - 2):.4f}",
+                     f"{rng.uniform(2, board_width - 2):.4f}", comment, footprint,
+                     f"{rng.choice([0, 90, 180, 270])}", f"{prefix} {comment}"])
+        bom_lines.setdefault((comment, footprint), []).append(designator)
+
+    with open(os.path.join(directory, "inputdata.csv"), 'w', newline='') as f:
+        writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+        writer.writerow(["Layer", "Designator", "Center-Y(mm)", "Center-X(mm)", "Comment", "Footprint",
+                         "Rotation", "Description"])
+        writer.writerows(rows)
+
+    with open(os.path.join(directory, "BOM.csv"), 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["Comment", "Description", "Designator", "Footprint", "LibRef", "Quantity", "Fitted"])
+        for (comment, footprint), designators in bom_lines.items():
+            writer.writerow([comment, comment, ", ".join(designators), footprint, comment, len(designators), "Fitted"])
+
+    with open(os.path.join(directory, "footprints.csv"), 'w', newline='') as f:
+        writer = csv.writer(f)
+        for index in range(LIBRARY_PADDING):
+            writer.writerow([f"Unused_Footprint_{index:04d}", "rectangle", 1.0, 1.0, 0.0, 0.0])
+        for _, footprint, shape, width, height, _ in PART_FAMILIES:
+            writer.writerow([footprint, shape, width, height, 0.0, 0.0])
+
+    return board_width, board_length
+
+
+def best_time(function, repeat):
+    """
+    Run function repeat times, return the fastest time in seconds and the last result.
+    """
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def benchmark_pipeline(directory, repeat):
+    """
+    Time the stages that run without Tk.
+    """
+    input_path = os.path.join(directory, "inputdata.csv")
+    timings = {}
+
+    timings["read_pick_and_place"], components = best_time(
+        lambda: list(read_pick_and_place(input_path, layer=None)), repeat)
+    timings["board_load"], board = best_time(lambda: Board.load(input_path, layer="TopLayer"), repeat)
+
+    footprints_path = os.path.join(directory, "footprints.csv")
+
+    def match():
+        # Loaded the way the GUI loads it, the matcher is built once per library
+        matcher = FootprintLibrary.load(footprints_path).matcher
+        return [matcher.match(name) for name in board.footprint_names]
+
+    timings["footprint_match"], matches = best_time(match, repeat)
+    timings["placement_geometry"], placement = best_time(lambda: Placement.build(board, matches), repeat)
+
+    # Page order and visiting paths, run on every placement
+    bom = Bom.load(os.path.join(directory, "BOM.csv"))
+    scene = ComponentScene(board, placement, [0], [0.0], np.eye(3)[np.newaxis])
+    timings["page_sequence"], _ = best_time(lambda: plan_pages(scene, bom.pages), repeat)
+
+    counts = {
+        "components": len(components),
+        "distinct_footprints": len(board.footprint_names),
+        "placed": len(placement),
+        "missing_footprints": len(placement.missing_footprints),
+    }
+    return timings, counts
+
+
+class _QuietMessagebox:
+    # Dialogs would block the run, report them on stderr instead
+    def __getattr__(self, name):
+        def show(title="", message="", **kwargs):
+            print(f"{name}: {title}: {message}", file=sys.stderr)
+            return False
+        return show
+
+
+def benchmark_gui(directory, board_width, board_length, flips):
+    """
+    Time the GUI stages on a real window. Returns (timings, counts), or None
+    with the reason when Tk cannot open a display.
+    """
+    import tkinter as tk
+    import gui
+
+    class BenchmarkGUI(gui.ProjectionGUI):
+        # Time the synthetic board, not the job last opened in the GUI
+        restore_active_job = False
+        count_tk_calls = True
+
+        def set_file_paths(self):
+            self.inputdata_path = os.path.join(directory, "inputdata.csv")
+            self.pcbdata_path = os.path.join(directory, "pcbdata.csv")
+            self.footprints_path = os.path.join(directory, "footprints.csv")
+            self.calibration_path = os.path.join(directory, "calibration.json")
+            self.bom_path = os.path.join(directory, "BOM.csv")
+            self.project_cache_path = os.path.join(directory, gui.CACHE_FILE)
+            self.metrics_path = os.path.join(directory, "metrics.json")
+            self.jobs_path = os.path.join(directory, gui.JOBS_FILE)
+
+    gui.messagebox = _QuietMessagebox()
+    try:
+        app = BenchmarkGUI()
+    except tk.TclError as e:
+        return None, str(e)
+
+    timings = {}
+    try:
+        app.geometry("1280x800+0+0")
+        app.update()
+
+        # Fit the outline to the canvas, the way an operator would size it on the projector
+        app.original_pcb_width, app.original_pcb_length = float(board_width), float(board_length)
+        app.pcb_width, app.pcb_length = app.outline_size()
+        canvas_width, canvas_height = app.canvas.winfo_width(), app.canvas.winfo_height()
+        scale = min((canvas_width - 40) / board_width, (canvas_height - 40) / board_length)
+        app.set_board_pose(gui.BoardPose.from_outline([20, 20, 20 + board_width * scale, 20 + board_length * scale]))
+
+        def timed(name, function):
+            start = time.perf_counter()
+            function()
+            app.update_idletasks()
+            timings[name] = time.perf_counter() - start
+
+        def load_pcb():
+            # The background parse, waited for and handed over as the Tk poll would
+            app.load_pcb()
+            app._load_thread.join()
+            app._poll_load_pcb()
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            timed("load_pcb", load_pcb)
+            timed("place_components", app.place_components)
+
+            app.set_board_pose(gui.BoardPose.from_outline([20, 20, 20 + board_width * scale * 0.8,
+                                                            20 + board_length * scale * 0.8]))
+            timed("rescale_components", app.rescale_components)
+
+            # Four turns bring the board back to where it started
+            timed("rotate_pcb", lambda: [app.rotate_pcb() for _ in range(4)])
+            timings["rotate_pcb"] /= 4
+
+            pages = min(flips, app.total_pages - 1)
+            app.prerender_var.set(False)
+            flip_times = []
+            for page in range(1, pages + 1):
+                app.current_page = page
+                start = time.perf_counter()
+                app.highlight_components()
+                app.update_idletasks()
+                flip_times.append(time.perf_counter() - start)
+
+            # Pre-rendered flips, each page waited for before it is shown
+            app.prerender_var.set(True)
+            frame_times = []
+            for page in range(1, pages + 1):
+                app.current_page = page
+                app.highlight_components()
+                deadline = time.perf_counter() + 10
+                while page not in app.frame_cache and time.perf_counter() < deadline:
+                    app.frame_cache.collect(gui.ImageTk.PhotoImage)
+                    time.sleep(0.001)
+                app.hide_page_frame()
+                start = time.perf_counter()
+                app.highlight_components()
+                app.update_idletasks()
+                frame_times.append(time.perf_counter() - start)
+
+        if flip_times:
+            timings["highlight_components_mean"] = sum(flip_times) / len(flip_times)
+            timings["highlight_components_max"] = max(flip_times)
+        if frame_times:
+            timings["frame_flip_mean"] = sum(frame_times) / len(frame_times)
+            timings["frame_flip_max"] = max(frame_times)
+
+        counts = {
+            "bom_pages": app.total_pages - 1,
+            "flipped_pages": pages,
+            "scene_entries": len(app.component_scene) if app.component_scene else 0,
+            "drawn_components": len(app._drawn),
+            "canvas_items": len(app.canvas.find_all()),
+            "tk_calls": app.metrics.counters.get("tk_calls", 0),
+        }
+    finally:
+        app.destroy()
+    return timings, counts
+
+
+def run(sizes, repeat=3, flips=50, seed=0, gui=True):
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": [],
+    }
+    for count in sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            board_width, board_length = generate_job(directory, count, seed)
+            timings, counts = benchmark_pipeline(directory, repeat)
+            result = {"parts": count, "board_mm": [board_width, board_length], "timings": timings, "counts": counts}
+
+            if gui:
+                gui_timings, gui_counts = benchmark_gui(directory, board_width, board_length, flips)
+                if gui_timings is None:
+                    result["gui_skipped"] = gui_counts
+                else:
+                    timings.update(gui_timings)
+                    counts.update(gui_counts)
+
+            report["results"].append(result)
+            print(f"{count} parts: " + ", ".join(f"{name} {seconds * 1000:.1f} ms" for name, seconds in timings.items()),
+                  file=sys.stderr)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark BeamBOM on synthetic boards.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="part counts to generate")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per non-GUI stage, the fastest is kept")
+    parser.add_argument("--flips", type=int, default=50, help="BOM pages flipped through per size")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-gui", action="store_true", help="skip the stages that need a Tk display")
+    parser.add_argument("--output", help="JSON file to write, stdout if omitted")
+    args = parser.parse_args()
+
+    report = run(args.sizes, args.repeat, args.flips, args.seed, gui=not args.no_gui)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+import logging
+import os
+from array import array
+
+import numpy as np
+
+from pcb_utils import footprint_outlines
+from readpickandplace import CHUNK_SIZE, LAYERS, Component, read_pick_and_place_chunks, select_rows
+
+logger = logging.getLogger(__name__)
+
+
+class Board:
+    """
+    Column-oriented placement data, parsed once and shared by every GUI action.
+    Coordinates and rotations are stored as float arrays, footprints as an
+    index into the list of distinct footprint strings.
+    """
+
+    def __init__(self, source_path=None, layer=None):
+        self.source_path = source_path
+        self.layer = layer
+        self.source_mtime = None
+
+        self.designators = []
+        self.x = array('d')
+        self.y = array('d')
+        self.rotation = array('d')
+        self.footprint_ids = array('i')
+        self.footprint_names = []
+        self.comments = []
+        self.descriptions = []
+        self._footprint_lookup = {}
+        self._designator_lookup = None
+
+    @classmethod
+    def from_components(cls, components, source_path=None, layer=None):
+        board = cls(source_path, layer)
+        for component in components:
+            board.append(component)
+        return board
+
+    @classmethod
+    def load(cls, path, layer=None, progress=None, chunk_size=CHUNK_SIZE):
+        """
+        Parse a pick-and-place or pcbdata.csv file into a new Board, chunk by chunk.
+        progress(bytes_read, total_bytes) is called as the file is read.
+        """
+        mtime = os.path.getmtime(path)
+        board = cls(path, layer)
+        for chunk in read_pick_and_place_chunks(path, layer=layer, chunk_size=chunk_size, progress=progress):
+            board.extend(chunk)
+        board.source_mtime = mtime
+        return board
+
+    @classmethod
+    def load_layers(cls, path, layers=LAYERS, progress=None, chunk_size=CHUNK_SIZE):
+        """
+        Parse a pick-and-place file once into one Board per layer, keyed by layer name.
+        """
+        mtime = os.path.getmtime(path)
+        boards = {layer: cls(path, layer) for layer in layers}
+        for chunk in read_pick_and_place_chunks(path, layer=None, chunk_size=chunk_size, progress=progress):
+            for layer, board in boards.items():
+                if all(row_layer == layer for row_layer in chunk.layers):
+                    board.extend(chunk)
+                    break
+                rows = [row for row, row_layer in enumerate(chunk.layers) if row_layer == layer]
+                if rows:
+                    board.extend(select_rows(chunk, rows))
+        for board in boards.values():
+            board.source_mtime = mtime
+        return boards
+
+    def append(self, component):
+        footprint_id = self._footprint_lookup.get(component.footprint)
+        if footprint_id is None:
+            footprint_id = len(self.footprint_names)
+            self._footprint_lookup[component.footprint] = footprint_id
+            self.footprint_names.append(component.footprint)
+
+        self.designators.append(component.designator)
+        self.x.append(component.x)
+        self.y.append(component.y)
+        self.rotation.append(component.rotation)
+        self.footprint_ids.append(footprint_id)
+        self.comments.append(component.comment)
+        self.descriptions.append(component.description)
+        self._designator_lookup = None
+
+    def extend(self, chunk):
+        """
+        Append a ComponentChunk of columns.
+        """
+        lookup = self._footprint_lookup
+        for footprint in chunk.footprints:
+            footprint_id = lookup.get(footprint)
+            if footprint_id is None:
+                footprint_id = lookup[footprint] = len(self.footprint_names)
+                self.footprint_names.append(footprint)
+            self.footprint_ids.append(footprint_id)
+
+        self.designators.extend(chunk.designators)
+        self.x.extend(chunk.x)
+        self.y.extend(chunk.y)
+        self.rotation.extend(chunk.rotations)
+        self.comments.extend(chunk.comments)
+        self.descriptions.extend(chunk.descriptions)
+        self._designator_lookup = None
+
+    def __len__(self):
+        return len(self.designators)
+
+    def component(self, index):
+        """
+        Return row index as a Component record.
+        """
+        return Component(self.designators[index], self.x[index], self.y[index], self.comments[index],
+                         self.footprint_names[self.footprint_ids[index]], self.rotation[index],
+                         self.descriptions[index], self.layer or '')
+
+    def components(self):
+        for index in range(len(self)):
+            yield self.component(index)
+
+    def footprint(self, index):
+        return self.footprint_names[self.footprint_ids[index]]
+
+    def index_of(self, designator):
+        """
+        Return the row of designator, or None if it is not on the board.
+        """
+        if self._designator_lookup is None:
+            self._designator_lookup = {name: index for index, name in enumerate(self.designators)}
+        return self._designator_lookup.get(designator)
+
+    def is_stale(self):
+        """
+        True when the source file changed on disk since the board was loaded.
+        """
+        if self.source_path is None or self.source_mtime is None:
+            return False
+        try:
+            return os.path.getmtime(self.source_path) != self.source_mtime
+        except OSError:
+            return False
+
+    def reload_if_changed(self):
+        """
+        Return this board, or a freshly parsed one if the source file changed.
+        """
+        if self.is_stale():
+            return Board.load(self.source_path, self.layer)
+        return self
+
+
+# Footprint shapes as stored in Placement.shapes
+SHAPE_RECTANGLE = 1
+SHAPE_CIRCLE = 2
+
+
+class Placement:
+    """
+    The drawable components of a Board with their footprint outlines
+    precomputed in board mm. Only a board-to-canvas transform is needed
+    to draw it.
+    """
+
+    def __init__(self, indices, shapes, outlines, missing_footprints=()):
+        self.indices = indices
+        self.shapes = shapes
+        self.outlines = outlines
+        self.missing_footprints = set(missing_footprints)
+
+    @classmethod
+    def build(cls, board, footprint_matches):
+        """
+        footprint_matches holds the matched library entry (or None) per footprint id.
+        """
+        indices = []
+        shapes = []
+        extents = []
+        missing_footprints = set()
+        for index in range(len(board)):
+            footprint = footprint_matches[board.footprint_ids[index]]
+            if not footprint:
+                missing_footprints.add(board.footprint(index))
+            elif footprint['Shape'] == 'rectangle':
+                indices.append(index)
+                shapes.append(SHAPE_RECTANGLE)
+                extents.append((footprint['Width'], footprint['Height']))
+            elif footprint['Shape'] == 'circle':
+                indices.append(index)
+                shapes.append(SHAPE_CIRCLE)
+                extents.append((footprint['Width'], footprint['Width']))
+            else:
+                logger.warning("Unknown shape for footprint %s: %s", board.footprint(index), footprint['Shape'])
+
+        indices = np.array(indices, dtype=int)
+        shapes = np.array(shapes, dtype=np.int8)
+        centers = np.column_stack([np.asarray(board.x)[indices], np.asarray(board.y)[indices]])
+        rotations = np.where(shapes == SHAPE_CIRCLE, 0.0, np.asarray(board.rotation)[indices])
+        outlines = footprint_outlines(centers, rotations, np.array(extents, dtype=float).reshape(-1, 2))
+        return cls(indices, shapes, outlines, missing_footprints)
+
+    def __len__(self):
+        return len(self.indices)
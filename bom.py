@@ -0,0 +1,129 @@
+import csv
+import io
+import re
+from collections import namedtuple
+
+from readpickandplace import detect_encoding
+
+# A range such as "R1-R8" or "R1-8"; the prefix has to match on both sides
+_RANGE = re.compile(r'^([A-Za-z_]+)(\d+)-(?:\1)?(\d+)$')
+_SEPARATORS = re.compile(r'[,;\s]+')
+_RANGE_DASH = re.compile(r'\s*-\s*')
+
+# Longest range expanded, anything bigger is a typo and kept as written
+MAX_RANGE = 10000
+
+
+def expand_designators(text):
+    """
+    Split a BOM Designator cell into designators, expanding ranges like R1-R8.
+    """
+    designators = []
+    for token in _SEPARATORS.split(_RANGE_DASH.sub('-', text.strip())):
+        if not token:
+            continue
+        match = _RANGE.match(token)
+        if match:
+            prefix, start, end = match.group(1), int(match.group(2)), int(match.group(3))
+            if start <= end and end - start < MAX_RANGE:
+                designators.extend(f"{prefix}{number}" for number in range(start, end + 1))
+                continue
+        designators.append(token)
+    return designators
+
+
+def parse_quantity(value):
+    try:
+        return int(float(value.strip().replace(',', '.')))
+    except (AttributeError, ValueError):
+        return None
+
+
+class Bom:
+    """
+    A BOM export decoded once, with every line's designators expanded and an
+    index from designator to BOM line.
+    """
+
+    def __init__(self, lines, encoding='utf-8'):
+        self.lines = lines
+        self.encoding = encoding
+        self.pages = [expand_designators(line.get('Designator') or '') for line in lines]
+        self.quantities = [parse_quantity(line.get('Quantity')) for line in lines]
+
+        # Designators listed on more than one line keep their first line
+        self.designator_lines = {}
+        self.duplicates = []
+        for line_index, designators in enumerate(self.pages):
+            for designator in designators:
+                if self.designator_lines.setdefault(designator, line_index) != line_index:
+                    self.duplicates.append(designator)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            data = f.read()
+        encoding = detect_encoding(data)
+        text = data.decode(encoding, errors='replace')
+        return cls(list(csv.DictReader(io.StringIO(text, newline=''))), encoding)
+
+    def __len__(self):
+        return len(self.lines)
+
+    def line_of(self, designator):
+        """
+        Return the BOM line index listing designator, or None.
+        """
+        return self.designator_lines.get(designator)
+
+
+# Result of Bom.cross_check, designators and BOM line indices (0-based)
+BomReport = namedtuple('BomReport', ['missing_from_board', 'not_in_bom', 'unplaced_lines',
+                                     'quantity_mismatches', 'duplicates'])
+
+
+def cross_check(bom, board_designators):
+    """
+    Compare the BOM with the pick-and-place designators in one pass over each.
+    quantity_mismatches holds (line index, Quantity, designators listed) tuples.
+    """
+    on_board = set(board_designators)
+    missing_from_board = [designator for designator in bom.designator_lines if designator not in on_board]
+    not_in_bom = [designator for designator in board_designators if designator not in bom.designator_lines]
+
+    unplaced_lines = []
+    quantity_mismatches = []
+    for line_index, (designators, quantity) in enumerate(zip(bom.pages, bom.quantities)):
+        if designators and not any(designator in on_board for designator in designators):
+            unplaced_lines.append(line_index)
+        if quantity is not None and quantity != len(designators):
+            quantity_mismatches.append((line_index, quantity, len(designators)))
+
+    return BomReport(missing_from_board, not_in_bom, unplaced_lines, quantity_mismatches, bom.duplicates)
+
+
+def format_report(report, limit=10):
+    """
+    Human readable summary of a BomReport, empty when BOM and board agree.
+    BOM lines are numbered from 1 like the GUI pages.
+    """
+    def listed(items):
+        shown = ", ".join(str(item) for item in items[:limit])
+        return shown + (f" and {len(items) - limit} more" if len(items) > limit else "")
+
+    lines = []
+    if report.missing_from_board:
+        lines.append(f"{len(report.missing_from_board)} BOM designators missing from the board: "
+                     f"{listed(report.missing_from_board)}")
+    if report.not_in_bom:
+        lines.append(f"{len(report.not_in_bom)} board designators not in the BOM: {listed(report.not_in_bom)}")
+    if report.unplaced_lines:
+        lines.append(f"{len(report.unplaced_lines)} BOM lines with nothing on the board: "
+                     f"{listed([line_index + 1 for line_index in report.unplaced_lines])}")
+    if report.quantity_mismatches:
+        lines.append(f"{len(report.quantity_mismatches)} BOM lines whose Quantity does not match: "
+                     + listed([f"line {line_index + 1} ({quantity} vs {count})"
+                               for line_index, quantity, count in report.quantity_mismatches]))
+    if report.duplicates:
+        lines.append(f"{len(report.duplicates)} designators on more than one BOM line: {listed(report.duplicates)}")
+    return "\n".join(lines)
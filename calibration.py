@@ -0,0 +1,205 @@
+import json
+import os
+
+import numpy as np
+
+from pcb_utils import (mirror_matrix, rotation_matrix, scale_matrix, solve_homography, transform_points,
+                       translation_matrix)
+
+# Order in which the physical board corners are clicked
+CORNER_NAMES = ["bottom-left (origin)", "bottom-right", "top-right", "top-left"]
+
+# Smallest outline side in pixels a resize can leave
+MIN_OUTLINE_SIZE = 10
+
+# Smallest area in square pixels of a calibrated quadrilateral
+MIN_CALIBRATION_AREA = MIN_OUTLINE_SIZE ** 2
+
+
+def is_convex_quad(corners):
+    """
+    True if the four corners, in click order, form a convex quadrilateral of
+    at least MIN_CALIBRATION_AREA. Repeated or collinear corners have no
+    usable mapping and corners clicked out of order cross into a bow-tie.
+    """
+    if len(corners) != 4:
+        return False
+    turns = []
+    area = 0.0
+    for index, (x, y) in enumerate(corners):
+        next_x, next_y = corners[(index + 1) % 4]
+        after_x, after_y = corners[(index + 2) % 4]
+        turns.append((next_x - x) * (after_y - next_y) - (next_y - y) * (after_x - next_x))
+        area += x * next_y - next_x * y
+    # Every turn the same way, either way round since a mirror may flip the image
+    convex = all(turn > 0 for turn in turns) or all(turn < 0 for turn in turns)
+    return convex and abs(area) / 2 >= MIN_CALIBRATION_AREA
+
+
+class BoardPose:
+    """
+    Where the uncalibrated board sits on the canvas: the outline center, its
+    size in pixels along the board width and length, and a clockwise turn in
+    degrees. Moving, resizing and rotating only change these numbers; the
+    outline and the components are projected from board mm through matrix()
+    every time, so nothing drifts however often the board is turned.
+    """
+
+    def __init__(self, center_x, center_y, width, length, rotation=0.0):
+        self.center_x = float(center_x)
+        self.center_y = float(center_y)
+        self.width = float(width)
+        self.length = float(length)
+        self.rotation = float(rotation) % 360
+
+    @classmethod
+    def from_outline(cls, outline, rotation=0.0):
+        # An axis aligned (x1, y1, x2, y2) outline of the unturned board
+        x1, y1, x2, y2 = outline
+        return cls((x1 + x2) / 2, (y1 + y2) / 2, x2 - x1, y2 - y1, rotation)
+
+    def frame_matrix(self):
+        # Outline pixels relative to its center (Y down) to canvas pixels
+        return translation_matrix(self.center_x, self.center_y) @ rotation_matrix(self.rotation)
+
+    def matrix(self, board_width, board_length, mirror=False):
+        """
+        Board mm (origin bottom-left, Y up) to canvas pixels for a board of
+        board_width x board_length mm stretched over the outline.
+        """
+        to_frame = (translation_matrix(-self.width / 2, self.length / 2)
+                    @ scale_matrix(self.width / board_width, -self.length / board_length))
+        if mirror:
+            to_frame = to_frame @ mirror_matrix(board_width)
+        return self.frame_matrix() @ to_frame
+
+    @property
+    def corners(self):
+        # Canvas corners in CORNER_NAMES order
+        half_width, half_length = self.width / 2, self.length / 2
+        local = [(-half_width, half_length), (half_width, half_length),
+                 (half_width, -half_length), (-half_width, -half_length)]
+        return [tuple(corner) for corner in transform_points(self.frame_matrix(), local).tolist()]
+
+    def translate(self, dx, dy):
+        self.center_x += dx
+        self.center_y += dy
+
+    def rotate(self, angle):
+        # About the outline center, which stays put
+        self.rotation = (self.rotation + angle) % 360
+
+    def resize_corner(self, index, dx, dy):
+        """
+        Drag corner index by (dx, dy) with the opposite corner held in place.
+        Returns False, leaving the pose unchanged, if the outline would get
+        smaller than MIN_OUTLINE_SIZE.
+        """
+        corners = self.corners
+        x, y = corners[index]
+        x, y = x + dx, y + dy
+        fixed_x, fixed_y = corners[(index + 2) % 4]
+
+        # The diagonal in outline axes, the sign tells which side of the fixed corner it is on
+        diagonal_x, diagonal_y = transform_points(rotation_matrix(-self.rotation), [x - fixed_x, y - fixed_y]).tolist()
+        local_x, local_y = [(-1, 1), (1, 1), (1, -1), (-1, -1)][index]
+        width, length = diagonal_x * local_x, diagonal_y * local_y
+        if width < MIN_OUTLINE_SIZE or length < MIN_OUTLINE_SIZE:
+            return False
+
+        self.width, self.length = width, length
+        self.center_x, self.center_y = (x + fixed_x) / 2, (y + fixed_y) / 2
+        return True
+
+    def bounding_box(self):
+        xs = [x for x, _ in self.corners]
+        ys = [y for _, y in self.corners]
+        return [min(xs), min(ys), max(xs), max(ys)]
+
+
+class Calibration:
+    """
+    Four-point projective mapping from board mm to canvas pixels.
+    Corrects keystone distortion from a projector mounted at an angle.
+    """
+
+    def __init__(self, board_width, board_length, corners):
+        self.board_width = board_width
+        self.board_length = board_length
+        self.corners = [(float(x), float(y)) for x, y in corners]
+        self._matrix = None
+
+    @property
+    def board_corners(self):
+        return [(0.0, 0.0), (self.board_width, 0.0), (self.board_width, self.board_length), (0.0, self.board_length)]
+
+    @property
+    def matrix(self):
+        # Solved lazily and cached until a corner changes
+        if self._matrix is None:
+            self._matrix = solve_homography(self.board_corners, self.corners)
+        return self._matrix
+
+    @property
+    def key(self):
+        return calibration_key(self.board_width, self.board_length)
+
+    @property
+    def usable(self):
+        # Convex corners and a homography that solves
+        if not is_convex_quad(self.corners):
+            return False
+        try:
+            self.matrix
+        except np.linalg.LinAlgError:
+            return False
+        return True
+
+    def moved_corners(self, index, x, y):
+        # The corners as they would be after move_corner
+        corners = list(self.corners)
+        corners[index] = (float(x), float(y))
+        return corners
+
+    def move_corner(self, index, x, y):
+        self.corners[index] = (float(x), float(y))
+        self._matrix = None
+
+    def translate(self, dx, dy):
+        self.corners = [(x + dx, y + dy) for x, y in self.corners]
+        self._matrix = None
+
+    def bounding_box(self):
+        xs = [x for x, _ in self.corners]
+        ys = [y for _, y in self.corners]
+        return [min(xs), min(ys), max(xs), max(ys)]
+
+    def project(self, points):
+        return transform_points(self.matrix, points)
+
+    def to_dict(self):
+        return {"board_width": self.board_width, "board_length": self.board_length, "corners": self.corners}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["board_width"], data["board_length"], data["corners"])
+
+
+def calibration_key(board_width, board_length):
+    return f"{board_width:g}x{board_length:g}"
+
+
+def load_calibrations(path):
+    """
+    Read saved calibrations, keyed by board size.
+    """
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return {key: Calibration.from_dict(value) for key, value in data.items()}
+
+
+def save_calibrations(path, calibrations):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({key: calibration.to_dict() for key, calibration in calibrations.items()}, f, indent=2)
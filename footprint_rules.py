@@ -0,0 +1,204 @@
+import csv
+import re
+
+from footprints import normalize_footprint_name
+from readpickandplace import detect_encoding
+
+# Imperial chip codes to body length x width in mm
+IMPERIAL_CHIP_SIZES = {
+    "01005": (0.4, 0.2),
+    "0201": (0.6, 0.3),
+    "0402": (1.0, 0.5),
+    "0603": (1.6, 0.8),
+    "0805": (2.0, 1.25),
+    "1206": (3.2, 1.6),
+    "1210": (3.2, 2.5),
+    "1806": (4.5, 1.6),
+    "1812": (4.5, 3.2),
+    "2010": (5.0, 2.5),
+    "2220": (5.7, 5.0),
+    "2512": (6.4, 3.2),
+}
+
+# Metric chip codes to the imperial code of the same size, e.g. 2012 is 0805
+METRIC_CHIP_CODES = {
+    "0402": "01005",
+    "0603": "0201",
+    "1005": "0402",
+    "1608": "0603",
+    "2012": "0805",
+    "3216": "1206",
+    "3225": "1210",
+    "4516": "1806",
+    "4532": "1812",
+    "5025": "2010",
+    "5750": "2220",
+    "6332": "2512",
+}
+
+# Common packages to outline width x height in mm at 0 degrees, leads included.
+# Keys are normalized names and have to line up with whole words of a footprint
+# name, so "sma" matches "Diode_SMA" but not "Smart"; the longest key wins.
+PACKAGE_SIZES = {
+    "sot23": ("rectangle", 2.9, 2.4),
+    "sot235": ("rectangle", 2.9, 2.8),
+    "sot236": ("rectangle", 2.9, 2.8),
+    "sot223": ("rectangle", 6.5, 7.0),
+    "sot89": ("rectangle", 4.5, 4.1),
+    "sot323": ("rectangle", 2.0, 2.1),
+    "sot363": ("rectangle", 2.0, 2.1),
+    "sod123": ("rectangle", 3.7, 1.6),
+    "sod323": ("rectangle", 2.5, 1.3),
+    "sod523": ("rectangle", 1.6, 0.8),
+    "sma": ("rectangle", 5.2, 2.6),
+    "smb": ("rectangle", 5.4, 3.6),
+    "smc": ("rectangle", 7.9, 5.9),
+    "to252": ("rectangle", 6.6, 10.0),
+    "to263": ("rectangle", 10.2, 15.0),
+    "dpak": ("rectangle", 6.6, 10.0),
+    "d2pak": ("rectangle", 10.2, 15.0),
+    "soic8": ("rectangle", 3.9, 6.0),
+    "soic14": ("rectangle", 8.7, 6.0),
+    "soic16": ("rectangle", 9.9, 6.0),
+    "msop8": ("rectangle", 3.0, 4.9),
+    "sop8": ("rectangle", 3.9, 6.0),
+}
+
+# "..._3.9x4.9mm" style sizes, and "D5.0mm" style diameters for round parts.
+# KiCad's "Pad1.20x1.40mm" and "EP3.45x3.45mm" are pad sizes, not the body
+_EXPLICIT_SIZE = re.compile(r'(?<![\d.])(?<!pad)(?<!ep)(\d+(?:\.\d+)?)\s*x\s*(\d+(?:\.\d+)?)\s*mm', re.IGNORECASE)
+_DIAMETER = re.compile(r'(?:^|[_\s,-])D(\d+(?:\.\d+)?)\s*mm', re.IGNORECASE)
+_METRIC_CODE = re.compile(r'(\d{4})[_\s]*Metric', re.IGNORECASE)
+_IMPERIAL_CODE = re.compile(r'(?<!\d)(01005|\d{4})(?!\d)')
+_WORD = re.compile(r'[a-z]+|\d+')
+
+# Designator-style words that make a bare four digit number a chip code, e.g. "Resistor 0603"
+_CHIP_WORDS = ("capacitor", "resistor", "inductor", "led", "ferrite", "fuse", "diode")
+
+
+def find_package(name, packages):
+    """
+    Return the longest key of packages that spans whole words of name, or None.
+    """
+    words = _WORD.findall(name.lower())
+    best = None
+    for start in range(len(words)):
+        joined = ""
+        for word in words[start:]:
+            joined += word
+            if joined in packages and (best is None or len(joined) > len(best)):
+                best = joined
+    return best
+
+
+def _footprint(shape, width, height):
+    return {'Shape': shape, 'Width': float(width), 'Height': float(height), 'CenterX': 0.0, 'CenterY': 0.0}
+
+
+def size_from_name(name):
+    """
+    Derive an outline from the sizes written in a footprint name.
+    Returns (footprint data, rule name) or None.
+    """
+    match = _DIAMETER.search(name)
+    if match:
+        diameter = float(match.group(1))
+        return _footprint('circle', diameter, diameter), "diameter"
+
+    # "(1608 Metric)" is 1.6 x 0.8 mm
+    match = _METRIC_CODE.search(name)
+    if match:
+        code = match.group(1)
+        if code in METRIC_CHIP_CODES:
+            return _footprint('rectangle', *IMPERIAL_CHIP_SIZES[METRIC_CHIP_CODES[code]]), "metric chip"
+        return _footprint('rectangle', int(code[:2]) / 10, int(code[2:]) / 10), "metric chip"
+
+    # Whole words only, "led" must not match "angled" or "labeled"
+    words = set(_WORD.findall(name.lower()))
+    if "imperial" in words or any(word in words for word in _CHIP_WORDS):
+        for code in _IMPERIAL_CODE.findall(name):
+            if code in IMPERIAL_CHIP_SIZES:
+                return _footprint('rectangle', *IMPERIAL_CHIP_SIZES[code]), "imperial chip"
+
+    match = _EXPLICIT_SIZE.search(name)
+    if match:
+        return _footprint('rectangle', match.group(1), match.group(2)), "size"
+
+    package = find_package(name, PACKAGE_SIZES)
+    if package is not None:
+        return _footprint(*PACKAGE_SIZES[package]), "package"
+    return None
+
+
+class PackageTable:
+    """
+    Package dimensions imported from a local CSV with Package, Shape, Width
+    and Height columns (CenterX and CenterY optional). A footprint takes the
+    row with the longest package name found in it, see find_package().
+    """
+
+    def __init__(self, packages=None):
+        self.packages = packages if packages is not None else {}
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            data = f.read()
+        table = cls()
+        for row in csv.DictReader(data.decode(detect_encoding(data), errors='replace').splitlines()):
+            name = (row.get('Package') or row.get('Name') or '').strip()
+            key = normalize_footprint_name(name)
+            if not key:
+                continue
+            try:
+                width = float(row['Width'])
+                table.packages[key] = {
+                    'Shape': (row.get('Shape') or 'rectangle').strip().lower(),
+                    'Width': width,
+                    'Height': float(row.get('Height') or width),
+                    'CenterX': float(row.get('CenterX') or 0.0),
+                    'CenterY': float(row.get('CenterY') or 0.0)
+                }
+            except (KeyError, ValueError):
+                continue
+        return table
+
+    def __len__(self):
+        return len(self.packages)
+
+    def lookup(self, name):
+        package = find_package(name, self.packages)
+        return dict(self.packages[package]) if package is not None else None
+
+
+def resolve_footprint(name, table=None):
+    """
+    Outline for a footprint name from the imported table first, then the
+    built-in rules. Returns (footprint data, rule name) or None.
+    """
+    if table is not None:
+        footprint = table.lookup(name)
+        if footprint is not None:
+            return footprint, "table"
+    return size_from_name(name)
+
+
+def fill_footprints(library, names, table=None):
+    """
+    Add every name missing from the library that the rules can resolve, in one pass.
+    Returns the names filled and the names still unknown.
+    """
+    filled = []
+    unknown = []
+    for name in names:
+        if name in library:
+            continue
+        resolved = resolve_footprint(name, table)
+        if resolved is None:
+            unknown.append(name)
+            continue
+        footprint, _ = resolved
+        library.set(name, footprint['Shape'], footprint['Width'], footprint['Height'],
+                    footprint['CenterX'], footprint['CenterY'])
+        filled.append(name)
+    return filled, unknown
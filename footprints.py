@@ -0,0 +1,203 @@
+import csv
+import logging
+import os
+import re
+from collections import defaultdict
+
+from readpickandplace import detect_encoding
+
+logger = logging.getLogger(__name__)
+
+_NON_ALPHANUMERIC = re.compile(r'[^a-zA-Z0-9]')
+
+# Length of the substrings indexed for substring lookups
+NGRAM_SIZE = 3
+
+FOOTPRINT_HEADER = ["Name", "Shape", "Width", "Height", "CenterX", "CenterY"]
+
+
+def normalize_footprint_name(name):
+    """
+    Lowercase a footprint name and strip everything but letters and digits.
+    """
+    return _NON_ALPHANUMERIC.sub('', name.lower())
+
+
+def _ngrams(text):
+    return {text[i:i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)}
+
+
+class FootprintMatcher:
+    """
+    Resolve component footprint strings against the footprint library.
+
+    When several library entries fit, the winner is chosen in this order:
+      1. a library name whose normalized form equals the component's
+      2. the shortest library name containing the component's normalized name
+    Ties go to the entry listed first in footprints.csv. Results are memoized
+    per distinct footprint string.
+    """
+
+    def __init__(self, footprints):
+        self.footprints = footprints
+        self._names = []
+        self._exact = {}
+        self._index = defaultdict(set)
+        self._cache = {}
+
+        for position, name in enumerate(footprints):
+            normalized = normalize_footprint_name(name)
+            self._names.append((normalized, name))
+            self._exact.setdefault(normalized, name)
+            for gram in _ngrams(normalized):
+                self._index[gram].add(position)
+
+    def match_name(self, footprint_name):
+        """
+        Return the library name matching footprint_name, or None.
+        """
+        try:
+            return self._cache[footprint_name]
+        except KeyError:
+            pass
+        name = self._resolve(normalize_footprint_name(footprint_name))
+        self._cache[footprint_name] = name
+        return name
+
+    def match(self, footprint_name):
+        """
+        Return the library data matching footprint_name, or None.
+        """
+        name = self.match_name(footprint_name)
+        return self.footprints[name] if name is not None else None
+
+    def _resolve(self, normalized):
+        if not normalized:
+            return None
+
+        name = self._exact.get(normalized)
+        if name is not None:
+            return name
+
+        if len(normalized) < NGRAM_SIZE:
+            candidates = range(len(self._names))
+        else:
+            # Only entries sharing every n-gram of the query can contain it
+            postings = sorted((self._index.get(gram, set()) for gram in _ngrams(normalized)), key=len)
+            candidates = set.intersection(*postings) if postings[0] else ()
+
+        best = None
+        for position in candidates:
+            library_name = self._names[position][0]
+            if normalized in library_name:
+                key = (len(library_name), position)
+                if best is None or key < best:
+                    best = key
+        return self._names[best[1]][1] if best is not None else None
+
+
+class FootprintLibrary:
+    """
+    footprints.csv held in memory as one entry per footprint name.
+
+    The file is read once; when a name appears on several rows the last one
+    wins, as it did with the old append-only file. Edits only change the
+    dictionary and mark the library dirty, save() then rewrites the file
+    with one row per name through a temporary file and a rename, which also
+    drops the stale duplicate rows.
+    """
+
+    def __init__(self, path, footprints=None):
+        self.path = path
+        self.footprints = footprints if footprints is not None else {}
+        self.mtime = None
+        self.dirty = False
+        self.version = 0  # Bumped on every change, for anything derived from the library
+        self._matcher = None
+
+    @classmethod
+    def load(cls, path):
+        library = cls(path)
+        if not path or not os.path.exists(path):
+            return library
+
+        with open(path, 'rb') as f:
+            data = f.read()
+        rows = 0
+        for row in csv.reader(data.decode(detect_encoding(data), errors='replace').splitlines()):
+            if not row or row == FOOTPRINT_HEADER:
+                continue
+            if len(row) < 6:
+                logger.warning("Invalid footprint row format: %s", row)
+                continue
+            try:
+                library.footprints[row[0]] = {
+                    'Shape': row[1].lower(),
+                    'Width': float(row[2]),
+                    'Height': float(row[3]),
+                    'CenterX': float(row[4]),
+                    'CenterY': float(row[5])
+                }
+                rows += 1
+            except ValueError:
+                logger.warning("Invalid footprint dimensions: %s", row)
+
+        library.mtime = os.path.getmtime(path)
+        # Stale duplicates are compacted away by the next save
+        if rows > len(library.footprints):
+            logger.info("%d duplicate footprint rows in %s", rows - len(library.footprints), path)
+            library.dirty = True
+        return library
+
+    def __len__(self):
+        return len(self.footprints)
+
+    def __contains__(self, name):
+        return name in self.footprints
+
+    def get(self, name):
+        return self.footprints.get(name)
+
+    def set(self, name, shape, width, height, center_x=0.0, center_y=0.0):
+        self.footprints[name] = {
+            'Shape': shape.lower(),
+            'Width': float(width),
+            'Height': float(height),
+            'CenterX': float(center_x),
+            'CenterY': float(center_y)
+        }
+        self.dirty = True
+        self.version += 1
+        self._matcher = None
+
+    @property
+    def matcher(self):
+        if self._matcher is None:
+            self._matcher = FootprintMatcher(self.footprints)
+        return self._matcher
+
+    def is_stale(self):
+        """
+        True when footprints.csv was changed by something else since it was loaded or saved.
+        """
+        try:
+            return os.path.getmtime(self.path) != self.mtime
+        except (OSError, TypeError):
+            return False
+
+    def save(self):
+        """
+        Write the library if it has unsaved changes, replacing the file atomically.
+        """
+        if not self.dirty:
+            return False
+        temp_path = self.path + ".tmp"
+        with open(temp_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(FOOTPRINT_HEADER)
+            for name, data in self.footprints.items():
+                writer.writerow([name, data['Shape'], data['Width'], data['Height'], data['CenterX'], data['CenterY']])
+        os.replace(temp_path, self.path)
+        self.mtime = os.path.getmtime(self.path)
+        self.dirty = False
+        return True
@@ -0,0 +1,130 @@
+import logging
+import queue
+import threading
+from collections import OrderedDict
+
+from PIL import Image, ImageDraw, ImageFont
+
+logger = logging.getLogger(__name__)
+
+# Rendered pages kept per view, the current page and its neighbours fit easily
+DEFAULT_MAX_FRAMES = 8
+
+
+def render_frame(width, height, shapes, labels, fill=False, outline="red", line_width=2):
+    """
+    Draw one page into a transparent width x height RGBA image.
+    shapes holds (is_circle, canvas coords) pairs, labels (x, y, text, angle) tuples.
+    """
+    frame = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(frame)
+    fill_color = "white" if fill else None
+
+    for is_circle, coords in shapes:
+        if is_circle:
+            x1, y1, x2, y2 = coords
+            draw.ellipse((min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2)),
+                         fill=fill_color, outline=outline, width=line_width)
+        else:
+            points = list(zip(coords[::2], coords[1::2]))
+            if fill_color:
+                draw.polygon(points, fill=fill_color)
+            draw.line(points + points[:1], fill=outline, width=line_width, joint="curve")
+
+    font = ImageFont.load_default()
+    for x, y, text, angle in labels:
+        left, top, right, bottom = draw.textbbox((0, 0), text, font=font)
+        label = Image.new("RGBA", (right - left + 2, bottom - top + 2), (0, 0, 0, 0))
+        ImageDraw.Draw(label).text((1 - left, 1 - top), text, font=font, fill="white")
+        # PIL and Tk both turn text anticlockwise
+        label = label.rotate(angle, expand=True)
+        frame.paste(label, (int(round(x - label.width / 2)), int(round(y - label.height / 2))), label)
+
+    return frame
+
+
+class FrameCache:
+    """
+    LRU cache of pre-rendered page frames, filled by a background thread.
+
+    Frames are only valid for one view (board transform, canvas size and
+    display options). set_view() drops every frame when the view changes.
+    The worker only draws PIL images; convert() in collect() runs on the
+    caller's thread so Tk images are never touched from the worker.
+    """
+
+    def __init__(self, max_frames=DEFAULT_MAX_FRAMES):
+        self.max_frames = max_frames
+        self.view = None
+        self._frames = OrderedDict()
+        self._pending = set()
+        self._jobs = queue.Queue()
+        self._results = queue.Queue()
+        self._worker = None
+
+    def set_view(self, view):
+        if view != self.view:
+            self.view = view
+            self._frames.clear()
+            self._pending.clear()
+
+    def get(self, page):
+        frame = self._frames.get(page)
+        if frame is not None:
+            self._frames.move_to_end(page)
+        return frame
+
+    def __contains__(self, page):
+        return page in self._frames
+
+    @property
+    def pending(self):
+        return bool(self._pending)
+
+    def request(self, page, make_job):
+        """
+        Queue page for rendering unless it is cached or queued already.
+        make_job() returns the render_frame arguments and is only called when needed.
+        """
+        if page in self._frames or page in self._pending:
+            return
+        self._pending.add(page)
+        self._jobs.put((self.view, page, make_job()))
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._run, daemon=True)
+            self._worker.start()
+
+    def collect(self, convert):
+        """
+        Store finished frames for the current view through convert(image).
+        Returns the pages added.
+        """
+        added = []
+        while True:
+            try:
+                view, page, image = self._results.get_nowait()
+            except queue.Empty:
+                break
+            if view != self.view:
+                continue
+            self._pending.discard(page)
+            if image is None:
+                continue
+            self._frames[page] = convert(image)
+            self._frames.move_to_end(page)
+            added.append(page)
+            while len(self._frames) > self.max_frames:
+                self._frames.popitem(last=False)
+        return added
+
+    def _run(self):
+        while True:
+            view, page, job = self._jobs.get()
+            image = None
+            # Jobs queued for a view that has since changed are dropped unrendered
+            if view == self.view:
+                try:
+                    image = render_frame(**job)
+                except Exception:
+                    logger.exception("Failed to render page %s", page)
+            self._results.put((view, page, image))
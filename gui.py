@@ -1,12 +1,83 @@
 import tkinter as tk
 from tkinter import messagebox, simpledialog, ttk, filedialog
-import subprocess
-import csv
+import copy
+import logging
 import os
+import queue
+import threading
+from collections import OrderedDict
 from PIL import Image, ImageDraw, ImageTk
-import re
-import math
-from pcb_utils import calculate_scale_factor, scale_component_position, get_pcb_dimensions
+import numpy as np
+from pcb_utils import bounding_boxes, mirror_matrix, transform_points, translation_matrix, upright_text_angle
+from panel import Panel
+from scene import ComponentScene
+from sequence import plan_pages
+from readpickandplace import BOTTOM_LAYER, LAYERS, TOP_LAYER, write_pcb_data
+from board import Board, Placement
+from bom import Bom, cross_check, format_report
+from project_cache import CACHE_FILE, layer_cache_path, load_project_cache, save_project_cache, sources_signature
+from footprints import FootprintLibrary
+from footprint_rules import PackageTable, fill_footprints
+from frames import FrameCache
+from jobs import JOBS_FILE, Job, JobManager
+from metrics import Metrics, TkCallCounter
+from watcher import FileWatcher
+from render import DEFAULT_FRAME_RATE, LOD_DOT, LOD_FULL, RenderScheduler, level_of_detail
+from calibration import (CORNER_NAMES, BoardPose, Calibration, calibration_key, is_convex_quad, load_calibrations,
+                         save_calibrations)
+
+logger = logging.getLogger(__name__)
+
+# Footprint edits are written to footprints.csv this long after the last one
+FOOTPRINT_SAVE_DELAY_MS = 1000
+
+# How often changes found by the file watcher are picked up on the Tk thread
+WATCH_POLL_MS = 500
+
+# Parsed and matched state of one board side, the sides not shown are kept in side_models
+SIDE_DEFAULTS = {
+    "board": None,
+    "placement": None,
+    "placement_signature": None,
+    "placement_library_version": None,
+    "component_scene": None,
+    "_scene_key": None,
+    "label_rotations": frozenset(),
+}
+
+# Parsed and matched state of a job, cached by the JobManager while another job is active
+JOB_MODEL_DEFAULTS = {
+    "side": TOP_LAYER,
+    "side_models": {},
+    "board": None,
+    "footprint_library": None,
+    "placement": None,
+    "placement_signature": None,
+    "placement_library_version": None,
+    "component_scene": None,
+    "_scene_key": None,
+    "bom": None,
+    "bom_data": (),
+    "bom_pages": (),
+    "total_pages": 0,
+    "_bom_report_key": None,
+    "page_order": [],
+    "page_paths": [],
+    "_sequence_key": None,
+}
+
+# Outline, panel, calibration and page of a job, small enough to keep for every job
+JOB_VIEW_DEFAULTS = {
+    "original_pcb_width": None,
+    "original_pcb_length": None,
+    "pcb_width": None,
+    "pcb_length": None,
+    "board_pose": None,
+    "panel": None,
+    "calibration": None,
+    "pcb_outline": None,
+    "current_page": 0,
+}
 
 class FootprintDialog(tk.Toplevel):
     def __init__(self, parent, footprint, is_new=True):
@@ -116,8 +187,66 @@ class PCBOutlineDialog(tk.Toplevel):
     def cancel(self):
         self.destroy()
 
+class PanelDialog(tk.Toplevel):
+    def __init__(self, parent, panel=None):
+        super().__init__(parent)
+        self.title("Panel")
+        self.result = None
+
+        fields = [
+            ("Rows:", str(panel.rows) if panel else "1"),
+            ("Columns:", str(panel.columns) if panel else "1"),
+            ("Pitch X (mm):", f"{panel.pitch_x:g}" if panel else "0"),
+            ("Pitch Y (mm):", f"{panel.pitch_y:g}" if panel else "0"),
+            ("Copy rotations:", ", ".join(f"{r:g}" for r in panel.rotations) if panel else ""),
+            ("Skip copies:", ", ".join(str(c + 1) for c in sorted(panel.skip)) if panel else ""),
+        ]
+        self.entries = []
+        for row, (label, value) in enumerate(fields):
+            tk.Label(self, text=label).grid(row=row, column=0, padx=5, pady=5, sticky="w")
+            entry = tk.Entry(self)
+            entry.insert(0, value)
+            entry.grid(row=row, column=1, padx=5, pady=5)
+            self.entries.append(entry)
+
+        tk.Button(self, text="OK", command=self.ok).grid(row=len(fields), column=0, padx=5, pady=5)
+        tk.Button(self, text="Cancel", command=self.cancel).grid(row=len(fields), column=1, padx=5, pady=5)
+
+    def ok(self):
+        try:
+            rows, columns = int(self.entries[0].get()), int(self.entries[1].get())
+            pitch_x, pitch_y = float(self.entries[2].get()), float(self.entries[3].get())
+            rotations = [float(value) for value in self.entries[4].get().split(",") if value.strip()]
+            # Copies are entered 1-based, counted row by row from the bottom-left board
+            skip = {int(value) - 1 for value in self.entries[5].get().split(",") if value.strip()}
+            if rows < 1 or columns < 1:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Error", "Please enter valid panel values.")
+            return
+
+        count = rows * columns
+        outside = sorted(copy + 1 for copy in skip if not 0 <= copy < count)
+        if outside:
+            messagebox.showerror("Error", f"Skipped copies must be between 1 and {count}, not "
+                                          f"{', '.join(str(copy) for copy in outside)}.")
+            return
+        if len(skip) >= count:
+            messagebox.showerror("Error", "Every copy is skipped, leave at least one board.")
+            return
+        self.result = Panel(rows, columns, pitch_x, pitch_y, rotations, skip)
+        self.destroy()
+
+    def cancel(self):
+        self.destroy()
+
 class ProjectionGUI(tk.Tk):
-    def __init__(self):
+    # Reopen the job that was active last time, subclasses with their own paths turn this off
+    restore_active_job = True
+    # Count the canvas Tk calls in the metrics, a proxy and a lock on every call so only when measuring
+    count_tk_calls = False
+
+    def __init__(self, frame_rate=DEFAULT_FRAME_RATE):
         super().__init__()
         
         self.title("Projection GUI")
@@ -126,14 +255,30 @@ class ProjectionGUI(tk.Tk):
         
         # Set file paths first
         self.set_file_paths()
+
+        # Board variants on the bench, the active one's paths replace the defaults unless restore_active_job is off
+        self.init_jobs()
         
+        # Stage timings and counters, shown by the Metrics button
+        self.metrics = Metrics()
+
         self.canvas = tk.Canvas(self, bg="black", highlightthickness=0)
+        if self.count_tk_calls or logger.isEnabledFor(logging.DEBUG):
+            self.canvas.tk = TkCallCounter(self.canvas.tk, self.metrics)
         self.canvas.pack(fill=tk.BOTH, expand=True)
+
+        # Drag handlers only record state, the scheduler redraws at most once per frame
+        self.render_scheduler = RenderScheduler(self, frame_rate)
         
         # Initialize variables
         self.fill_var = tk.BooleanVar(value=False)
         self.names_var = tk.BooleanVar(value=True)
         self.shapes_var = tk.BooleanVar(value=True)
+        self.write_pcbdata_var = tk.BooleanVar(value=False)
+        self.prerender_var = tk.BooleanVar(value=True)
+        self.watch_var = tk.BooleanVar(value=True)
+        self.rotation_step_var = tk.StringVar(value="90")
+        self.optimize_var = tk.BooleanVar(value=True)
         
         # Initialize other attributes
         self.pcb_rect = None
@@ -143,30 +288,89 @@ class ProjectionGUI(tk.Tk):
         self.pcb_length = None
         self.original_pcb_width = None
         self.original_pcb_length = None
+        self.board_pose = None  # Outline center, size and rotation, the uncalibrated board transform
+        self.panel = None  # Step-and-repeat layout, the outline covers the whole panel when set
+        self.components_transform = None  # Board-to-canvas matrix the components were drawn with
+        self.calibration = None  # Four-point projective calibration, replaces the outline when set
+        self._calibration_clicks = None
         
         # Initialize BOM-related variables
         self.current_page = 0
         self.total_pages = 0
+        self.bom = None  # Decoded BOM with its designator index
         self.bom_data = []
+        self.bom_pages = []  # Designators of each BOM line, resolved once at load
+        self._bom_report_key = None  # BOM and board the cross-check was last shown for
+        self.label_rotations = set()  # Distinct component rotations, one rotation_* tag each
+        self.shown_page = None  # Page currently applied to the canvas items
         self.all_components = {}  # Dictionary to store all components
+        self.selected_component = None  # all_components key picked by clicking on the canvas
+
+        # Board model shared by every action, parsed in-process by load_pcb
+        self.board = None
+        self.side = TOP_LAYER  # Side shown, the bottom is drawn mirrored
+        self.side_models = {}  # SIDE_DEFAULTS state of the side not shown, by layer
+        self.footprint_library = None  # footprints.csv in memory, written back by save_footprint
+        self.package_table = None  # package dimensions imported for auto-fill
+        self._footprint_save_id = None
+        self.placement = None  # Drawable components with model-space outlines
+        self.placement_signature = None  # Source sizes/mtimes the placement was built from
+        self.placement_library_version = None  # Footprint library edits the placement includes
+        self.component_scene = None  # Every component copy in board mm, with its hit-testing index
+        self._scene_key = None
+        self.component_page_tags = {}  # page_* tags of each designator
+        self.page_order = []  # BOM line index shown on each page, reordered by Optimize Order
+        self.page_paths = []  # Scene entries of each page in visiting order, empty in BOM order
+        self._sequence_key = None
+        self._route_entries = None  # Path the numbered markers are drawn for
+        self._route_items = []  # (marker, number) canvas items along that path
+        self._route_transform = None  # Board-to-canvas matrix the markers were drawn with
+        self._drawn = {}  # Scene entry -> (level of detail, canvas items) for what is on screen
+        # Canvas items are never deleted while placing: the previous placement's items are
+        # reused by key, items no longer needed are hidden and parked for other parts
+        self._reusable = {}  # key -> items of the previous placement, until this one claims them
+        self._item_pool = {}  # (shape kind, has label) -> OrderedDict of key -> parked items
+        self._item_kinds = {}  # shape item -> (shape kind, has label)
+        self._item_options = {}  # canvas item -> tags and angle it was last configured with
+        self._components_version = 0  # Bumped whenever place_components redraws from scratch
+
+        # BOM pages pre-rendered off-screen, a page flip swaps the one image item
+        self.frame_cache = FrameCache()
+        self.frame_item = None
+        self._frame_shown = False
+        self._frames_polling = False
+        self._load_thread = None
+        self._load_queue = queue.Queue()
+
+        # Pick and place, BOM and footprints edited on disk are applied without a reload
+        self.file_watcher = FileWatcher()
 
         # Create toolbars first
         self.create_main_toolbar()
         self.create_secondary_toolbar()
 
-        # Now load BOM data
-        self.load_bom_data()
+        # Reopen an unchanged job straight from the project cache, otherwise load BOM data
+        if not self.load_project_cache():
+            self.load_bom_data()
         
         # Bind events
         self.canvas.bind("<Motion>", self.update_coordinates)
+        self.canvas.bind("<ButtonPress-1>", self.on_canvas_click)
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
         self.bind("<Configure>", self.on_window_resize)
         
         # Create coordinate labels
         self.create_coordinate_labels()
+
+        self.watch_sources()
+        self.after(WATCH_POLL_MS, self._poll_file_changes)
         
     def create_coordinate_labels(self):
         self.coord_frame = tk.Frame(self.canvas, bg="black")
         self.coord_frame.place(relx=1, rely=1, anchor="se", x=-10, y=-10)
+
+        self.hover_label = tk.Label(self.coord_frame, text="", fg="yellow", bg="black")
+        self.hover_label.pack(side=tk.LEFT, padx=(0, 10))
         
         self.x_coord_label = tk.Label(self.coord_frame, text="X: 0.00 mm", fg="white", bg="black")
         self.x_coord_label.pack(side=tk.LEFT, padx=(0, 5))
@@ -179,37 +383,219 @@ class ProjectionGUI(tk.Tk):
         current_dir = os.path.dirname(os.path.abspath(__file__))
         
         # Set default paths
+        self.inputdata_path = os.path.join(current_dir, "inputdata.csv")
         self.pcbdata_path = os.path.join(current_dir, "pcbdata.csv")
         self.footprints_path = os.path.join(current_dir, "footprints.csv")
+        self.calibration_path = os.path.join(current_dir, "calibration.json")
+        self.bom_path = os.path.join(current_dir, "BOM.csv")
+        self.project_cache_path = os.path.join(current_dir, CACHE_FILE)
+        self.metrics_path = os.path.join(current_dir, "metrics.json")
+        self.jobs_path = os.path.join(current_dir, JOBS_FILE)
         
         # Check if files exist, if not, prompt user to select them
-        if not os.path.exists(self.pcbdata_path):
-            messagebox.showwarning("File Not Found", "pcbdata.csv not found in the script directory.")
-            self.pcbdata_path = filedialog.askopenfilename(title="Select pcbdata.csv", filetypes=[("CSV files", "*.csv")])
+        # pcbdata.csv is optional now that the pick and place is parsed in-process
+        if not os.path.exists(self.inputdata_path) and not os.path.exists(self.pcbdata_path):
+            messagebox.showwarning("File Not Found", "inputdata.csv not found in the script directory.")
+            self.inputdata_path = filedialog.askopenfilename(title="Select inputdata.csv", filetypes=[("CSV files", "*.csv")])
+            if self.inputdata_path:
+                job_dir = os.path.dirname(self.inputdata_path)
+                self.pcbdata_path = os.path.join(job_dir, "pcbdata.csv")
+                self.bom_path = os.path.join(job_dir, "BOM.csv")
+                self.project_cache_path = os.path.join(job_dir, CACHE_FILE)
+                self.metrics_path = os.path.join(job_dir, "metrics.json")
         
         if not os.path.exists(self.footprints_path):
             messagebox.showwarning("File Not Found", "footprints.csv not found in the script directory.")
             self.footprints_path = filedialog.askopenfilename(title="Select footprints.csv", filetypes=[("CSV files", "*.csv")])
 
 
+    def init_jobs(self):
+        self.jobs = JobManager.load(self.jobs_path)
+
+        job = self.jobs.get(self.jobs.active) if self.restore_active_job else None
+        if job is not None and os.path.exists(job.inputdata_path):
+            for name, path in job.paths.items():
+                setattr(self, name, path)
+        else:
+            job = self.job_for_paths()
+            self.jobs.activate(job.name)
+        self.title(f"Projection GUI - {job.name}")
+
+    def job_for_paths(self):
+        # The job whose pick and place is the current input, registered if it is new
+        for job in self.jobs.jobs.values():
+            if job.inputdata_path == os.path.abspath(self.inputdata_path):
+                return job
+        name = self.jobs.unique_name(os.path.basename(os.path.dirname(os.path.abspath(self.inputdata_path))))
+        return self.jobs.add(Job(name, self.inputdata_path, self.footprints_path))
+
+    def save_jobs(self):
+        try:
+            self.jobs.save(self.jobs_path)
+        except OSError as e:
+            logger.warning("Could not write job list: %s", e)
+
+    def show_jobs(self):
+        jobs_window = tk.Toplevel(self)
+        jobs_window.title("Jobs")
+        jobs_window.geometry("360x260")
+
+        listbox = tk.Listbox(jobs_window)
+        listbox.pack(fill=tk.BOTH, expand=True)
+        usage_label = tk.Label(jobs_window, text="")
+        usage_label.pack(fill=tk.X)
+
+        def refresh():
+            listbox.delete(0, tk.END)
+            for name in self.jobs.jobs:
+                state = " (active)" if name == self.jobs.active else " (cached)" if self.jobs.is_cached(name) else ""
+                listbox.insert(tk.END, name + state)
+            usage_label.config(text=f"Cached models: {self.jobs.memory_used / 1e6:.1f} of "
+                                    f"{self.jobs.budget / 1e6:.0f} MB")
+
+        def selected_job():
+            selection = listbox.curselection()
+            return list(self.jobs.jobs)[selection[0]] if selection else None
+
+        def switch(event=None):
+            name = selected_job()
+            if name is not None:
+                self.switch_job(name)
+                refresh()
+
+        def add():
+            path = filedialog.askopenfilename(title="Select the job's pick and place", filetypes=[("CSV files", "*.csv")])
+            if path:
+                name = self.jobs.unique_name(os.path.basename(os.path.dirname(os.path.abspath(path))))
+                self.jobs.add(Job(name, path, self.footprints_path))
+                self.switch_job(name)
+                refresh()
+
+        def remove():
+            name = selected_job()
+            if name == self.jobs.active:
+                messagebox.showerror("Error", "The active job cannot be removed.")
+            elif name is not None:
+                self.jobs.remove(name)
+                self.save_jobs()
+                refresh()
+
+        button_frame = tk.Frame(jobs_window)
+        button_frame.pack(fill=tk.X)
+        tk.Button(button_frame, text="Add", command=add).pack(side=tk.LEFT)
+        tk.Button(button_frame, text="Switch", command=switch).pack(side=tk.LEFT)
+        tk.Button(button_frame, text="Remove", command=remove).pack(side=tk.LEFT)
+        listbox.bind("<Double-1>", switch)
+        refresh()
+
+    def switch_job(self, name):
+        """
+        Make job name the active board. The outgoing job's parsed model goes
+        into the job cache and its outline, calibration and page are kept, so
+        switching back redraws without parsing or matching anything.
+        """
+        if name == self.jobs.active or name not in self.jobs:
+            return
+        if self._load_thread is not None and self._load_thread.is_alive():
+            messagebox.showerror("Error", "Wait for Load PCB to finish before switching jobs.")
+            return
+
+        with self.metrics.stage("switch_job"):
+            # Pending footprint edits belong to the outgoing job's footprints.csv
+            if self._footprint_save_id is not None:
+                self.after_cancel(self._footprint_save_id)
+                self.write_footprint_library()
+
+            outgoing = self.jobs.get(self.jobs.active)
+            if outgoing is not None:
+                outgoing.view = {attribute: getattr(self, attribute) for attribute in JOB_VIEW_DEFAULTS}
+                outgoing.view["placed"] = self.components_transform is not None
+                self.jobs.store(outgoing.name, {attribute: getattr(self, attribute) for attribute in JOB_MODEL_DEFAULTS})
+
+            job = self.jobs.activate(name)
+            self.clear_job_items()
+            for attribute, path in job.paths.items():
+                setattr(self, attribute, path)
+            for attribute, value in JOB_VIEW_DEFAULTS.items():
+                setattr(self, attribute, job.view.get(attribute, value))
+
+            model = self.jobs.take(name)
+            if model is not None:
+                for attribute, value in model.items():
+                    setattr(self, attribute, value)
+            else:
+                for attribute, value in JOB_MODEL_DEFAULTS.items():
+                    setattr(self, attribute, copy.copy(value))
+                if not self.load_project_cache():
+                    self.load_bom_data()
+
+            if self.calibration is not None:
+                self.create_calibration_items()
+            elif self.board_pose is not None:
+                self.create_pcb_items()
+            self.update_page_label()
+            if job.view.get("placed"):
+                self.place_components()
+
+        self.title(f"Projection GUI - {name}")
+        self.watch_sources()
+        self.save_jobs()
+        logger.info("Switched to job %s (%s)", name, "cached" if model is not None else "not cached")
+
+    def clear_job_items(self):
+        # Everything drawn for the outgoing job, its models stay untouched
+        self.clear_component_items()
+        self.canvas.delete("calibration_click")
+        if self.pcb_rect:
+            self.canvas.delete(self.pcb_rect)
+        for anchor in self.pcb_anchors:
+            self.canvas.delete(anchor)
+        self.pcb_rect = None
+        self.pcb_anchors = []
+        self._calibration_clicks = None
+        self.component_page_tags = {}
+        self.label_rotations = set()
+
+    def clear_component_items(self):
+        self.hide_page_frame()
+        # Parked items carry no "component" tag and survive for the next placement
+        self.canvas.delete("component")
+        for _, items in self._drawn.values():
+            self.forget_items(items)
+        self.all_components.clear()
+        self._drawn.clear()
+        self.selected_component = None
+        self.shown_page = None
+        self.components_transform = None
+        self.clear_route()
+
     def create_main_toolbar(self):
         self.toolbar = tk.Frame(self.canvas, bg="grey")
         self.toolbar.place(x=10, y=10)
 
         buttons = [
+            ("Jobs", self.show_jobs),
             ("Load PCB", self.load_pcb),
             ("Footprints", self.show_footprints),
             ("PCB Outline", self.set_pcb_outline),
+            ("Panel", self.set_panel),
             ("Place PCB", self.place_pcb),
+            ("Calibrate", self.start_calibration),
             ("Place Components", self.place_components),
             ("Rotate PCB", self.rotate_pcb),
-            ("Toggle Fill", self.toggle_pcb_fill)
+            ("Flip Side", self.flip_side),
+            ("Toggle Fill", self.toggle_pcb_fill),
+            ("Metrics", self.show_metrics)
         ]
 
         for text, command in buttons:
             button = tk.Button(self.toolbar, text=text, command=command)
             button.pack(side=tk.TOP, padx=5, pady=5, fill=tk.X)
 
+        # Shows load progress
+        self.status_label = tk.Label(self.toolbar, text="", bg="grey")
+        self.status_label.pack(side=tk.TOP, padx=5, pady=5, fill=tk.X)
+
         self.toolbar.bind("<ButtonPress-1>", self.start_drag_toolbar)
         self.toolbar.bind("<B1-Motion>", self.drag_toolbar)
     
@@ -249,6 +635,26 @@ class ProjectionGUI(tk.Tk):
                                             variable=self.shapes_var, command=self.toggle_component_shapes)
         self.shapes_button.pack(side=tk.LEFT, padx=5)
 
+        self.write_pcbdata_button = tk.Checkbutton(button_frame, text="Write pcbdata.csv",
+                                                   variable=self.write_pcbdata_var)
+        self.write_pcbdata_button.pack(side=tk.LEFT, padx=5)
+
+        self.prerender_button = tk.Checkbutton(button_frame, text="Pre-render Pages",
+                                               variable=self.prerender_var, command=self.highlight_components)
+        self.prerender_button.pack(side=tk.LEFT, padx=5)
+
+        self.watch_button = tk.Checkbutton(button_frame, text="Watch Files",
+                                           variable=self.watch_var, command=self.watch_sources)
+        self.watch_button.pack(side=tk.LEFT, padx=5)
+
+        self.optimize_button = tk.Checkbutton(button_frame, text="Optimize Order",
+                                              variable=self.optimize_var, command=self.toggle_optimize_order)
+        self.optimize_button.pack(side=tk.LEFT, padx=5)
+
+        # Degrees clockwise per "Rotate PCB" press, any angle
+        tk.Label(button_frame, text="Rotate by", bg="grey").pack(side=tk.LEFT, padx=(5, 0))
+        tk.Entry(button_frame, textvariable=self.rotation_step_var, width=5).pack(side=tk.LEFT, padx=5)
+
         # Add page navigation buttons and label
         self.prev_button = tk.Button(button_frame, text="Previous", command=self.previous_page)
         self.prev_button.pack(side=tk.LEFT, padx=5)
@@ -262,20 +668,35 @@ class ProjectionGUI(tk.Tk):
         self.secondary_toolbar.bind("<ButtonPress-1>", self.start_drag_secondary_toolbar)
         self.secondary_toolbar.bind("<B1-Motion>", self.drag_secondary_toolbar)
 
+    # Component items share tags (component_shape/component_text, side_*, footprint_*,
+    # rotation_*, page_*), so every style change below is a single tag-level Tk call.
+
     def toggle_footprint_fill(self):
-        for item in self.canvas.find_withtag("component_shape"):
-            fill = "white" if self.fill_var.get() else ""
-            self.canvas.itemconfig(item, fill=fill)
+        fill = "white" if self.fill_var.get() else ""
+        self.canvas.itemconfig("component_shape", fill=fill)
+        if self._frame_shown:
+            self.highlight_components()
 
     def toggle_component_names(self):
+        # A shown page frame no longer matches, highlight_components falls back to the live items
+        if self._frame_shown:
+            self.highlight_components()
+            return
         state = "normal" if self.names_var.get() else "hidden"
-        for item in self.canvas.find_withtag("component_text"):
-            self.canvas.itemconfig(item, state=state)
+        self.canvas.itemconfig(self.page_tag("component_text"), state=state)
 
     def toggle_component_shapes(self):
+        if self._frame_shown:
+            self.highlight_components()
+            return
         state = "normal" if self.shapes_var.get() else "hidden"
-        for item in self.canvas.find_withtag("component_shape"):
-            self.canvas.itemconfig(item, state=state)
+        self.canvas.itemconfig(self.page_tag("component_shape"), state=state)
+
+    def page_tag(self, tag):
+        # Restrict a tag to the items of the BOM page currently shown
+        if not self.shown_page:
+            return tag
+        return f"page_{self.shown_page}&&{tag}"
 
     def start_drag_secondary_toolbar(self, event):
         self._drag_data_secondary_toolbar = {'x': event.x, 'y': event.y}
@@ -288,14 +709,204 @@ class ProjectionGUI(tk.Tk):
         self.secondary_toolbar.place(x=new_x, y=new_y)
 
     def load_pcb(self):
-        script_path = r"readpickandplace.py"
+        if self._load_thread is not None and self._load_thread.is_alive():
+            return
+
+        output_path = self.pcbdata_path if self.write_pcbdata_var.get() else None
+        sources = self.project_sources(self.inputdata_path)
+        self._load_thread = threading.Thread(target=self._load_pcb_worker,
+                                             args=(self.inputdata_path, output_path, sources), daemon=True)
+        self._load_thread.start()
+        self.after(50, self._poll_load_pcb)
+
+    def _load_pcb_worker(self, input_path, output_path, sources):
+        # Runs off the Tk thread, results are handed back through the queue
         try:
-            result = subprocess.run(["python", script_path], capture_output=True, text=True, check=True)
-            messagebox.showinfo("Success", "PCB data loaded successfully.\n" + result.stdout)
-        except subprocess.CalledProcessError as e:
-            messagebox.showerror("Error", f"Failed to load PCB data.\nError: {e.stderr}")
+            with self.metrics.stage("load"):
+                caches = {side: load_project_cache(self.side_cache_path(side), sources) for side in LAYERS}
+                if all(cache is not None for cache in caches.values()):
+                    boards = {side: cache["board"] for side, cache in caches.items()}
+                else:
+                    caches = None
+                    with self.metrics.stage("parse"):
+                        # A single pass over the file fills both sides
+                        boards = Board.load_layers(input_path, progress=self._report_load_progress)
+                if output_path:
+                    write_pcb_data(boards[TOP_LAYER].components(), output_path)
+            self._load_queue.put(("cached", caches) if caches is not None else ("done", boards))
+        except FileNotFoundError:
+            self._load_queue.put(("error", f"File '{input_path}' not found."))
         except Exception as e:
-            messagebox.showerror("Error", f"An unexpected error occurred: {str(e)}")
+            self._load_queue.put(("error", str(e)))
+
+    def _report_load_progress(self, bytes_read, total_bytes):
+        # Called on the worker thread after every chunk
+        self._load_queue.put(("progress", (bytes_read, total_bytes)))
+
+    def _poll_load_pcb(self):
+        while True:
+            try:
+                status, result = self._load_queue.get_nowait()
+            except queue.Empty:
+                self.after(50, self._poll_load_pcb)
+                return
+            if status != "progress":
+                break
+            bytes_read, total_bytes = result
+            self.status_label.config(text=f"Loading {100 * bytes_read // max(total_bytes, 1)}%")
+
+        self.status_label.config(text="")
+        if status == "cached":
+            self.apply_project_caches(result)
+            messagebox.showinfo("Success", f"PCB data loaded from the project cache.\n{self.side_summary()}.")
+        elif status == "done":
+            self.board = result[self.side]
+            self.placement = None
+            self.side_models = {side: {"board": board} for side, board in result.items() if side != self.side}
+            messagebox.showinfo("Success", f"PCB data loaded successfully.\n{self.side_summary()} read.")
+        if status != "error":
+            self.watch_sources()
+        else:
+            messagebox.showerror("Error", f"Failed to load PCB data.\nError: {result}")
+
+    def default_board_source(self):
+        if self.board is not None:
+            return self.board.source_path
+        return self.inputdata_path if os.path.exists(self.inputdata_path) else self.pcbdata_path
+
+    def project_sources(self, board_source=None):
+        return [board_source or self.default_board_source(), self.footprints_path, self.bom_path]
+
+    def side_cache_path(self, side):
+        return layer_cache_path(self.project_cache_path, side)
+
+    def load_project_cache(self):
+        # Reopening an unchanged job skips parsing and footprint matching entirely
+        caches = {side: load_project_cache(self.side_cache_path(side), self.project_sources()) for side in LAYERS}
+        if caches[self.side] is None:
+            return False
+        self.apply_project_caches(caches)
+        logger.info("Project cache loaded from %s", self.side_cache_path(self.side))
+        return True
+
+    def apply_project_caches(self, caches):
+        self.apply_project_cache(caches[self.side])
+        self.side_models = {}
+        for side, cache in caches.items():
+            if side != self.side and cache is not None:
+                self.side_models[side] = {"board": cache["board"], "placement": cache["placement"],
+                                          "placement_signature": self.placement_signature,
+                                          "placement_library_version": self.placement_library_version}
+
+    def apply_project_cache(self, cache):
+        self.board = cache["board"]
+        self.placement = cache["placement"]
+        self.bom_pages = cache["bom_pages"]
+        self.total_pages = len(self.bom_pages) + 1  # +1 for the setup page
+        self.placement_signature = sources_signature(self.project_sources(), with_hash=False)
+        self.placement_library_version = self.footprint_library.version if self.footprint_library is not None else 0
+        self.update_page_label()
+
+    def current_placement(self):
+        # Reuse the placement while none of its source files changed on disk
+        if (self.placement is not None and self.placement_signature == sources_signature(self.project_sources(), with_hash=False)
+                and (self.footprint_library is None or self.footprint_library.version == self.placement_library_version)):
+            return self.placement
+
+        pcb_data = self.read_pcb_data()
+        footprints = self.read_footprints()
+        if not pcb_data or not footprints:
+            return None
+        self.load_bom_data()
+
+        self.placement = self.build_placement(pcb_data, self.side)
+        self.placement_signature = sources_signature(self.project_sources(), with_hash=False)
+        self.placement_library_version = self.footprint_library.version
+
+        # The other side is matched against the same library now, so flipping the board builds nothing
+        for side, model in self.side_models.items():
+            if model.get("board") is not None:
+                model["board"] = model["board"].reload_if_changed()
+                model["placement"] = self.build_placement(model["board"], side)
+                model["placement_signature"] = self.placement_signature
+                model["placement_library_version"] = self.placement_library_version
+        return self.placement
+
+    def build_placement(self, board, side):
+        footprints = self.footprints
+
+        # Match each distinct footprint once, components refer to it by id
+        with self.metrics.stage("match"):
+            matcher = self.footprint_library.matcher
+            match_names = [matcher.match_name(name) for name in board.footprint_names]
+        with self.metrics.stage("geometry"):
+            placement = Placement.build(board, [footprints[name] if name else None for name in match_names])
+
+        try:
+            save_project_cache(self.side_cache_path(side), self.project_sources(), board, placement,
+                               match_names, self.bom_pages)
+        except OSError as e:
+            logger.warning("Could not write project cache: %s", e)
+        return placement
+
+    def side_boards(self):
+        # Every side parsed so far, by layer
+        boards = {side: model["board"] for side, model in self.side_models.items() if model.get("board") is not None}
+        if self.board is not None:
+            boards[self.side] = self.board
+        return boards
+
+    def side_summary(self):
+        boards = self.side_boards()
+        total = sum(len(board) for board in boards.values())
+        bottom = boards.get(BOTTOM_LAYER)
+        return f"{total} components ({len(bottom) if bottom is not None else 0} on the bottom side)"
+
+    def load_side_boards(self):
+        """
+        Parse the sides not loaded yet from the pick and place the loaded side came from.
+        """
+        boards = self.side_boards()
+        if not boards or len(boards) == len(LAYERS):
+            return
+        source = next(iter(boards.values())).source_path
+        try:
+            parsed = Board.load_layers(source)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to read PCB data: {str(e)}")
+            return
+        for side, board in parsed.items():
+            if side in boards:
+                continue
+            if side == self.side:
+                self.board = board
+            else:
+                self.side_models.setdefault(side, {})["board"] = board
+
+    def flip_side(self):
+        """
+        Show the other side of the board, mirrored as it lies once turned over.
+        Each side keeps its own board, placement and scene, so flipping back
+        and forth only swaps the prepared models.
+        """
+        if self._load_thread is not None and self._load_thread.is_alive():
+            return
+
+        with self.metrics.stage("flip_side"):
+            placed = self.components_transform is not None
+            self.side_models[self.side] = {attribute: getattr(self, attribute) for attribute in SIDE_DEFAULTS}
+            self.side = BOTTOM_LAYER if self.side == TOP_LAYER else TOP_LAYER
+            model = self.side_models.pop(self.side, {})
+            for attribute, value in SIDE_DEFAULTS.items():
+                setattr(self, attribute, model.get(attribute, value))
+            if self.board is None:
+                self.load_side_boards()
+
+            self.clear_component_items()
+            self.update_page_label()
+            if placed:
+                self.place_components()
+        logger.info("Showing the %s", "bottom side" if self.side == BOTTOM_LAYER else "top side")
 
     def show_footprints(self):
         footprint_window = tk.Toplevel(self)
@@ -308,6 +919,8 @@ class ProjectionGUI(tk.Tk):
         tree.pack(fill=tk.BOTH, expand=True)
 
         existing_footprints = self.get_existing_footprints()
+        if existing_footprints is None:
+            return
 
         # Create a style
         style = ttk.Style()
@@ -316,8 +929,7 @@ class ProjectionGUI(tk.Tk):
 
         pcb_data = self.read_pcb_data()
         if pcb_data:
-            unique_footprints = set(component['Footprint'] for component in pcb_data if 'Footprint' in component)
-            for footprint in unique_footprints:
+            for footprint in pcb_data.footprint_names:
                 action = "Modify" if footprint in existing_footprints else "Add"
                 item = tree.insert("", "end", values=(footprint, action))
                 
@@ -330,34 +942,52 @@ class ProjectionGUI(tk.Tk):
 
         tree.bind("<Double-1>", lambda event: self.handle_footprint_action(tree))
 
-    def get_footprints(self):
-        footprints = set()
+        button_frame = tk.Frame(footprint_window)
+        button_frame.pack(fill=tk.X)
+        tk.Button(button_frame, text="Auto-fill", command=lambda: self.auto_fill_footprints(tree)).pack(side=tk.LEFT)
+        tk.Button(button_frame, text="Import Table", command=lambda: self.import_package_table(tree)).pack(side=tk.LEFT)
+
+    def auto_fill_footprints(self, tree):
+        """
+        Fill every footprint the package rules can size, leaving the unknown ones red.
+        """
+        library = self.load_footprint_library()
+        if library is None:
+            return
+
+        rows = {tree.item(item)["values"][0]: item for item in tree.get_children()}
+        filled, unknown = fill_footprints(library, list(rows), self.package_table)
+        for footprint in filled:
+            tree.item(rows[footprint], values=(footprint, "Modify"), tags=("Modify",))
+        if filled:
+            self.schedule_footprint_save()
+        logger.info("Auto-filled %d footprints, %d unknown", len(filled), len(unknown))
+        messagebox.showinfo("Auto-fill", f"Filled {len(filled)} footprints, {len(unknown)} left to add by hand.")
+
+    def import_package_table(self, tree):
+        path = filedialog.askopenfilename(title="Select package dimension table", filetypes=[("CSV files", "*.csv")])
+        if not path:
+            return
         try:
-            with open(self.pcbdata_path, "r") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    footprints.add(row["Footprint"])
-        except FileNotFoundError:
-            messagebox.showerror("Error", f"pcbdata.csv not found at {self.pcbdata_path}. Please load PCB data first.")
-        return sorted(footprints)
+            table = PackageTable.load(path)
+        except OSError as e:
+            messagebox.showerror("Error", f"Failed to read package table: {str(e)}")
+            return
+        if not len(table):
+            messagebox.showerror("Error", "No packages found. Expected Package, Shape, Width and Height columns.")
+            return
+        self.package_table = table
+        self.auto_fill_footprints(tree)
+
+    def get_footprints(self):
+        pcb_data = self.read_pcb_data()
+        if not pcb_data:
+            return []
+        return sorted(pcb_data.footprint_names)
 
     def get_existing_footprints(self):
-        existing_footprints = set()
-        try:
-            with open(self.footprints_path, "r") as f:
-                reader = csv.reader(f)
-                # Check if the file is not empty before trying to skip the header
-                first_row = next(reader, None)
-                if first_row is not None:
-                    # If it's not the header, add it to existing_footprints
-                    if first_row != ["Name", "Shape", "Width", "Height", "CenterX", "CenterY"]:
-                        existing_footprints.add(first_row[0])
-                    # Read the rest of the rows
-                    for row in reader:
-                        existing_footprints.add(row[0])
-        except FileNotFoundError:
-            pass  # It's okay if the file doesn't exist yet
-        return existing_footprints
+        library = self.load_footprint_library()
+        return library.footprints if library is not None else None
 
     def handle_footprint_action(self, tree):
         selected_item = tree.selection()[0]
@@ -374,75 +1004,267 @@ class ProjectionGUI(tk.Tk):
 
     def save_footprint(self, data):
         if data is None:
-            print("No data to save")
+            logger.warning("No footprint data to save")
             return
-        
-        file_exists = os.path.isfile(self.footprints_path)
-        mode = "a" if file_exists else "w"
-        with open(self.footprints_path, mode, newline='') as f:
-            writer = csv.writer(f)
-            if not file_exists:
-                writer.writerow(["Name", "Shape", "Width", "Height", "CenterX", "CenterY"])
-            writer.writerow([data["name"], data["shape"], data["width"], data["height"], data["center_x"], data["center_y"]])
-        print(f"Footprint saved to {self.footprints_path}")
+
+        library = self.load_footprint_library()
+        if library is None:
+            return
+        library.set(data["name"], data["shape"], data["width"], data["height"], data["center_x"], data["center_y"])
+        self.schedule_footprint_save()
+
+    def schedule_footprint_save(self):
+        # Edits in quick succession end up in a single rewrite of footprints.csv
+        if self._footprint_save_id is not None:
+            self.after_cancel(self._footprint_save_id)
+        self._footprint_save_id = self.after(FOOTPRINT_SAVE_DELAY_MS, self.write_footprint_library)
+
+    def write_footprint_library(self):
+        self._footprint_save_id = None
+        library = self.footprint_library
+        try:
+            if library is not None and library.save():
+                logger.info("Footprints saved to %s", library.path)
+        except OSError as e:
+            messagebox.showerror("Error", f"Failed to save footprints: {str(e)}")
+
+    def on_close(self):
+        # Write any footprint edits still waiting for the debounce
+        if self._footprint_save_id is not None:
+            self.after_cancel(self._footprint_save_id)
+            self.write_footprint_library()
+        self.file_watcher.stop()
+        self.destroy()
 
     def set_pcb_outline(self):
         dialog = PCBOutlineDialog(self)
         self.wait_window(dialog)
         if dialog.result:
             self.original_pcb_width, self.original_pcb_length = dialog.result
-            self.pcb_width, self.pcb_length = self.original_pcb_width, self.original_pcb_length
+            self.pcb_width, self.pcb_length = self.outline_size()
+            self.reset_board_rotation()
             messagebox.showinfo("PCB Outline", f"PCB outline set to {self.pcb_width}mm x {self.pcb_length}mm")
 
+    def set_panel(self):
+        if self.original_pcb_width is None or self.original_pcb_length is None:
+            messagebox.showerror("Error", "Please set PCB outline first.")
+            return
+
+        dialog = PanelDialog(self, self.panel)
+        self.wait_window(dialog)
+        if dialog.result:
+            panel = dialog.result
+            # A 1 x 1 panel is just the board
+            self.panel = panel if panel.rows * panel.columns > 1 else None
+            self.pcb_width, self.pcb_length = self.outline_size()
+            self.reset_board_rotation()
+            messagebox.showinfo("Panel", f"Outline set to {self.pcb_width:g}mm x {self.pcb_length:g}mm"
+                                         f" ({len(panel)} boards). Place the PCB again.")
+
+    def outline_size(self):
+        # Size in mm of what the outline covers: one board, or the whole panel
+        if self.panel is not None:
+            return self.panel.size(self.original_pcb_width, self.original_pcb_length)
+        return self.original_pcb_width, self.original_pcb_length
+
+    def panel_copies(self):
+        # Copy numbers, their rotations and the board-to-panel matrix of each copy
+        if self.panel is None:
+            return [0], [0.0], np.eye(3)[np.newaxis]
+        copies = self.panel.copies()
+        return (copies, [self.panel.copy_rotation(copy) for copy in copies],
+                self.panel.copy_matrices(self.original_pcb_width, self.original_pcb_length))
+
     def place_pcb(self):
         if self.pcb_width is None or self.pcb_length is None:
             messagebox.showerror("Error", "Please set PCB outline first.")
             return
 
-        # Remove existing PCB rectangle and anchors
+        # Use the default position, keeping the current turn
+        x1, y1 = 250, 100
+        x2 = x1 + self.pcb_width
+        y2 = y1 + self.pcb_length
+        rotation = self.board_rotation
+        self.calibration = None
+        self.set_board_pose(BoardPose.from_outline([x1, y1, x2, y2], rotation))
+
+        logger.info("PCB placed: %smm x %smm, outline (pixels): %s", self.pcb_width, self.pcb_length, self.pcb_outline)
+
+    @property
+    def board_rotation(self):
+        # Clockwise turn of the outline in degrees, a calibration has its own orientation
+        if self.calibration is not None or self.board_pose is None:
+            return 0.0
+        return self.board_pose.rotation
+
+    def reset_board_rotation(self):
+        # New outline dimensions are stretched over the outline unturned
+        if self.board_pose is not None:
+            self.board_pose.rotation = 0.0
+            self.update_pcb_items()
+
+    def set_board_pose(self, pose):
+        self.board_pose = pose
+        self.create_pcb_items()
+
+    def create_pcb_items(self):
+        # Remove existing PCB outline and anchors
         if self.pcb_rect:
             self.canvas.delete(self.pcb_rect)
         for anchor in self.pcb_anchors:
             self.canvas.delete(anchor)
 
-        # Use the default position
-        x1, y1 = 250, 100
-        x2 = x1 + self.pcb_width
-        y2 = y1 + self.pcb_length
-
-        self.pcb_rect = self.canvas.create_rectangle(x1, y1, x2, y2, outline="green", width=2, fill="", tags="pcb")
-        self.pcb_outline = [x1, y1, x2, y2]
-
-        # Create anchor points
-        self.pcb_anchors = [
-            self.canvas.create_oval(x1-5, y2-5, x1+5, y2+5, fill="red", outline="red", tags="pcb_anchor_origin"),
-            self.canvas.create_oval(x2-5, y2-5, x2+5, y2+5, fill="blue", outline="blue", tags="pcb_anchor"),
-            self.canvas.create_oval(x2-5, y1-5, x2+5, y1+5, fill="blue", outline="blue", tags="pcb_anchor"),
-            self.canvas.create_oval(x1-5, y1-5, x1+5, y1+5, fill="blue", outline="blue", tags="pcb_anchor")
-        ]
+        # The outline and its anchors are projected from the pose, never read back from the canvas
+        corners = self.board_pose.corners
+        self.pcb_rect = self.canvas.create_polygon([v for corner in corners for v in corner],
+                                                   outline="green", width=2, fill="", tags="pcb")
+        self.pcb_outline = self.board_pose.bounding_box()
+        self.pcb_anchors = []
+        for index, (x, y) in enumerate(corners):
+            color, tag = ("red", "pcb_anchor_origin") if index == 0 else ("blue", "pcb_anchor")
+            self.pcb_anchors.append(self.canvas.create_oval(x-5, y-5, x+5, y+5, fill=color, outline=color, tags=tag))
         self.canvas.tag_bind("pcb_anchor_origin", "<ButtonPress-1>", self.start_move_pcb)
         self.canvas.tag_bind("pcb_anchor_origin", "<B1-Motion>", self.moving_pcb)
         self.canvas.tag_bind("pcb_anchor", "<ButtonPress-1>", self.start_resize_pcb)
         self.canvas.tag_bind("pcb_anchor", "<B1-Motion>", self.resizing_pcb)
+        self.canvas.tag_bind("pcb_anchor_origin", "<ButtonRelease-1>", self.render_scheduler.flush)
+        self.canvas.tag_bind("pcb_anchor", "<ButtonRelease-1>", self.render_scheduler.flush)
+
+    def update_pcb_items(self):
+        # Only the uncalibrated outline follows the pose, a calibration draws its own corners
+        if self.calibration is not None or not self.pcb_anchors:
+            return
+        corners = self.board_pose.corners
+        self.canvas.coords(self.pcb_rect, *[v for corner in corners for v in corner])
+        for anchor, (x, y) in zip(self.pcb_anchors, corners):
+            self.canvas.coords(anchor, x-5, y-5, x+5, y+5)
+        self.pcb_outline = self.board_pose.bounding_box()
+
+    def start_calibration(self):
+        if self.original_pcb_width is None or self.original_pcb_length is None:
+            messagebox.showerror("Error", "Please set PCB outline first.")
+            return
+
+        outline_width, outline_length = self.outline_size()
+        key = calibration_key(outline_width, outline_length)
+        saved = load_calibrations(self.calibration_path).get(key)
+        if saved and messagebox.askyesno("Calibration", f"Reuse the saved calibration for a {key} mm board?"):
+            self.apply_calibration(saved)
+            return
+
+        # on_canvas_click collects the corners while this is set
+        self._calibration_clicks = []
+        messagebox.showinfo("Calibration", "Click the four PCB corners in this order:\n" + "\n".join(CORNER_NAMES))
+
+    def add_calibration_corner(self, event):
+        x, y = event.x, event.y
+        self._calibration_clicks.append((x, y))
+        self.canvas.create_oval(x-5, y-5, x+5, y+5, fill="blue", outline="blue", tags="calibration_click")
+
+        if len(self._calibration_clicks) == 4:
+            # Done collecting whether or not the corners turn out usable
+            clicks, self._calibration_clicks = self._calibration_clicks, None
+            self.canvas.delete("calibration_click")
+            outline_width, outline_length = self.outline_size()
+            if self.apply_calibration(Calibration(outline_width, outline_length, clicks)):
+                self.save_calibration()
+
+    def apply_calibration(self, calibration):
+        """
+        Switch to calibration, returns False and keeps the current outline if
+        its corners do not form a usable quadrilateral.
+        """
+        if not calibration.usable:
+            messagebox.showerror("Calibration", "The corners do not form a board outline. Start the calibration "
+                                 "again and click the corners in this order:\n" + "\n".join(CORNER_NAMES))
+            return False
+        self.calibration = calibration
+        self.create_calibration_items()
+        self.rescale_components()
+        return True
+
+    def save_calibration(self, event=None):
+        if self.calibration is None:
+            return
+        calibrations = load_calibrations(self.calibration_path)
+        calibrations[self.calibration.key] = self.calibration
+        save_calibrations(self.calibration_path, calibrations)
+
+    def create_calibration_items(self):
+        # The calibrated quadrilateral replaces the rectangular outline and its anchors
+        if self.pcb_rect:
+            self.canvas.delete(self.pcb_rect)
+        for anchor in self.pcb_anchors:
+            self.canvas.delete(anchor)
+
+        corners = self.calibration.corners
+        self.pcb_rect = self.canvas.create_polygon([v for corner in corners for v in corner],
+                                                   outline="green", width=2, fill="", tags="pcb")
+        self.pcb_anchors = []
+        for index, (x, y) in enumerate(corners):
+            color = "red" if index == 0 else "blue"
+            self.pcb_anchors.append(self.canvas.create_oval(x-5, y-5, x+5, y+5, fill=color, outline=color,
+                                                            tags="calibration_anchor"))
+        self.pcb_outline = self.calibration.bounding_box()
+
+        self.canvas.tag_bind("calibration_anchor", "<ButtonPress-1>", self.start_drag_calibration_corner)
+        self.canvas.tag_bind("calibration_anchor", "<B1-Motion>", self.dragging_calibration_corner)
+        self.canvas.tag_bind("calibration_anchor", "<ButtonRelease-1>", self.end_drag_calibration_corner)
+
+    def start_drag_calibration_corner(self, event):
+        item = event.widget.find_withtag("current")[0]
+        self._calibration_drag_index = self.pcb_anchors.index(item)
+
+    def dragging_calibration_corner(self, event):
+        self._calibration_drag_event = event
+        self.render_scheduler.schedule("calibration", self.apply_calibration_drag)
+
+    def end_drag_calibration_corner(self, event):
+        self.render_scheduler.flush()
+        self.save_calibration()
+
+    def apply_calibration_drag(self):
+        event = self._calibration_drag_event
+        index = self._calibration_drag_index
+        x, y = event.x, event.y
+        # A corner dropped onto another one or across the opposite edge is not followed
+        if not is_convex_quad(self.calibration.moved_corners(index, x, y)):
+            return
+        self.calibration.move_corner(index, x, y)
+
+        self.canvas.coords(self.pcb_anchors[index], x-5, y-5, x+5, y+5)
+        self.canvas.coords(self.pcb_rect, *[v for corner in self.calibration.corners for v in corner])
+        self.pcb_outline = self.calibration.bounding_box()
 
-        print(f"PCB placed: {self.pcb_width}mm x {self.pcb_length}mm")
-        print(f"PCB outline (pixels): {self.pcb_outline}")
+        # Re-solve the homography and re-project the components
+        self.rescale_components()
+        self.update_coordinates(event)
 
     def start_move_pcb(self, event):
         self._drag_data = {'x': event.x, 'y': event.y, 'item': event.widget.find_withtag("current")[0]}
 
     def moving_pcb(self, event):
+        self._drag_data['event'] = event
+        self.render_scheduler.schedule("move", self.apply_move_pcb)
+
+    def apply_move_pcb(self):
+        event = self._drag_data['event']
         delta_x = event.x - self._drag_data['x']
         delta_y = event.y - self._drag_data['y']
         
-        # Move the PCB rectangle and all anchors
-        self.canvas.move("pcb", delta_x, delta_y)
-        self.canvas.move("pcb_anchor", delta_x, delta_y)
-        self.canvas.move("pcb_anchor_origin", delta_x, delta_y)
-        self.canvas.move("component", delta_x, delta_y)  # Move components with PCB
-        
-        # Update PCB outline coordinates
-        self.pcb_outline = [coord + (delta_x if i % 2 == 0 else delta_y) for i, coord in enumerate(self.pcb_outline)]
+        # Move the pose, the outline is re-projected from it
+        self.board_pose.translate(delta_x, delta_y)
+        self.update_pcb_items()
+
+        # A whole-pixel shift is exact, so the component items and markers are moved in one call each
+        self.canvas.move("component", delta_x, delta_y)
+        self.canvas.move("route", delta_x, delta_y)
+        if self._route_transform is not None:
+            self._route_transform = translation_matrix(delta_x, delta_y) @ self._route_transform
+        if self.components_transform is not None:
+            self.components_transform = translation_matrix(delta_x, delta_y) @ self.components_transform
+            # Drawn items moved with the tag, only those crossing the canvas edge change
+            self.render_components()
         
         self._drag_data['x'] = event.x
         self._drag_data['y'] = event.y
@@ -454,40 +1276,25 @@ class ProjectionGUI(tk.Tk):
         self._resize_data = {'x': event.x, 'y': event.y, 'item': event.widget.find_withtag("current")[0]}
 
     def resizing_pcb(self, event):
+        self._resize_data['event'] = event
+        self.render_scheduler.schedule("resize", self.apply_resize_pcb)
+
+    def apply_resize_pcb(self):
+        event = self._resize_data['event']
         delta_x = event.x - self._resize_data['x']
         delta_y = event.y - self._resize_data['y']
         
         anchor = self._resize_data['item']
         anchor_index = self.pcb_anchors.index(anchor)
         
-        x1, y1, x2, y2 = self.pcb_outline
-        
-        if anchor_index == 1:  # Bottom-right
-            x2 += delta_x
-            y2 += delta_y
-        elif anchor_index == 2:  # Top-right
-            x2 += delta_x
-            y1 += delta_y
-        elif anchor_index == 3:  # Top-left
-            x1 += delta_x
-            y1 += delta_y
-        
-        # Ensure minimum size
-        if x2 - x1 < 10 or y2 - y1 < 10:
+        # The opposite corner stays put, along the board axes however it is turned
+        if not self.board_pose.resize_corner(anchor_index, delta_x, delta_y):
             return
-        
-        self.canvas.coords(self.pcb_rect, x1, y1, x2, y2)
-        self.pcb_outline = [x1, y1, x2, y2]
-        
-        # Update anchor positions
-        self.canvas.coords(self.pcb_anchors[0], x1-5, y2-5, x1+5, y2+5)
-        self.canvas.coords(self.pcb_anchors[1], x2-5, y2-5, x2+5, y2+5)
-        self.canvas.coords(self.pcb_anchors[2], x2-5, y1-5, x2+5, y1+5)
-        self.canvas.coords(self.pcb_anchors[3], x1-5, y1-5, x1+5, y1+5)
-        
+        self.update_pcb_items()
+
         # Update PCB dimensions
-        self.pcb_width = x2 - x1
-        self.pcb_length = y2 - y1
+        self.pcb_width = self.board_pose.width
+        self.pcb_length = self.board_pose.length
         
         # Rescale components
         self.rescale_components()
@@ -499,105 +1306,56 @@ class ProjectionGUI(tk.Tk):
         self.update_coordinates(event)
 
     def place_components(self):
-        print("Starting place_components method")
+        logger.debug("Starting place_components")
         if self.pcb_outline is None:
             messagebox.showerror("Error", "Please set PCB outline and place PCB first.")
             return
 
-        current_width, current_length = get_pcb_dimensions(self.pcb_outline)
-        scale_x, scale_y = calculate_scale_factor(self.original_pcb_width, self.original_pcb_length, current_width, current_length)
-
-        pcb_data = self.read_pcb_data()
-        footprints = self.read_footprints()
+        placement = self.current_placement()
+        pcb_data = self.board
         
-        if not pcb_data or not footprints:
+        if placement is None:
             messagebox.showerror("Error", "Failed to read PCB data or footprints.")
             return
 
-        print("PCB data and footprints loaded successfully.")
-        print(f"Number of components: {len(pcb_data)}")
-        print(f"Number of footprints: {len(footprints)}")
+        logger.info("Placing %d components", len(pcb_data))
 
-        # Clear previous components
-        self.canvas.delete("component")
+        # BOM and pick-and-place differences are reported before anything is placed
+        self.check_bom()
 
-        print(f"PCB outline: {self.pcb_outline}")
-        print(f"Scale factors: x={scale_x}, y={scale_y}")
-
-        # Set origin to bottom-left corner of PCB (canvas coordinate system)
-        origin_x = self.pcb_outline[0]
-        origin_y = self.pcb_outline[3]
-
-        missing_footprints = set()
-        plotted_components = 0
-
-        self.all_components.clear()  # Clear previous components
-
-        # Plot components
-        for component in pcb_data:
-            footprint_name = component.get('Footprint', '')
-            normalized_footprint_name = re.sub(r'[^a-zA-Z0-9]', '', footprint_name.lower())
-            
-            # Try to find a matching footprint
-            footprint = None
-            for fp_name, fp_data in footprints.items():
-                if normalized_footprint_name in re.sub(r'[^a-zA-Z0-9]', '', fp_name.lower()):
-                    footprint = fp_data
-                    break
-            
-            if footprint:
-                try:
-                    # Replace comma with period and convert to float
-                    comp_x = float(component['Center-X(mm)'].replace(',', '.'))
-                    comp_y = float(component['Center-Y(mm)'].replace(',', '.'))
-                    rotation = float(component.get('Rotation', '0').replace(',', '.'))
-                    
-                    # Scale component position
-                    scaled_x, scaled_y = scale_component_position(comp_x, comp_y, scale_x, scale_y)
-                    
-                    # Convert mm to pixels and adjust coordinates to start from bottom-left corner
-                    x = origin_x + scaled_x
-                    y = origin_y - scaled_y  # Subtract because canvas Y increases downwards
-                    
-                    print(f"Plotting component: {component.get('Designator', '')}")
-                    print(f"  Original position: ({comp_x}, {comp_y}), Scaled position: ({scaled_x}, {scaled_y})")
-                    print(f"  Canvas position: ({x}, {y}), Rotation: {rotation}")
-                    
-                    fill_color = "white" if self.fill_var.get() else ""
-                    if footprint['Shape'].lower() == 'rectangle':
-                        width = float(footprint['Width']) * scale_x
-                        height = float(footprint['Height']) * scale_y
-                        shape_item = self.create_rotated_rectangle(x, y, width, height, rotation, fill=fill_color, outline="yellow", tags=("component", "component_shape"))
-                    elif footprint['Shape'].lower() == 'circle':
-                        diameter = float(footprint['Width']) * scale_x
-                        shape_item = self.canvas.create_oval(x - diameter/2, y - diameter/2, x + diameter/2, y + diameter/2,
-                                                outline="yellow", fill=fill_color, tags=("component", "component_shape"))
-                    else:
-                        print(f"Unknown shape for footprint {footprint_name}: {footprint['Shape']}")
-                        continue
-                    
-                    text_state = "normal" if self.names_var.get() else "hidden"
-                    text_item = self.create_rotated_text(x, y, component.get('Designator', ''), rotation, fill="white", tags=("component", "component_text"), state=text_state)
-                    self.adjust_text_orientation(text_item)
-                    
-                    plotted_components += 1
-
-                    # Store the component items
-                    designator = component.get('Designator', '')
-                    self.all_components[designator] = {
-                        'shape': shape_item,
-                        'text': text_item
-                    }
-                except (KeyError, ValueError) as e:
-                    print(f"Error plotting component {component.get('Designator', '')}: {e}")
-            else:
-                missing_footprints.add(footprint_name)
+        # The previous components' items are handed back by key instead of being deleted
+        self.release_component_items()
+
+        # Board mm (origin bottom-left corner of the PCB) to canvas pixels, including board rotation
+        transform = self.board_transform()
+        logger.debug("PCB outline: %s, board transform: %s", self.pcb_outline, transform.tolist())
+
+        missing_footprints = placement.missing_footprints
+
+        # Panel copies reuse the same model-space geometry, each with its own matrix
+        with self.metrics.stage("geometry"):
+            scene = self.update_component_scene(placement)
+        self.label_rotations = set(np.unique(scene.rotations).tolist())
+
+        self.sequence_pages(scene)
+        self.update_page_tags()
 
-        print(f"Plotted {plotted_components} components")
-        print(f"Missing footprints: {len(missing_footprints)}")
-        print("First 10 missing footprints:")
-        for footprint in list(missing_footprints)[:10]:
-            print(f"  {footprint}")
+        self.shown_page = None
+        self.selected_component = None
+        self._components_version += 1
+        self.hide_page_frame()
+
+        # Items are only created for what is on screen, at a legible level of detail
+        self.components_transform = None
+        self.render_components()
+        self.park_reusable_items()
+        plotted_components = len(self._drawn)
+
+        self.metrics.set("plotted_components", plotted_components)
+        self.metrics.set("missing_footprints", len(missing_footprints))
+        logger.info("Plotted %d components, %d missing footprints", plotted_components, len(missing_footprints))
+        if missing_footprints:
+            logger.info("First missing footprints: %s", ", ".join(sorted(missing_footprints)[:10]))
 
         self.debug_print()
 
@@ -605,197 +1363,577 @@ class ProjectionGUI(tk.Tk):
         self.update_page_label()
         self.highlight_components()
 
-    def create_rotated_rectangle(self, x, y, width, height, angle, **kwargs):
-        points = [
-            (-width/2, -height/2),
-            (width/2, -height/2),
-            (width/2, height/2),
-            (-width/2, height/2)
-        ]
-        
-        cos_val = math.cos(math.radians(angle))
-        sin_val = math.sin(math.radians(angle))
-        
-        rotated_points = []
-        for px, py in points:
-            rx = px * cos_val - py * sin_val + x
-            ry = px * sin_val + py * cos_val + y
-            rotated_points.append(rx)
-            rotated_points.append(ry)
-        
-        return self.canvas.create_polygon(rotated_points, **kwargs)
+    def update_page_tags(self):
+        # Every item carries a shared tag per BOM page it appears on
+        self.component_page_tags = {}
+        for page in range(1, len(self.bom_pages) + 1):
+            for designator in self.bom_pages[self.page_line(page)]:
+                self.component_page_tags.setdefault(designator, []).append(f"page_{page}")
+
+    def page_line(self, page):
+        # BOM line index shown on page (1 and up), the BOM order until pages are sequenced
+        if len(self.page_order) == len(self.bom_pages):
+            return self.page_order[page - 1]
+        return page - 1
+
+    def sequence_pages(self, scene):
+        """
+        Order the BOM pages, smallest parts first, and the parts of each page
+        into a short path for the operator's hand. With Optimize Order off the
+        pages follow the BOM. The current page keeps showing the same BOM line.
+        """
+        key = (scene, self.bom_pages, self.optimize_var.get())
+        if self._sequence_key is not None and all(a is b for a, b in zip(key, self._sequence_key)):
+            return
+        line = self.page_line(self.current_page) if 0 < self.current_page <= len(self.bom_pages) else None
+
+        if self.optimize_var.get():
+            with self.metrics.stage("sequence"):
+                self.page_order, self.page_paths = plan_pages(scene, self.bom_pages)
+        else:
+            self.page_order, self.page_paths = list(range(len(self.bom_pages))), []
+        self._sequence_key = key
+        self.clear_route()
+
+        if line is not None:
+            self.current_page = self.page_order.index(line) + 1
+        self.update_page_label()
+
+    def toggle_optimize_order(self):
+        # Page numbers change with the order, so the components are placed again with their new page tags
+        if self.components_transform is not None:
+            self.place_components()
+
+    def clear_route(self):
+        self.canvas.delete("route")
+        self._route_entries = None
+        self._route_items = []
+        self._route_transform = None
+
+    def draw_route(self):
+        """
+        Number the current page's parts in visiting order. The markers are
+        projected from board mm like the components and only moved when the
+        board transform changes.
+        """
+        page = self.current_page
+        entries = None
+        if self.components_transform is not None and 0 < page <= len(self.page_paths):
+            entries = self.page_paths[page - 1]
+        if entries is not self._route_entries:
+            self.clear_route()
+            self._route_entries = entries
+        if entries is None or not len(entries):
+            return
+
+        transform = self.board_transform()
+        if self._route_transform is not None and np.allclose(transform, self._route_transform):
+            return
+        positions = transform_points(transform, self.component_scene.centers[entries]).tolist()
+        if not self._route_items:
+            for number, (x, y) in enumerate(positions, start=1):
+                marker = self.canvas.create_oval(x-7, y-7, x+7, y+7, fill="black", outline="cyan", tags="route")
+                label = self.canvas.create_text(x, y, text=str(number), fill="cyan", font=("Arial", 7), tags="route")
+                self._route_items.append((marker, label))
+        else:
+            for (marker, label), (x, y) in zip(self._route_items, positions):
+                self.canvas.coords(marker, x-7, y-7, x+7, y+7)
+                self.canvas.coords(label, x, y)
+        self._route_transform = transform
+
+    def watch_sources(self):
+        """
+        Watch the active job's pick and place, BOM and footprints for changes.
+        The pick and place is parsed on the watcher thread as soon as it settles.
+        """
+        if not self.watch_var.get():
+            self.file_watcher.watch({})
+            return
+        self.file_watcher.watch({self.default_board_source(): Board.load_layers, self.bom_path: None,
+                                 self.footprints_path: None})
+
+    def _poll_file_changes(self):
+        changes = self.file_watcher.collect()
+        if changes:
+            if self._load_thread is not None and self._load_thread.is_alive():
+                # Load PCB reads the new files anyway
+                logger.info("Ignoring file changes while loading")
+            else:
+                self.apply_file_changes(changes)
+        self.after(WATCH_POLL_MS, self._poll_file_changes)
+
+    def apply_file_changes(self, changes):
+        """
+        Bring the models and canvas in line with source files changed on disk,
+        keeping the current page, calibration and outline.
+        """
+        boards = None
+        for path, result, error in changes:
+            if error is not None:
+                logger.warning("Could not reload %s: %s", path, error)
+            elif result is not None:
+                boards = result
+
+        with self.metrics.stage("file_change"):
+            old_board = self.board
+            if boards is not None:
+                self.board = boards[self.side]
+                self.side_models = {side: {"board": board} for side, board in boards.items() if side != self.side}
+            self.load_footprint_library()
+            if self.board is not None:
+                self.refresh_components(old_board or self.board)
+
+    def refresh_components(self, old_board):
+        """
+        Rebuild the placement after a source change and update only the canvas
+        items of parts that were added, removed, moved or moved to another BOM
+        page. Parts are told apart by designator (and panel copy); old_board
+        is the board the drawn items were made from.
+        """
+        old_scene, old_tags = self.component_scene, self.component_page_tags
+        placement = self.current_placement()
+        if placement is None:
+            return
+        self.update_page_label()
+        if self.components_transform is None or old_scene is None:
+            # Nothing placed yet, the next Place Components uses the new models
+            return
+        self.check_bom()
+
+        scene = self.update_component_scene(placement)
+        self.sequence_pages(scene)
+        self.update_page_tags()
+        kept = {previous: entry for entry, previous in scene.match_entries(old_scene).items()}
+
+        drawn = {}
+        for previous, (level, items) in self._drawn.items():
+            entry = kept.get(previous)
+            designator = old_scene.designators[previous]
+            if (entry is not None and old_tags.get(designator) == self.component_page_tags.get(designator)
+                    and old_board.footprint(int(old_scene.rows[previous]))
+                    == self.board.footprint(int(scene.rows[entry]))):
+                drawn[entry] = (level, items)
+            else:
+                self.park_component_items(old_scene.keys[previous], items)
+                del self.all_components[old_scene.keys[previous]]
+        removed = len(self._drawn) - len(drawn)
+        self._drawn = drawn
+
+        if self.selected_component is not None and self.selected_component not in set(scene.keys):
+            self.selected_component = None
+        self.label_rotations = set(np.unique(scene.rotations).tolist())
+        self._components_version += 1
+        self.hide_page_frame()
+
+        # Only the entries without items are created, at the current page's state
+        self.render_components()
+        self.highlight_components()
+        self.metrics.set("plotted_components", len(self._drawn))
+        logger.info("Source change applied: %d items kept, %d removed, %d created",
+                    len(drawn), removed, len(self._drawn) - len(drawn))
+
+    def update_component_scene(self, placement):
+        # The scene lives in board mm, so moving, resizing or calibrating never invalidates it
+        key = (placement, self.panel, self.original_pcb_width, self.original_pcb_length)
+        if self._scene_key is None or not all(a is b or a == b for a, b in zip(key, self._scene_key)):
+            copies, copy_rotations, copy_matrices = self.panel_copies()
+            self.component_scene = ComponentScene(self.board, placement, copies, copy_rotations, copy_matrices)
+            self._scene_key = key
+        return self.component_scene
+
+    def render_components(self):
+        """
+        Bring the component items in line with the board transform and canvas size.
+        Items are created for entries coming on screen, deleted for those leaving
+        it and redrawn when their level of detail changes.
+        """
+        with self.metrics.stage("canvas"):
+            self.update_component_items()
+            self.draw_route()
+
+    def update_component_items(self):
+        scene = self.component_scene
+        if scene is None or not self.pcb_outline:
+            return
+
+        transform = self.board_transform()
+        moved = self.components_transform is None or not np.allclose(transform, self.components_transform)
+        vertices = transform_points(transform, scene.outlines)
+        label_positions = transform_points(transform, scene.centers)
+        boxes = bounding_boxes(vertices)
+        levels = level_of_detail(boxes, self.canvas.winfo_width(), self.canvas.winfo_height()).tolist()
+
+        for entry, (level, items) in list(self._drawn.items()):
+            if levels[entry] != level:
+                self.park_component_items(scene.keys[entry], items)
+                del self._drawn[entry]
+                del self.all_components[scene.keys[entry]]
+
+        for entry, level in enumerate(levels):
+            if not level:
+                continue
+            drawn = self._drawn.get(entry)
+            if drawn is None:
+                self.create_component_items(entry, level, vertices[entry], boxes[entry], label_positions[entry])
+            elif moved:
+                items = drawn[1]
+                if level == LOD_DOT:
+                    self.canvas.coords(items[0], *self.dot_box(boxes[entry]))
+                elif scene.is_circle[entry]:
+                    self.canvas.coords(items[0], *boxes[entry].tolist())
+                else:
+                    self.canvas.coords(items[0], *vertices[entry].ravel().tolist())
+                if level == LOD_FULL:
+                    self.canvas.coords(items[1], *label_positions[entry].tolist())
+
+        self.components_transform = transform
+
+        # Pre-rendered pages are drawn for one transform, go back to the live items until they catch up
+        if self._frame_shown and self.frame_view() != self.frame_cache.view:
+            self.hide_page_frame()
+            self.highlight_components()
+
+    def dot_box(self, box):
+        x = (box[0] + box[2]) / 2
+        y = (box[1] + box[3]) / 2
+        return x - 1, y - 1, x + 1, y + 1
+
+    def create_component_items(self, entry, level, vertices, box, label_position):
+        scene = self.component_scene
+        index = int(scene.rows[entry])
+        designator = self.board.designators[index]
+        key = scene.keys[entry]
+        rotation = float(scene.rotations[entry])
+
+        side_tag = "side_bottom" if self.board.layer == BOTTOM_LAYER else "side_top"
+        page_tags = tuple(self.component_page_tags.get(designator, ()))
+        tags = (side_tag, f"copy_{scene.copies[entry] + 1}", f"footprint_{self.board.footprint_ids[index]}",
+                f"rotation_{rotation:g}") + page_tags
+        if key == self.selected_component:
+            tags += ("selected",)
+
+        # New items start out in the state highlight_components left the others in
+        page = self.current_page
+        on_page = bool(page) and f"page_{page}" in page_tags
+        shown = not page or on_page
+        shape_state = "normal" if shown and self.shapes_var.get() else "hidden"
+        text_state = "normal" if shown and self.names_var.get() else "hidden"
+        if key == self.selected_component:
+            outline, width = "cyan", 3
+        elif on_page:
+            outline, width = "red", 2
+        else:
+            outline, width = "yellow", 1
+        fill_color = "white" if self.fill_var.get() else ""
+
+        x, y = label_position.tolist()
+        logger.debug("Plotting component %s: board (%s, %s), canvas (%.1f, %.1f), rotation %s",
+                     key, self.board.x[index], self.board.y[index], x, y, rotation)
+
+        shape_tags = ("component", "component_shape") + tags
+        shape_options = {"outline": outline, "width": width, "fill": fill_color, "state": shape_state}
+        if level == LOD_DOT:
+            kind, coords = "dot", self.dot_box(box)
+            shape_tags += ("component_dot",)
+        elif scene.is_circle[entry]:
+            kind, coords = "oval", box.tolist()
+        else:
+            kind, coords = "polygon", vertices.ravel().tolist()
+
+        # Labels only where the footprint is big enough on screen to read them
+        text_options = None
+        if level == LOD_FULL:
+            text_options = {"fill": "white", "state": text_state}
+            text_tags = ("component", "component_text") + tags
+            angle = self.label_angle(rotation)
+
+        items, reused = self.take_component_items(key, (kind, text_options is not None))
+        if items is None:
+            create = {"dot": self.canvas.create_rectangle, "oval": self.canvas.create_oval,
+                      "polygon": self.canvas.create_polygon}[kind]
+            items = (create(*coords, tags=shape_tags, **shape_options),)
+            if text_options is not None:
+                items += (self.create_rotated_text(x, y, designator, angle, tags=text_tags, **text_options),)
+            self._item_kinds[items[0]] = (kind, text_options is not None)
+        elif reused:
+            # Same part as in the previous placement: its style is reset by the page
+            # highlight that follows, only position, tags and label angle can differ
+            self.configure_component_item(items[0], coords, {"tags": shape_tags})
+            if text_options is not None:
+                self.configure_component_item(items[1], (x, y), {"tags": text_tags, "angle": angle})
+        else:
+            self.configure_component_item(items[0], coords, dict(shape_options, tags=shape_tags))
+            if text_options is not None:
+                self.configure_component_item(items[1], (x, y), dict(text_options, text=designator, tags=text_tags,
+                                                                     angle=angle))
+        self._item_options[items[0]] = {"tags": shape_tags}
+        if text_options is not None:
+            self._item_options[items[1]] = {"tags": text_tags, "angle": angle}
+
+        shape_item = items[0]
+        text_item = items[1] if text_options is not None else None
+
+        self._drawn[entry] = (level, items)
+        self.all_components[key] = {
+            'shape': shape_item,
+            'text': text_item
+        }
+
+    def release_component_items(self):
+        """
+        Hand the drawn items back by key, for the next placement to reuse.
+        """
+        self.canvas.dtag("selected", "selected")
+        scene = self.component_scene
+        if scene is not None:
+            for entry, (_, items) in self._drawn.items():
+                self._reusable[scene.keys[entry]] = items
+        self._drawn.clear()
+        self.all_components.clear()
+
+    def take_component_items(self, key, kind):
+        """
+        Items of kind for key: its own from the previous placement (reused=True),
+        otherwise parked ones, its own first. Returns (None, False) when new
+        items have to be created.
+        """
+        items = self._reusable.pop(key, None)
+        if items is not None:
+            if self._item_kinds[items[0]] == kind:
+                return items, True
+            self.park_component_items(key, items)
+
+        pool = self._item_pool.get(kind)
+        if pool:
+            items = pool.pop(key, None) or pool.popitem(last=False)[1]
+            return items, False
+        return None, False
+
+    def configure_component_item(self, item, coords, options):
+        # Only what differs from the item's last configuration is sent to Tk
+        previous = self._item_options.get(item, {})
+        changed = {name: value for name, value in options.items() if name not in previous or previous[name] != value}
+        self.canvas.coords(item, *coords)
+        if changed:
+            self.canvas.itemconfig(item, **changed)
+
+    def park_component_items(self, key, items):
+        """
+        Hide items that are no longer needed and keep them for reuse.
+        """
+        for item in items:
+            self.canvas.itemconfig(item, state="hidden", tags=("component_pool",))
+            self._item_options[item] = {"tags": ("component_pool",)}
+        self._item_pool.setdefault(self._item_kinds[items[0]], OrderedDict())[key] = items
+
+    def park_reusable_items(self):
+        # Parts removed from the board or now off screen
+        for key, items in self._reusable.items():
+            self.park_component_items(key, items)
+        self._reusable.clear()
+
+    def forget_items(self, items):
+        self._item_kinds.pop(items[0], None)
+        for item in items:
+            self._item_options.pop(item, None)
+
+    def component_at(self, x_mm, y_mm):
+        """
+        Return (all_components key, board row) of the part under a board mm point, or None.
+        """
+        scene = self.component_scene
+        if scene is None or self.components_transform is None:
+            return None
+        entry = scene.index.query_point(x_mm, y_mm)
+        if entry is None:
+            return None
+        return scene.keys[entry], int(scene.rows[entry])
+
+    def on_canvas_click(self, event):
+        if self._calibration_clicks is not None:
+            self.add_calibration_corner(event)
+            return
+
+        # Clicks on the outline and calibration anchors belong to their own handlers
+        current_tags = self.canvas.gettags("current")
+        if any(tag in ("pcb_anchor", "pcb_anchor_origin", "calibration_anchor") for tag in current_tags):
+            return
+
+        if not self.pcb_outline:
+            return
+        x_mm, y_mm = transform_points(np.linalg.inv(self.board_transform()), [event.x, event.y]).tolist()
+        hit = self.component_at(x_mm, y_mm)
+        self.select_component(hit[0] if hit else None)
+
+    def select_component(self, key):
+        # Put the previous selection back to its page highlight
+        previous = self.all_components.get(self.selected_component)
+        if previous:
+            on_page = self.current_page and f"page_{self.current_page}" in self.canvas.gettags(previous['shape'])
+            self.canvas.itemconfig(previous['shape'], outline='red' if on_page else 'yellow', width=2 if on_page else 1)
+        self.canvas.dtag("selected", "selected")
+
+        self.selected_component = key if key in self.all_components else None
+        if self.selected_component is None:
+            self.status_label.config(text="")
+            return
+
+        items = self.all_components[self.selected_component]
+        self.canvas.addtag_withtag("selected", items['shape'])
+        if items['text'] is not None:
+            self.canvas.addtag_withtag("selected", items['text'])
+        self.canvas.itemconfig(items['shape'], outline='cyan', width=3)
+
+        index = self.board.index_of(self.selected_component.split('/')[0])
+        self.status_label.config(text=f"Selected {self.selected_component}: {self.board.comments[index]}, "
+                                      f"{self.board.footprint(index)}")
+
+    def board_transform(self):
+        mirror = self.side == BOTTOM_LAYER
+        if self.calibration is not None:
+            if mirror:
+                return self.calibration.matrix @ mirror_matrix(self.calibration.board_width)
+            return self.calibration.matrix
+        outline_width, outline_length = self.outline_size()
+        return self.board_pose.matrix(outline_width, outline_length, mirror)
+
+    def label_angle(self, rotation):
+        # Text angles are anticlockwise on screen while the board turns clockwise,
+        # a mirrored side turns its parts the other way
+        if self.side == BOTTOM_LAYER:
+            rotation = 180 - rotation
+        return float(upright_text_angle((rotation - self.board_rotation) % 360))
 
     def create_rotated_text(self, x, y, text, angle, **kwargs):
         text_item = self.canvas.create_text(x, y, text=text, angle=angle, **kwargs)
         return text_item
 
     def read_pcb_data(self):
-        if not self.pcbdata_path or not os.path.exists(self.pcbdata_path):
-            messagebox.showerror("Error", "PCB data file not found. Please set the correct path.")
-            return None
-        
-        pcb_data = []
+        # One shared Board, only re-parsed when its source file changes on disk.
+        # Falls back to an existing pcbdata.csv when Load PCB has not been used.
         try:
-            with open(self.pcbdata_path, 'r') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    pcb_data.append(row)
-            if not pcb_data:
+            if self.board is not None:
+                self.board = self.board.reload_if_changed()
+                return self.board
+
+            if not self.pcbdata_path or not os.path.exists(self.pcbdata_path):
+                messagebox.showerror("Error", "PCB data not loaded. Please press Load PCB first.")
+                return None
+
+            board = Board.load(self.pcbdata_path, layer=self.side)
+            if not board:
                 raise ValueError("PCB data is empty")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to read PCB data: {str(e)}")
             return None
-        return pcb_data
-
-    def read_footprints(self):
-        if not self.footprints_path or not os.path.exists(self.footprints_path):
-            messagebox.showerror("Error", "Footprints file not found. Please set the correct path.")
-            return None
-        
-        footprints = {}
+        self.board = board
+        return board
+
+    def load_footprint_library(self):
+        """
+        The footprint library, read once; re-read only if footprints.csv was
+        changed outside the GUI while there are no unsaved edits.
+        """
+        library = self.footprint_library
+        if library is not None and (library.dirty or not library.is_stale()):
+            return library
         try:
-            with open(self.footprints_path, 'r') as f:
-                reader = csv.reader(f)
-                next(reader)  # Skip header
-                for row in reader:
-                    if len(row) < 6:
-                        print(f"Warning: Invalid row format: {row}")
-                        continue
-                    name = row[0]
-                    footprints[name] = {
-                        'Shape': row[1],
-                        'Width': row[2],
-                        'Height': row[3],
-                        'CenterX': row[4],
-                        'CenterY': row[5]
-                    }
-            if not footprints:
-                raise ValueError("Footprints data is empty")
+            self.footprint_library = FootprintLibrary.load(self.footprints_path)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to read footprints: {str(e)}")
             return None
-        return footprints
+        if library is not None:
+            # Keep the placement check in step with the replaced library
+            self.footprint_library.version = library.version + 1
+        if self.footprint_library.dirty:
+            self.schedule_footprint_save()
+        return self.footprint_library
+
+    @property
+    def footprints(self):
+        return self.footprint_library.footprints if self.footprint_library is not None else None
+
+    def read_footprints(self):
+        library = self.load_footprint_library()
+        if library is None:
+            return None
+        if not library.footprints:
+            if not self.footprints_path or not os.path.exists(self.footprints_path):
+                messagebox.showerror("Error", "Footprints file not found. Please set the correct path.")
+            else:
+                messagebox.showerror("Error", "Failed to read footprints: Footprints data is empty")
+            return None
+        return library.footprints
 
     def debug_print(self):
-        print(f"PCB Outline: {self.pcb_outline}")
-        print(f"PCB Dimensions: {self.pcb_width}mm x {self.pcb_length}mm")
-        
-        pcb_data = self.read_pcb_data()
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        logger.debug("PCB outline: %s, dimensions: %smm x %smm", self.pcb_outline, self.pcb_width, self.pcb_length)
+
+        # Uses the already loaded models, nothing is read from disk here
+        pcb_data = self.board
         if pcb_data:
-            print("First 5 components:")
-            for component in pcb_data[:5]:
-                print(f"  {component}")
+            for index in range(min(5, len(pcb_data))):
+                logger.debug("Component %d: %s", index, pcb_data.component(index))
         else:
-            print("No PCB data available")
+            logger.debug("No PCB data available")
 
-        footprints = self.read_footprints()
+        footprints = self.footprints
         if footprints:
-            print("First 5 footprints:")
             for name, data in list(footprints.items())[:5]:
-                print(f"  {name}: {data}")
+                logger.debug("Footprint %s: %s", name, data)
         else:
-            print("No footprint data available")
+            logger.debug("No footprint data available")
+
+    def show_metrics(self):
+        summary = self.metrics.summary() or "Nothing measured yet."
+        if messagebox.askyesno("Metrics", summary + "\n\nSave to metrics.json?"):
+            self.metrics.dump(self.metrics_path)
+            messagebox.showinfo("Metrics", f"Metrics saved to {self.metrics_path}")
 
     def rotate_pcb(self):
         if not self.pcb_outline:
             messagebox.showerror("Error", "Please place the PCB first.")
             return
+        if self.calibration is not None:
+            messagebox.showerror("Error", "The board is calibrated, click its corners again to change the orientation.")
+            return
 
-        # Calculate the center of the PCB
-        center_x = (self.pcb_outline[0] + self.pcb_outline[2]) / 2
-        center_y = (self.pcb_outline[1] + self.pcb_outline[3]) / 2
-
-        # Rotate the PCB outline
-        self.canvas.delete("pcb")
-        rotated_outline = self.rotate_points(self.pcb_outline, center_x, center_y, 90)
-        self.pcb_rect = self.canvas.create_polygon(rotated_outline, outline="green", width=2, fill="", tags="pcb")
+        try:
+            step = float(self.rotation_step_var.get())
+        except ValueError:
+            messagebox.showerror("Error", "The rotation step must be a number of degrees.")
+            return
 
-        # Rotate the PCB anchors
-        for anchor in self.pcb_anchors:
-            self.canvas.delete(anchor)
-        self.pcb_anchors = []
-        for i in range(0, len(rotated_outline), 2):
-            x, y = rotated_outline[i], rotated_outline[i+1]
-            anchor = self.canvas.create_oval(x-5, y-5, x+5, y+5, fill="blue", outline="blue", tags="pcb_anchor")
-            self.pcb_anchors.append(anchor)
-
-        # Rotate all components
-        for item in self.canvas.find_withtag("component"):
-            item_type = self.canvas.type(item)
-            
-            if item_type == "polygon":  # Rotated rectangle
-                coords = self.canvas.coords(item)
-                rotated_coords = self.rotate_points(coords, center_x, center_y, 90)
-                self.canvas.coords(item, *rotated_coords)
-            elif item_type == "oval":  # Circle
-                coords = self.canvas.coords(item)
-                x1, y1, x2, y2 = coords
-                center_x_item = (x1 + x2) / 2
-                center_y_item = (y1 + y2) / 2
-                rotated_center = self.rotate_point(center_x_item, center_y_item, center_x, center_y, 90)
-                radius = (x2 - x1) / 2
-                self.canvas.coords(item, rotated_center[0]-radius, rotated_center[1]-radius,
-                                 rotated_center[0]+radius, rotated_center[1]+radius)
-            elif item_type == "text":  # Component designator
-                x, y = self.canvas.coords(item)
-                rotated_point = self.rotate_point(x, y, center_x, center_y, 90)                
-                self.canvas.coords(item, *rotated_point)
-                current_angle = float(self.canvas.itemcget(item, "angle"))
-                new_angle = (current_angle + 90) % 360
-                self.canvas.itemconfig(item, angle=new_angle)
-                self.adjust_text_orientation(item)
-
-        # Update PCB outline
-        self.pcb_outline = rotated_outline
-
-        # Swap PCB width and length
-        self.pcb_width, self.pcb_length = self.pcb_length, self.pcb_width
+        # Only the pose turns, about the outline center; outline and components are projected again
+        self.board_pose.rotate(step)
+        self.update_pcb_items()
+        self.render_components()
 
-        # Update coordinates display
-        self.update_coordinates(None)  # Pass None instead of tk.Event()
-
-    def adjust_text_orientation(self, text_item):
-        angle = float(self.canvas.itemcget(text_item, "angle"))
-        if 90 < angle <= 270:
-            # Flip the text if it's upside down
-            new_angle = (angle + 180) % 360
-            self.canvas.itemconfig(text_item, angle=new_angle)
-
-    def rotate_points(self, points, center_x, center_y, angle):
-        rotated_points = []
-        for i in range(0, len(points), 2):
-            x, y = points[i], points[i+1]
-            rotated_point = self.rotate_point(x, y, center_x, center_y, angle)
-            rotated_points.extend(rotated_point)
-        return rotated_points
-
-    def rotate_point(self, x, y, center_x, center_y, angle):
-        angle_rad = math.radians(angle)
-        cos_val = math.cos(angle_rad)
-        sin_val = math.sin(angle_rad)
-        dx = x - center_x
-        dy = y - center_y
-        new_x = center_x + dx * cos_val - dy * sin_val
-        new_y = center_y + dx * sin_val + dy * cos_val
-        return (new_x, new_y)
+        # Labels are re-angled once per distinct component rotation
+        for component_rotation in self.label_rotations:
+            self.canvas.itemconfig(f"rotation_{component_rotation:g}&&component_text",
+                                   angle=self.label_angle(component_rotation))
 
     def update_coordinates(self, event):
         if self.pcb_outline:
-            # Calculate scale (pixels per mm)
-            pcb_width_px = self.pcb_outline[2] - self.pcb_outline[0]
-            scale = pcb_width_px / self.pcb_width
-
-            # Calculate PCB origin (bottom-left corner)
-            origin_x = self.pcb_outline[0]
-            origin_y = self.pcb_outline[3]
-
-            # Calculate mouse position relative to PCB origin
-            x_mm = (event.x - origin_x) / scale
-            y_mm = (origin_y - event.y) / scale
+            # Map the mouse position back to board mm through the inverse board transform
+            inverse = np.linalg.inv(self.board_transform())
+            x_mm, y_mm = transform_points(inverse, [event.x, event.y]).tolist()
 
             # Update labels
             self.x_coord_label.config(text=f"X: {x_mm:.2f} mm")
             self.y_coord_label.config(text=f"Y: {y_mm:.2f} mm")
+
+            # Name the part under the pointer from the outline index, no canvas item search
+            hit = self.component_at(x_mm, y_mm)
+            if hit:
+                key, index = hit
+                text = f"{key}  {self.board.comments[index]}  {self.board.footprint(index)}"
+            else:
+                text = ""
+            if self.hover_label.cget("text") != text:
+                self.hover_label.config(text=text)
         else:
             # If PCB is not placed, show canvas coordinates
             self.x_coord_label.config(text=f"X: {event.x} px")
@@ -805,6 +1943,10 @@ class ProjectionGUI(tk.Tk):
         # Update the position of the coordinate frame
         self.coord_frame.place(relx=1, rely=1, anchor="se", x=-10, y=-10)
 
+        # A bigger or smaller canvas shows a different set of components
+        if self.components_transform is not None:
+            self.render_scheduler.schedule("components", self.render_components)
+
     def previous_page(self):
         if self.current_page > 0:
             self.current_page -= 1
@@ -818,69 +1960,191 @@ class ProjectionGUI(tk.Tk):
             self.highlight_components()
 
     def highlight_components(self):
-        # Hide all components first
-        for component in self.all_components.values():
-            self.canvas.itemconfig(component['shape'], state='hidden')
-            self.canvas.itemconfig(component['text'], state='hidden')
+        with self.metrics.stage("highlight"):
+            self.show_current_page()
+            self.draw_route()
 
-        if self.current_page == 0:
-            # Show all components for the setup page
-            for component in self.all_components.values():
-                self.canvas.itemconfig(component['shape'], state='normal', outline='yellow', width=1)
-                self.canvas.itemconfig(component['text'], state='normal')
+    def show_current_page(self):
+        page = self.current_page
+        if self.show_page_frame(page):
             return
+        self.hide_page_frame()
+
+        # Items are tagged per BOM page, so a flip only touches the old and new page tags
+        previous = self.shown_page
 
-        # Show and highlight components for the current page
-        current_row = self.bom_data[self.current_page - 1]
-        designators = current_row.get('Designator', '').split(',')
-        for designator in designators:
-            designator = designator.strip()
-            if designator in self.all_components:
-                component = self.all_components[designator]
-                self.canvas.itemconfig(component['shape'], state='normal', outline='red', width=2)
-                self.canvas.itemconfig(component['text'], state='normal')
+        shape_state = 'normal' if self.shapes_var.get() else 'hidden'
+        text_state = 'normal' if self.names_var.get() else 'hidden'
+
+        if page == 0:
+            # Show all components for the setup page
+            self.canvas.itemconfig("component_shape", state=shape_state, outline='yellow', width=1)
+            self.canvas.itemconfig("component_text", state=text_state)
+        else:
+            if previous is None or previous == 0:
+                # Coming from the setup page, hide everything once
+                self.canvas.itemconfig("component", state='hidden')
+            elif previous != page:
+                self.canvas.itemconfig(f"page_{previous}", state='hidden')
+
+            # Show and highlight components for the current page
+            self.canvas.itemconfig(f"page_{page}&&component_shape", state=shape_state, outline='red', width=2)
+            self.canvas.itemconfig(f"page_{page}&&component_text", state=text_state)
+
+        # Keep the clicked part marked across page flips
+        if self.selected_component is not None:
+            self.canvas.itemconfig("selected&&component_shape", outline='cyan', width=3)
+
+        self.shown_page = page
+
+    def frame_view(self):
+        # Everything a pre-rendered page depends on besides the page itself
+        return (self.board_transform().tobytes(), self.canvas.winfo_width(), self.canvas.winfo_height(),
+                self.shapes_var.get(), self.names_var.get(), self.fill_var.get(), self.board_rotation,
+                self._components_version)
+
+    def show_page_frame(self, page):
+        """
+        Show page from the frame cache, prefetching it and its neighbours.
+        Returns False when the live canvas items have to be used instead.
+        """
+        if not self.prerender_var.get() or not page or self.component_scene is None or self.components_transform is None:
+            return False
+
+        self.frame_cache.set_view(self.frame_view())
+        self.prefetch_page_frames(page)
+        frame = self.frame_cache.get(page)
+        if frame is None:
+            return False
+
+        if self.frame_item is None:
+            self.frame_item = self.canvas.create_image(0, 0, anchor="nw", image=frame, tags="page_frame")
+        else:
+            self.canvas.itemconfig(self.frame_item, image=frame, state="normal")
+
+        if not self._frame_shown:
+            # The live items stay hidden under the frame, the anchors stay on top to be dragged
+            self.canvas.itemconfig("component", state="hidden")
+            self.canvas.tag_raise(self.frame_item)
+            for tag in ("route", "pcb_anchor_origin", "pcb_anchor", "calibration_anchor"):
+                self.canvas.tag_raise(tag)
+            self._frame_shown = True
+            self.shown_page = None
+        return True
+
+    def hide_page_frame(self):
+        if self._frame_shown:
+            self.canvas.itemconfig(self.frame_item, state="hidden")
+            self._frame_shown = False
+
+    def prefetch_page_frames(self, page):
+        for neighbour in (page, page + 1, page - 1):
+            if 0 < neighbour < self.total_pages:
+                self.frame_cache.request(neighbour, lambda neighbour=neighbour: self.page_frame_job(neighbour))
+
+        if not self._frames_polling and self.frame_cache.pending:
+            self._frames_polling = True
+            self.after(50, self._poll_page_frames)
+
+    def _poll_page_frames(self):
+        # PhotoImages are made here, on the Tk thread
+        added = self.frame_cache.collect(ImageTk.PhotoImage)
+        if self.current_page in added and not self._frame_shown:
+            self.highlight_components()
+
+        if self.frame_cache.pending:
+            self.after(50, self._poll_page_frames)
+        else:
+            self._frames_polling = False
+
+    def page_frame_job(self, page):
+        # Same geometry and level of detail as the live items, drawn for the page's components only
+        scene = self.component_scene
+        entries = scene.entries_of(self.bom_pages[self.page_line(page)])
+        width, height = self.canvas.winfo_width(), self.canvas.winfo_height()
+        transform = self.board_transform()
+        vertices = transform_points(transform, scene.outlines[entries])
+        label_positions = transform_points(transform, scene.centers[entries])
+        boxes = bounding_boxes(vertices)
+        levels = level_of_detail(boxes, width, height).tolist()
+
+        shapes = []
+        labels = []
+        for row, (entry, level) in enumerate(zip(entries, levels)):
+            if not level:
+                continue
+            if self.shapes_var.get():
+                if level == LOD_DOT:
+                    x1, y1, x2, y2 = self.dot_box(boxes[row])
+                    shapes.append((False, [x1, y1, x2, y1, x2, y2, x1, y2]))
+                elif scene.is_circle[entry]:
+                    shapes.append((True, boxes[row].tolist()))
+                else:
+                    shapes.append((False, vertices[row].ravel().tolist()))
+            if level == LOD_FULL and self.names_var.get():
+                angle = self.label_angle(float(scene.rotations[entry]))
+                labels.append((*label_positions[row].tolist(), scene.designators[entry], angle))
+
+        return {"width": width, "height": height, "shapes": shapes, "labels": labels, "fill": self.fill_var.get()}
 
     def load_bom_data(self):
         if not hasattr(self, 'pcbdata_path') or not self.pcbdata_path:
             messagebox.showwarning("Warning", "PCB data path not set. BOM data cannot be loaded.")
             return
 
-        bom_path = os.path.join(os.path.dirname(self.pcbdata_path), "BOM.csv")
+        bom_path = self.bom_path
         try:
-            with open(bom_path, 'r') as f:
-                reader = csv.DictReader(f)
-                self.bom_data = list(reader)
+            # Decoded once with encoding detection, designator ranges expanded
+            self.bom = Bom.load(bom_path)
+            self.bom_data = self.bom.lines
+            self.bom_pages = self.bom.pages
             self.total_pages = len(self.bom_data) + 1  # +1 for the setup page
+            self.current_page = min(self.current_page, self.total_pages - 1)
             self.update_page_label()
         except FileNotFoundError:
             messagebox.showerror("Error", f"BOM.csv not found at {bom_path}")
 
-    def update_page_label(self):
-        self.page_label.config(text=f"Page {self.current_page + 1} of {self.total_pages}")
-
-    def rescale_components(self):
-        if not self.pcb_outline:
+    def check_bom(self):
+        """
+        Cross-check the BOM against the pick-and-place data and report any
+        differences, once per BOM and board, before components are placed.
+        """
+        if self.bom is None:
+            self.load_bom_data()
+        if self.bom is None or self.board is None:
+            return
+        # The BOM covers both sides of the board
+        self.load_side_boards()
+        boards = self.side_boards()
+        key = (self.bom,) + tuple(boards.get(side) for side in LAYERS)
+        if self._bom_report_key is not None and all(a is b for a, b in zip(key, self._bom_report_key)):
             return
+        self._bom_report_key = key
 
-        old_width = self.pcb_outline[2] - self.pcb_outline[0]
-        old_height = self.pcb_outline[3] - self.pcb_outline[1]
-        scale_x = self.pcb_width / old_width
-        scale_y = self.pcb_length / old_height
+        with self.metrics.stage("bom_check"):
+            report = cross_check(self.bom, [designator for board in boards.values() for designator in board.designators])
+        text = format_report(report)
+        if text:
+            logger.warning("BOM check:\n%s", text)
+            messagebox.showwarning("BOM check", text)
 
-        origin_x, origin_y = self.pcb_outline[0], self.pcb_outline[3]  # Bottom-left corner
+    def update_page_label(self):
+        side = " (bottom)" if self.side == BOTTOM_LAYER else ""
+        line = ""
+        if 0 < self.current_page <= len(self.bom_pages) and self.page_line(self.current_page) != self.current_page - 1:
+            line = f", BOM line {self.page_line(self.current_page) + 1}"
+        self.page_label.config(text=f"Page {self.current_page + 1} of {self.total_pages}{line}{side}")
 
-        for item in self.canvas.find_withtag("component"):
-            coords = self.canvas.coords(item)
-            new_coords = []
-            for i, coord in enumerate(coords):
-                if i % 2 == 0:  # X coordinate
-                    new_coords.append(origin_x + (coord - origin_x) * scale_x)
-                else:  # Y coordinate
-                    new_coords.append(origin_y + (coord - origin_y) * scale_y)
-            self.canvas.coords(item, *new_coords)
+    def rescale_components(self):
+        if not self.pcb_outline or self.components_transform is None:
+            return
 
-        self.canvas.update()
+        # Items are recomputed from the board mm scene, created or dropped as they cross the canvas edge
+        self.render_components()
 
 if __name__ == "__main__":
+    # BEAMBOM_LOG_LEVEL=DEBUG also logs every plotted component and counts the canvas Tk calls
+    logging.basicConfig(level=os.environ.get("BEAMBOM_LOG_LEVEL", "INFO").upper(),
+                        format="%(asctime)s %(levelname)s %(name)s: %(message)s")
     app = ProjectionGUI()
     app.mainloop()
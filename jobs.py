@@ -0,0 +1,187 @@
+import json
+import logging
+import os
+import sys
+from array import array
+from collections import OrderedDict
+
+import numpy as np
+
+from project_cache import CACHE_FILE
+
+logger = logging.getLogger(__name__)
+
+JOBS_FILE = "jobs.json"
+
+# Parsed models kept for jobs that are not active, the least recently used go first
+DEFAULT_MEMORY_BUDGET = 256 * 1024 * 1024
+
+# Containers larger than this are sized from an even sample of their items
+SIZE_SAMPLE = 64
+
+
+def estimate_size(value, seen=None):
+    """
+    Rough number of bytes held by value and everything it refers to.
+    NumPy arrays and typed arrays count their buffers, big containers are
+    extrapolated from a sample so sizing a 100k part board stays cheap.
+    """
+    if seen is None:
+        seen = set()
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, array):
+        return sys.getsizeof(value)
+    if isinstance(value, dict):
+        items = list(value.keys()) + list(value.values())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        items = list(value)
+    elif hasattr(value, '__dict__') and not isinstance(value, type):
+        items = list(vars(value).values())
+    else:
+        return sys.getsizeof(value)
+
+    size = sys.getsizeof(value)
+    if len(items) > SIZE_SAMPLE:
+        step = len(items) / SIZE_SAMPLE
+        sample = [items[int(i * step)] for i in range(SIZE_SAMPLE)]
+        return size + int(sum(estimate_size(item, seen) for item in sample) * len(items) / SIZE_SAMPLE)
+    return size + sum(estimate_size(item, seen) for item in items)
+
+
+class Job:
+    """
+    One board variant: a pick-and-place file and the BOM, calibrations and
+    project cache next to it. Footprints come from the job directory when it
+    has its own footprints.csv, otherwise from the shared one.
+
+    view holds the small per-job GUI state (outline, panel, calibration,
+    current page) and is kept even when the parsed model is evicted.
+    """
+
+    def __init__(self, name, inputdata_path, footprints_path):
+        self.name = name
+        self.inputdata_path = os.path.abspath(inputdata_path)
+        directory = os.path.dirname(self.inputdata_path)
+        own_footprints = os.path.join(directory, "footprints.csv")
+        self.footprints_path = own_footprints if os.path.exists(own_footprints) else footprints_path
+        self.pcbdata_path = os.path.join(directory, "pcbdata.csv")
+        self.bom_path = os.path.join(directory, "BOM.csv")
+        self.calibration_path = os.path.join(directory, "calibration.json")
+        self.project_cache_path = os.path.join(directory, CACHE_FILE)
+        self.metrics_path = os.path.join(directory, "metrics.json")
+        self.view = {}
+
+    @property
+    def paths(self):
+        return {"inputdata_path": self.inputdata_path, "pcbdata_path": self.pcbdata_path,
+                "footprints_path": self.footprints_path, "bom_path": self.bom_path,
+                "calibration_path": self.calibration_path, "project_cache_path": self.project_cache_path,
+                "metrics_path": self.metrics_path}
+
+    def to_dict(self):
+        return {"name": self.name, "inputdata_path": self.inputdata_path, "footprints_path": self.footprints_path}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["name"], data["inputdata_path"], data["footprints_path"])
+
+
+class JobManager:
+    """
+    The jobs on the bench and an LRU cache of their parsed and matched models.
+
+    store() keeps a job's model when it stops being active; models are
+    evicted least recently used first once their estimated size is over the
+    memory budget. An evicted job reopens from its project cache on disk.
+    """
+
+    def __init__(self, budget=DEFAULT_MEMORY_BUDGET):
+        self.budget = budget
+        self.jobs = OrderedDict()
+        self.active = None
+        self._models = OrderedDict()  # name -> (model, estimated bytes)
+
+    def __len__(self):
+        return len(self.jobs)
+
+    def __contains__(self, name):
+        return name in self.jobs
+
+    def get(self, name):
+        return self.jobs.get(name)
+
+    def add(self, job):
+        if job.name in self.jobs:
+            raise ValueError(f"A job named '{job.name}' already exists")
+        self.jobs[job.name] = job
+        return job
+
+    def unique_name(self, name):
+        candidate, number = name, 2
+        while candidate in self.jobs:
+            candidate, number = f"{name} ({number})", number + 1
+        return candidate
+
+    def remove(self, name):
+        self.jobs.pop(name, None)
+        self._models.pop(name, None)
+        if self.active == name:
+            self.active = None
+
+    def activate(self, name):
+        self.active = name
+        return self.jobs[name]
+
+    @property
+    def memory_used(self):
+        return sum(size for _, size in self._models.values())
+
+    def is_cached(self, name):
+        return name in self._models
+
+    def store(self, name, model):
+        """
+        Cache model for job name as the most recently used, then evict down to the budget.
+        """
+        size = estimate_size(model)
+        self._models[name] = (model, size)
+        self._models.move_to_end(name)
+        while len(self._models) > 1 and self.memory_used > self.budget:
+            evicted, (_, evicted_size) = self._models.popitem(last=False)
+            logger.info("Evicted job %s (%.1f MB) from the model cache", evicted, evicted_size / 1e6)
+        return size
+
+    def take(self, name):
+        """
+        Remove and return the cached model of job name, or None if it is not cached.
+        """
+        entry = self._models.pop(name, None)
+        return entry[0] if entry is not None else None
+
+    @classmethod
+    def load(cls, path, budget=DEFAULT_MEMORY_BUDGET):
+        manager = cls(budget)
+        if not os.path.exists(path):
+            return manager
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            for job_data in data.get("jobs", []):
+                manager.add(Job.from_dict(job_data))
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning("Ignoring unreadable job list %s: %s", path, e)
+            return cls(budget)
+        if data.get("active") in manager.jobs:
+            manager.active = data["active"]
+        return manager
+
+    def save(self, path):
+        temp_path = path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({"active": self.active, "jobs": [job.to_dict() for job in self.jobs.values()]}, f, indent=2)
+        os.replace(temp_path, path)
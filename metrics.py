@@ -0,0 +1,84 @@
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+
+class Metrics:
+    """
+    Stage timings and counters collected while the GUI runs.
+
+    stage() times a block and keeps the call count, total, last and worst
+    duration per stage name; counters are plain numbers that are either
+    incremented with count() or overwritten with set().
+    """
+
+    def __init__(self):
+        self.timings = {}
+        self.counters = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                timing = self.timings.setdefault(name, {"calls": 0, "total": 0.0, "last": 0.0, "max": 0.0})
+                timing["calls"] += 1
+                timing["total"] += elapsed
+                timing["last"] = elapsed
+                timing["max"] = max(timing["max"], elapsed)
+            logger.debug("%s took %.1f ms", name, elapsed * 1000)
+
+    def count(self, name, amount=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def set(self, name, value):
+        with self._lock:
+            self.counters[name] = value
+
+    def snapshot(self):
+        with self._lock:
+            return {"timings": {name: dict(timing) for name, timing in self.timings.items()},
+                    "counters": dict(self.counters)}
+
+    def summary(self):
+        """
+        One line per stage and counter, for showing in a dialog.
+        """
+        snapshot = self.snapshot()
+        lines = [f"{name}: last {timing['last'] * 1000:.1f} ms, max {timing['max'] * 1000:.1f} ms, "
+                 f"{timing['calls']} calls"
+                 for name, timing in snapshot["timings"].items()]
+        lines += [f"{name}: {value}" for name, value in snapshot["counters"].items()]
+        return "\n".join(lines)
+
+    def dump(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.snapshot(), f, indent=2)
+
+
+class TkCallCounter:
+    """
+    Stands in for a widget's Tcl interpreter and counts the commands sent
+    through it. Every tkinter widget method ends up in interpreter.call().
+    """
+
+    def __init__(self, interpreter, metrics, counter="tk_calls"):
+        self._interpreter = interpreter
+        self._metrics = metrics
+        self._counter = counter
+
+    def call(self, *args):
+        self._metrics.count(self._counter)
+        return self._interpreter.call(*args)
+
+    def __getattr__(self, name):
+        return getattr(self._interpreter, name)
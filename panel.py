@@ -0,0 +1,50 @@
+import numpy as np
+
+from pcb_utils import rotation_matrix, translation_matrix
+
+
+class Panel:
+    """
+    Step-and-repeat layout of identical boards. Copies are numbered row by
+    row from the bottom-left board, starting at 0. Each copy can be turned
+    about its own center (degrees, anticlockwise) or skipped.
+    """
+
+    def __init__(self, rows, columns, pitch_x, pitch_y, rotations=None, skip=()):
+        self.rows = rows
+        self.columns = columns
+        self.pitch_x = pitch_x
+        self.pitch_y = pitch_y
+        self.rotations = list(rotations or [])
+        self.skip = set(skip)
+
+    def __len__(self):
+        return len(self.copies())
+
+    def copies(self):
+        return [copy for copy in range(self.rows * self.columns) if copy not in self.skip]
+
+    def copy_rotation(self, copy):
+        return self.rotations[copy] % 360 if copy < len(self.rotations) else 0.0
+
+    def size(self, board_width, board_length):
+        """
+        Width and length of the whole panel in mm.
+        """
+        return ((self.columns - 1) * self.pitch_x + board_width,
+                (self.rows - 1) * self.pitch_y + board_length)
+
+    def copy_matrix(self, copy, board_width, board_length):
+        """
+        Matrix taking board mm of one board to panel mm for the given copy.
+        """
+        row, column = divmod(copy, self.columns)
+        turn = rotation_matrix(self.copy_rotation(copy), board_width / 2, board_length / 2)
+        return translation_matrix(column * self.pitch_x, row * self.pitch_y) @ turn
+
+    def copy_matrices(self, board_width, board_length):
+        """
+        C x 3 x 3 stack of copy matrices, in the order of copies(), 0 x 3 x 3 if every copy is skipped.
+        """
+        matrices = [self.copy_matrix(copy, board_width, board_length) for copy in self.copies()]
+        return np.stack(matrices) if matrices else np.empty((0, 3, 3))
@@ -1,25 +1,109 @@
 import math
+import numpy as np
 
-def calculate_scale_factor(original_width, original_length, current_width, current_length):
+# Batch geometry: every transform below is a 3x3 matrix acting on homogeneous
+# (x, y, 1) points, so a whole board is moved with a single matrix product.
+
+def translation_matrix(dx, dy):
+    """
+    Matrix translating points by (dx, dy).
+    """
+    return np.array([[1.0, 0.0, dx], [0.0, 1.0, dy], [0.0, 0.0, 1.0]])
+
+def scale_matrix(scale_x, scale_y):
+    """
+    Matrix scaling points about the origin.
+    """
+    return np.array([[scale_x, 0.0, 0.0], [0.0, scale_y, 0.0], [0.0, 0.0, 1.0]])
+
+def rotation_matrix(angle, center_x=0.0, center_y=0.0):
+    """
+    Matrix rotating points by angle degrees about (center_x, center_y).
+    Positive angles turn clockwise on the canvas, where Y points down.
+    """
+    angle_rad = math.radians(angle)
+    cos_val = math.cos(angle_rad)
+    sin_val = math.sin(angle_rad)
+    rotation = np.array([[cos_val, -sin_val, 0.0], [sin_val, cos_val, 0.0], [0.0, 0.0, 1.0]])
+    return translation_matrix(center_x, center_y) @ rotation @ translation_matrix(-center_x, -center_y)
+
+def mirror_matrix(board_width):
+    """
+    Matrix flipping board mm left to right, x -> board_width - x, for a board
+    turned over to assemble its bottom side.
+    """
+    return np.array([[-1.0, 0.0, board_width], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]])
+
+def transform_points(matrix, points):
+    """
+    Apply a 3x3 matrix to an (..., 2) array of points.
+    """
+    points = np.asarray(points, dtype=float)
+    transformed = points @ matrix[:2, :2].T + matrix[:2, 2]
+    if matrix[2, 0] or matrix[2, 1]:
+        # Projective matrix, divide by the homogeneous coordinate
+        w = points @ matrix[2, :2] + matrix[2, 2]
+        transformed /= w[..., np.newaxis]
+    return transformed
+
+def footprint_outlines(centers, rotations, extents):
+    """
+    Corner vertices of N rotated footprint rectangles in board space.
+    centers and extents (width, height) are N x 2, rotations N degrees.
+    Returns an N x 4 x 2 array.
+    """
+    centers = np.asarray(centers, dtype=float).reshape(-1, 2)
+    half = np.asarray(extents, dtype=float).reshape(-1, 2) / 2
+    corners = np.array([[-1.0, -1.0], [1.0, -1.0], [1.0, 1.0], [-1.0, 1.0]])
+    local = corners[np.newaxis, :, :] * half[:, np.newaxis, :]
+
+    angles = np.radians(np.asarray(rotations, dtype=float))
+    cos_val = np.cos(angles)[:, np.newaxis]
+    sin_val = np.sin(angles)[:, np.newaxis]
+    rotated_x = local[..., 0] * cos_val - local[..., 1] * sin_val
+    rotated_y = local[..., 0] * sin_val + local[..., 1] * cos_val
+    return np.stack([rotated_x, rotated_y], axis=-1) + centers[:, np.newaxis, :]
+
+def project_footprints(centers, rotations, extents, matrix):
+    """
+    Canvas vertices (N x 4 x 2) of N footprints after one board-to-canvas transform.
+    """
+    return transform_points(matrix, footprint_outlines(centers, rotations, extents))
+
+def bounding_boxes(vertices):
+    """
+    Axis aligned (x1, y1, x2, y2) box of each N x K x 2 vertex group.
+    """
+    return np.concatenate([vertices.min(axis=1), vertices.max(axis=1)], axis=1)
+
+def solve_homography(source_points, target_points):
     """
-    Calculate the scale factor between original and current PCB dimensions.
+    Projective 3x3 matrix mapping four source points onto four target points.
     """
-    scale_x = current_width / original_width
-    scale_y = current_length / original_length
-    return scale_x, scale_y
+    rows = []
+    values = []
+    for (x, y), (u, v) in zip(source_points, target_points):
+        rows.append([x, y, 1.0, 0.0, 0.0, 0.0, -u * x, -u * y])
+        rows.append([0.0, 0.0, 0.0, x, y, 1.0, -v * x, -v * y])
+        values.extend([u, v])
+    solution = np.linalg.solve(np.array(rows, dtype=float), np.array(values, dtype=float))
+    return np.append(solution, 1.0).reshape(3, 3)
 
-def scale_component_position(x, y, scale_x, scale_y):
+def upright_text_angle(angle):
     """
-    Scale component position based on the scale factors.
+    Flip text angles (degrees, 0-360) that would read upside down by 180.
+    Works on a single angle or an array of angles.
     """
-    new_x = round(x * scale_x, 4)
-    new_y = round(y * scale_y, 4)
-    return new_x, new_y
+    angle = np.asarray(angle, dtype=float)
+    flipped = np.where((angle > 90) & (angle <= 270), (angle + 180) % 360, angle)
+    return flipped if flipped.ndim else float(flipped)
 
-def get_pcb_dimensions(pcb_outline):
+def transform_points_stack(matrices, points):
     """
-    Calculate PCB dimensions from outline coordinates.
+    Apply each of C 3x3 matrices to the same (..., 2) points.
+    Returns a C x ... x 2 array.
     """
-    width = round(pcb_outline[2] - pcb_outline[0], 4)
-    length = round(pcb_outline[3] - pcb_outline[1], 4)
-    return width, length
\ No newline at end of file
+    points = np.asarray(points, dtype=float)
+    homogeneous = np.concatenate([points, np.ones(points.shape[:-1] + (1,))], axis=-1)
+    transformed = np.einsum('cij,...j->c...i', np.asarray(matrices, dtype=float), homogeneous)
+    return transformed[..., :2] / transformed[..., 2:]
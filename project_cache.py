@@ -0,0 +1,150 @@
+import hashlib
+import json
+import logging
+import os
+
+import numpy as np
+
+from board import Board, Placement
+from readpickandplace import TOP_LAYER
+
+logger = logging.getLogger(__name__)
+
+# Bump when the layout of the cache file changes
+CACHE_VERSION = 2
+CACHE_FILE = "pcbdata.cache.npz"
+
+
+def layer_cache_path(cache_path, layer):
+    """
+    Cache file of one board side, the top side keeps the plain cache path.
+    """
+    if layer in (None, TOP_LAYER):
+        return cache_path
+    base, extension = os.path.splitext(cache_path)
+    return f"{base}.{layer}{extension}"
+
+
+def file_hash(path):
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_signature(path, with_hash=True):
+    """
+    Size, mtime and (optionally) content hash of a source file, or None if it is missing.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    signature = {"size": stat.st_size, "mtime": stat.st_mtime_ns}
+    if with_hash:
+        signature["sha1"] = file_hash(path)
+    return signature
+
+
+def sources_signature(paths, with_hash=True):
+    return {os.path.abspath(path): file_signature(path, with_hash) for path in paths}
+
+
+def signature_matches(saved, path):
+    """
+    A source is unchanged if size and mtime match, or failing that its content hash.
+    """
+    current = file_signature(path, with_hash=False)
+    if saved is None or current is None:
+        return saved is None and current is None
+    if current["size"] != saved["size"]:
+        return False
+    if current["mtime"] == saved["mtime"]:
+        return True
+    return file_hash(path) == saved.get("sha1")
+
+
+def save_project_cache(cache_path, sources, board, placement, footprint_matches, bom_pages):
+    """
+    Write the parsed board, footprint matches, BOM page membership and
+    model-space outlines to a single .npz file, replacing it atomically.
+    """
+    page_designators = [designator for page in bom_pages for designator in page]
+    page_offsets = np.cumsum([0] + [len(page) for page in bom_pages])
+    meta = {
+        "version": CACHE_VERSION,
+        "sources": sources_signature(sources),
+        "board_source": board.source_path,
+        "board_layer": board.layer,
+        "missing_footprints": sorted(placement.missing_footprints),
+    }
+
+    temp_path = cache_path + ".tmp"
+    try:
+        with open(temp_path, 'wb') as f:
+            np.savez(f,
+                     meta=np.array(json.dumps(meta)),
+                     designators=np.array(board.designators, dtype=str),
+                     x=np.asarray(board.x), y=np.asarray(board.y), rotation=np.asarray(board.rotation),
+                     footprint_ids=np.asarray(board.footprint_ids),
+                     footprint_names=np.array(board.footprint_names, dtype=str),
+                     comments=np.array(board.comments, dtype=str),
+                     descriptions=np.array(board.descriptions, dtype=str),
+                     footprint_matches=np.array([name or '' for name in footprint_matches], dtype=str),
+                     page_designators=np.array(page_designators, dtype=str),
+                     page_offsets=page_offsets,
+                     placement_indices=placement.indices,
+                     placement_shapes=placement.shapes,
+                     placement_outlines=placement.outlines)
+        os.replace(temp_path, cache_path)
+    except Exception:
+        # No half-written file left next to the cache
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def load_project_cache(cache_path, sources):
+    """
+    Return the cached project as a dict, or None if the cache is missing,
+    from another version, or any source file changed.
+    """
+    if not os.path.exists(cache_path):
+        return None
+    try:
+        with np.load(cache_path, allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            if meta.get("version") != CACHE_VERSION:
+                return None
+            saved_sources = meta["sources"]
+            for path in sources:
+                if not signature_matches(saved_sources.get(os.path.abspath(path)), path):
+                    return None
+
+            board = Board(meta["board_source"], meta["board_layer"])
+            board.designators = data["designators"].tolist()
+            board.x.fromlist(data["x"].tolist())
+            board.y.fromlist(data["y"].tolist())
+            board.rotation.fromlist(data["rotation"].tolist())
+            board.footprint_ids.fromlist(data["footprint_ids"].tolist())
+            board.footprint_names = data["footprint_names"].tolist()
+            board.comments = data["comments"].tolist()
+            board.descriptions = data["descriptions"].tolist()
+            board._footprint_lookup = {name: index for index, name in enumerate(board.footprint_names)}
+            if board.source_path and os.path.exists(board.source_path):
+                board.source_mtime = os.path.getmtime(board.source_path)
+
+            offsets = data["page_offsets"].tolist()
+            page_designators = data["page_designators"].tolist()
+            bom_pages = [page_designators[start:end] for start, end in zip(offsets, offsets[1:])]
+
+            placement = Placement(data["placement_indices"], data["placement_shapes"],
+                                  data["placement_outlines"], meta["missing_footprints"])
+            footprint_matches = [name or None for name in data["footprint_matches"].tolist()]
+    except Exception as e:
+        # Truncated, empty or otherwise damaged, any unreadable cache is a cache miss
+        logger.warning("Ignoring unreadable project cache %s: %s", cache_path, e)
+        return None
+
+    return {"board": board, "placement": placement, "footprint_matches": footprint_matches, "bom_pages": bom_pages}
@@ -1,44 +1,221 @@
+import codecs
 import csv
 import os
+from array import array
+from collections import namedtuple
 
 # Hard-coded file paths
 INPUT_FILE = r"inputdata.csv"
 OUTPUT_FILE = r"pcbdata.csv"
 
+PCB_DATA_HEADER = ['Designator', 'Center-Y(mm)', 'Center-X(mm)', 'Comment', 'Footprint', 'Rotation', 'Description']
 
-def read_pick_and_place(input_file=INPUT_FILE, output_file=OUTPUT_FILE):
+# Bytes read per chunk by read_pick_and_place_chunks
+CHUNK_SIZE = 1 << 20
+
+# Layer names in Altium exports, rows without a layer are taken as top side
+TOP_LAYER = 'TopLayer'
+BOTTOM_LAYER = 'BottomLayer'
+LAYERS = (TOP_LAYER, BOTTOM_LAYER)
+
+# One placement row, with coordinates and rotation already converted to floats
+Component = namedtuple('Component', ['designator', 'x', 'y', 'comment', 'footprint', 'rotation', 'description', 'layer'])
+
+# Columns of up to one chunk of placements, numbers already in float arrays
+ComponentChunk = namedtuple('ComponentChunk', ['designators', 'x', 'y', 'comments', 'footprints', 'rotations', 'descriptions', 'layers'])
+
+
+def parse_number(value, default=0.0):
+    """
+    Convert a CSV number to float, accepting a comma as decimal separator.
+    """
+    value = value.strip().replace(',', '.')
+    return float(value) if value else default
+
+
+def detect_encoding(sample):
+    """
+    Guess the text encoding of a CSV export from its raw bytes.
+    Anything that is not valid UTF-8 is taken as cp1252, which Altium writes on Windows.
+    """
+    if sample.startswith(b'\xef\xbb\xbf'):
+        return 'utf-8-sig'
+    if sample.startswith((b'\xff\xfe', b'\xfe\xff')):
+        return 'utf-16'
     try:
-        with open(input_file, 'r', encoding='utf-8') as infile, open(output_file, 'w', newline='', encoding='utf-8') as outfile:
-            csv_reader = csv.reader(infile)
-            csv_writer = csv.writer(outfile)
-            
-            # Skip header lines
-            for _ in range(11):
-                next(csv_reader)
-            
-            # Write header
-            csv_writer.writerow(['Designator', 'Center-Y(mm)', 'Center-X(mm)', 'Comment', 'Footprint', 'Rotation', 'Description'])
-            
-            # Read and process component lines
+        sample.decode('utf-8')
+    except UnicodeDecodeError as e:
+        # A character cut off at the end of the sample does not count against UTF-8
+        if e.reason != 'unexpected end of data':
+            return 'cp1252'
+    return 'utf-8'
+
+
+def find_header(csv_reader):
+    """
+    Advance the reader past the preamble and return the column header row.
+    """
+    for row in csv_reader:
+        names = [name.strip() for name in row]
+        if 'Designator' in names and 'Center-X(mm)' in names and 'Center-Y(mm)' in names:
+            return names
+    return None
+
+
+def read_pick_and_place(input_file=INPUT_FILE, layer=TOP_LAYER):
+    """
+    Stream components from a pick-and-place export (or a pcbdata.csv file).
+    The header row is located automatically, so any preamble is skipped.
+    Rows on other layers are dropped; pass layer=None to keep every row.
+    Files without a Layer column (such as pcbdata.csv) are all top side.
+    """
+    with open(input_file, 'rb') as infile:
+        encoding = detect_encoding(infile.read(CHUNK_SIZE))
+
+    with open(input_file, 'r', encoding=encoding, errors='replace', newline='') as infile:
+        csv_reader = csv.reader(infile)
+
+        header = find_header(csv_reader)
+        if header is None:
+            raise ValueError(f"No pick-and-place header found in '{input_file}'")
+        columns = {name: index for index, name in enumerate(header)}
+        layer_column = columns.get('Layer')
+        fields = [columns.get(name) for name in
+                  ('Designator', 'Center-X(mm)', 'Center-Y(mm)', 'Comment', 'Footprint', 'Rotation', 'Description')]
+
+        for row in csv_reader:
+            if len(row) < len(header):
+                continue
+            row_layer = (row[layer_column] if layer_column is not None else '') or TOP_LAYER
+            if layer is not None and row_layer != layer:
+                continue
+
+            designator, center_x, center_y, comment, footprint, rotation, description = (
+                row[index] if index is not None else '' for index in fields)
+            yield Component(designator, parse_number(center_x), parse_number(center_y), comment,
+                            footprint, parse_number(rotation), description, row_layer)
+
+
+def read_pick_and_place_chunks(input_file=INPUT_FILE, layer=TOP_LAYER, chunk_size=CHUNK_SIZE, progress=None):
+    """
+    Read a pick-and-place export in fixed-size chunks and yield one
+    ComponentChunk of columns per chunk, so memory stays bounded by the
+    chunk size plus the typed arrays instead of one object per row.
+    layer=None keeps every row, chunk.layers then tells the sides apart.
+    progress(bytes_read, total_bytes) is called after every chunk.
+    """
+    total_bytes = os.path.getsize(input_file)
+    bytes_read = 0
+    leftover = ''
+    header = None
+    decoder = None
+    # Repeated strings (comments, footprints, descriptions) share one object
+    strings = {}
+
+    with open(input_file, 'rb') as infile:
+        while True:
+            data = infile.read(chunk_size)
+            at_end = not data
+            bytes_read += len(data)
+
+            # Decoded incrementally, so a character (or a UTF-16 newline) split
+            # between chunks is kept for the next one and a BOM is only dropped once
+            if decoder is None:
+                encoding = detect_encoding(data)
+                decoder = codecs.getincrementaldecoder(encoding)('strict' if encoding.startswith('utf-8') else 'replace')
+            try:
+                text = decoder.decode(data, final=at_end)
+            except UnicodeDecodeError:
+                # Plain ASCII at the start, legacy bytes further down
+                pending = decoder.getstate()[0]
+                decoder = codecs.getincrementaldecoder('cp1252')('replace')
+                text = decoder.decode(pending + data, final=at_end)
+
+            # Only hand complete lines to the csv parser
+            text = leftover + text
+            if at_end:
+                leftover = ''
+            else:
+                cut = text.rfind('\n') + 1
+                text, leftover = text[:cut], text[cut:]
+
+            csv_reader = csv.reader(text.splitlines())
+            if header is None:
+                header = find_header(csv_reader)
+                if header is None and at_end:
+                    raise ValueError(f"No pick-and-place header found in '{input_file}'")
+                if header is None:
+                    # Still in the preamble
+                    continue
+                columns = {name: index for index, name in enumerate(header)}
+                layer_column = columns.get('Layer')
+                fields = [columns.get(name) for name in
+                          ('Designator', 'Center-X(mm)', 'Center-Y(mm)', 'Comment', 'Footprint', 'Rotation', 'Description')]
+
+            chunk = ComponentChunk([], array('d'), array('d'), [], [], array('d'), [], [])
             for row in csv_reader:
-                if row and row[0] == 'TopLayer':
-                    designator, center_y, center_x, comment, footprint, rotation, description = row[1:8]
-                    # Replace comma with dot in coordinates
-                    center_y = center_y.replace(',', '.')
-                    center_x = center_x.replace(',', '.')
-                    # Ensure µ is correctly encoded
-                    comment = comment.replace('µ', '\u00B5')
-                    description = description.replace('µ', '\u00B5')
-                    csv_writer.writerow([designator, center_y, center_x, comment, footprint, rotation, description])
-        
+                if len(row) < len(header):
+                    continue
+                row_layer = (row[layer_column] if layer_column is not None else '') or TOP_LAYER
+                if layer is not None and row_layer != layer:
+                    continue
+
+                designator, center_x, center_y, comment, footprint, rotation, description = (
+                    row[index] if index is not None else '' for index in fields)
+                chunk.designators.append(designator)
+                chunk.x.append(parse_number(center_x))
+                chunk.y.append(parse_number(center_y))
+                chunk.comments.append(strings.setdefault(comment, comment))
+                chunk.footprints.append(strings.setdefault(footprint, footprint))
+                chunk.rotations.append(parse_number(rotation))
+                chunk.descriptions.append(strings.setdefault(description, description))
+                chunk.layers.append(strings.setdefault(row_layer, row_layer))
+
+            if chunk.designators:
+                yield chunk
+            if progress is not None:
+                progress(bytes_read, total_bytes)
+            if at_end:
+                break
+
+
+def select_rows(chunk, rows):
+    """
+    A ComponentChunk holding only the given rows of chunk.
+    """
+    return ComponentChunk([chunk.designators[row] for row in rows],
+                          array('d', (chunk.x[row] for row in rows)),
+                          array('d', (chunk.y[row] for row in rows)),
+                          [chunk.comments[row] for row in rows],
+                          [chunk.footprints[row] for row in rows],
+                          array('d', (chunk.rotations[row] for row in rows)),
+                          [chunk.descriptions[row] for row in rows],
+                          [chunk.layers[row] for row in rows])
+
+
+def write_pcb_data(components, output_file=OUTPUT_FILE):
+    """
+    Write components to pcbdata.csv for inspection or for other tools.
+    """
+    with open(output_file, 'w', newline='', encoding='utf-8') as outfile:
+        csv_writer = csv.writer(outfile)
+        csv_writer.writerow(PCB_DATA_HEADER)
+        for component in components:
+            csv_writer.writerow([component.designator, component.y, component.x, component.comment,
+                                 component.footprint, component.rotation, component.description])
+
+
+def convert_pick_and_place(input_file=INPUT_FILE, output_file=OUTPUT_FILE):
+    try:
+        write_pcb_data(read_pick_and_place(input_file), output_file)
         print(f"Data has been successfully written to {output_file}")
         return True
-    
+
     except FileNotFoundError:
         print(f"Error: File '{input_file}' not found.")
     except Exception as e:
         print(f"An error occurred: {e}")
-    
+
     return False
 
 if __name__ == "__main__":
@@ -46,14 +223,14 @@ if __name__ == "__main__":
     print("Files in current directory:")
     for file in os.listdir():
         print(f"  {file}")
-    
+
     if not os.path.exists(INPUT_FILE):
         print(f"Error: File '{INPUT_FILE}' not found.")
     else:
-        if read_pick_and_place():
+        if convert_pick_and_place():
             print("CSV file created successfully.")
             print("Files in current directory after processing:")
             for file in os.listdir():
                 print(f"  {file}")
         else:
-            print("Failed to create CSV file.")
\ No newline at end of file
+            print("Failed to create CSV file.")
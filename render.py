@@ -0,0 +1,79 @@
+import time
+
+import numpy as np
+
+# Default redraw rate for interactive drags
+DEFAULT_FRAME_RATE = 60
+
+
+class RenderScheduler:
+    """
+    Coalesce redraw requests so the canvas is updated at most once per frame.
+
+    Event handlers only record their latest state and call schedule(); the
+    callback registered under each key runs once on the next frame, and any
+    requests that arrive in between simply replace it.
+    """
+
+    def __init__(self, widget, frame_rate=DEFAULT_FRAME_RATE):
+        self.widget = widget
+        self.frame_rate = frame_rate
+        self._pending = {}
+        self._after_id = None
+        self._last_frame = 0.0
+
+    @property
+    def frame_interval(self):
+        return 1.0 / self.frame_rate
+
+    def schedule(self, key, callback):
+        self._pending[key] = callback
+        if self._after_id is not None:
+            return
+
+        wait = self._last_frame + self.frame_interval - time.perf_counter()
+        if wait > 0:
+            self._after_id = self.widget.after(int(wait * 1000) + 1, self._run)
+        else:
+            self._after_id = self.widget.after_idle(self._run)
+
+    def flush(self, event=None):
+        """
+        Run anything still pending right away, e.g. when a drag ends.
+        """
+        self.cancel()
+        self._run()
+
+    def cancel(self):
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _run(self):
+        self._after_id = None
+        self._last_frame = time.perf_counter()
+        pending, self._pending = self._pending, {}
+        for callback in pending.values():
+            callback()
+
+
+# Level of detail of a component, chosen from its size on screen
+LOD_HIDDEN = 0  # Outside the canvas, no items at all
+LOD_DOT = 1  # A small square marker
+LOD_OUTLINE = 2  # Footprint outline, a label would not be legible
+LOD_FULL = 3  # Outline and designator label
+
+# Largest footprint side in pixels that is still drawn as a dot, and the smallest that gets a label
+DOT_MAX_PX = 4
+LABEL_MIN_PX = 14
+
+
+def level_of_detail(boxes, width, height):
+    """
+    Level per screen bounding box (N x 4 of x1, y1, x2, y2) for a width x height canvas.
+    """
+    boxes = np.asarray(boxes, dtype=float).reshape(-1, 4)
+    visible = (boxes[:, 2] >= 0) & (boxes[:, 0] <= width) & (boxes[:, 3] >= 0) & (boxes[:, 1] <= height)
+    size = np.maximum(boxes[:, 2] - boxes[:, 0], boxes[:, 3] - boxes[:, 1])
+    levels = np.where(size <= DOT_MAX_PX, LOD_DOT, np.where(size < LABEL_MIN_PX, LOD_OUTLINE, LOD_FULL))
+    return np.where(visible, levels, LOD_HIDDEN).astype(np.int8)
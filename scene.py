@@ -0,0 +1,63 @@
+import numpy as np
+
+from board import SHAPE_CIRCLE
+from pcb_utils import transform_points_stack
+from spatial_index import OutlineIndex
+
+
+class ComponentScene:
+    """
+    Every component copy to draw, flattened into one list of entries with
+    outlines and label centers in board mm (panel mm for a panel). Built
+    once per placement and panel; moving the board only changes the
+    board-to-canvas transform applied to it.
+    """
+
+    def __init__(self, board, placement, copies, copy_rotations, copy_matrices):
+        count = len(placement)
+        indices = placement.indices
+        centers = np.column_stack([np.asarray(board.x)[indices], np.asarray(board.y)[indices]])
+
+        self.rows = np.tile(indices, len(copies))
+        self.copies = np.repeat(np.asarray(copies, dtype=int), count)
+        self.rotations = (np.tile(np.asarray(board.rotation)[indices], len(copies))
+                          + np.repeat(np.asarray(copy_rotations, dtype=float), count)) % 360
+        self.is_circle = np.tile(placement.shapes == SHAPE_CIRCLE, len(copies))
+        self.outlines = transform_points_stack(copy_matrices, placement.outlines).reshape(-1, 4, 2)
+        self.centers = transform_points_stack(copy_matrices, centers).reshape(-1, 2)
+
+        # Panel copies after the first are keyed "R1/2", "R1/3", ...
+        self.designators = [board.designators[row] for row in self.rows.tolist()]
+        self.keys = [designator if copy == 0 else f"{designator}/{copy + 1}"
+                     for designator, copy in zip(self.designators, self.copies.tolist())]
+        self.index = OutlineIndex(self.outlines, self.is_circle)
+        self._designator_entries = None
+
+    def __len__(self):
+        return len(self.keys)
+
+    def entries_of(self, designators):
+        """
+        Entries of every copy of the given designators.
+        """
+        if self._designator_entries is None:
+            self._designator_entries = {}
+            for entry, designator in enumerate(self.designators):
+                self._designator_entries.setdefault(designator, []).append(entry)
+        return [entry for designator in designators for entry in self._designator_entries.get(designator, ())]
+
+    def match_entries(self, previous):
+        """
+        Pair entries with those of previous, a scene built before the board
+        changed, by key. Returns {entry: previous entry} for the entries whose
+        outline and rotation are unchanged; all other entries are new or moved.
+        """
+        previous_entries = {key: entry for entry, key in enumerate(previous.keys)}
+        pairs = [(entry, previous_entries[key]) for entry, key in enumerate(self.keys) if key in previous_entries]
+        if not pairs:
+            return {}
+        entries, previous_entries = np.array(pairs).T
+        same = (np.all(np.isclose(self.outlines[entries], previous.outlines[previous_entries]), axis=(1, 2))
+                & (self.is_circle[entries] == previous.is_circle[previous_entries])
+                & (self.rotations[entries] == previous.rotations[previous_entries]))
+        return dict(zip(entries[same].tolist(), previous_entries[same].tolist()))
@@ -0,0 +1,208 @@
+import math
+import re
+from collections import defaultdict, deque
+
+import numpy as np
+
+# Reference designator prefixes of small passives, placed before other parts of the same size
+PASSIVE_PREFIXES = {"R", "C", "L", "FB"}
+
+# Candidate moves per part in the path search, its nearest parts on the page
+PATH_NEIGHBOURS = 8
+
+_PREFIX = re.compile(r'^[A-Za-z_]+')
+
+
+def outline_areas(outlines):
+    """
+    Area in mm² of each N x 4 x 2 outline (shoelace formula).
+    """
+    x, y = outlines[..., 0], outlines[..., 1]
+    return np.abs(np.sum(x * np.roll(y, -1, axis=1) - np.roll(x, -1, axis=1) * y, axis=1)) / 2
+
+
+def is_passive(designators):
+    prefixes = [_PREFIX.match(designator) for designator in designators]
+    return bool(prefixes) and all(prefix and prefix.group(0).upper() in PASSIVE_PREFIXES for prefix in prefixes)
+
+
+def order_pages(pages, page_entries, areas):
+    """
+    BOM line indices in the order to place them: smallest parts first, in
+    groups whose median footprint area is within a factor of two, passives
+    ahead of the rest of their group and BOM order otherwise. Lines with
+    nothing on the board go last.
+    """
+    def key(line):
+        entries = page_entries[line]
+        if not len(entries):
+            return (math.inf, 1, line)
+        area = float(np.median(areas[entries]))
+        return (math.floor(math.log2(max(area, 1e-6))), 0 if is_passive(pages[line]) else 1, line)
+
+    return sorted(range(len(pages)), key=key)
+
+
+def nearest_neighbours(points, count):
+    """
+    Indices of the count nearest other points of each point, N x count.
+    Points are bucketed in a uniform grid of about count points per cell,
+    each cell only measures against the ring of cells around it, widened
+    until it holds enough points.
+    """
+    count = min(count, len(points) - 1)
+    lower = points.min(axis=0)
+    extent_x, extent_y = (points.max(axis=0) - lower).tolist()
+    cell_size = max(math.sqrt(extent_x * extent_y * count / len(points)),
+                    max(extent_x, extent_y) * count / len(points)) or 1.0
+    cells = defaultdict(list)
+    for index, cell in enumerate(map(tuple, np.floor((points - lower) / cell_size).astype(int).tolist())):
+        cells[cell].append(index)
+
+    neighbours = np.empty((len(points), count), dtype=int)
+    for (cell_x, cell_y), members in cells.items():
+        ring = 1
+        while True:
+            candidates = [other for x in range(cell_x - ring, cell_x + ring + 1)
+                          for y in range(cell_y - ring, cell_y + ring + 1) for other in cells.get((x, y), ())]
+            if len(candidates) > count:
+                break
+            ring += 1
+        members = np.asarray(members)
+        candidates = np.asarray(candidates)
+        distances = ((points[members][:, np.newaxis, :] - points[candidates][np.newaxis, :, :]) ** 2).sum(axis=2)
+        distances[members[:, np.newaxis] == candidates[np.newaxis, :]] = np.inf
+        nearest = np.argsort(distances, axis=1)[:, :count]
+        neighbours[members] = candidates[nearest]
+    return neighbours
+
+
+def nearest_neighbour_path(points, neighbours, start=0):
+    """
+    Greedy path from start, always to the closest part not visited yet.
+    The neighbour list answers most steps, a full scan the rest.
+    """
+    neighbours = neighbours.tolist()
+    visited = np.zeros(len(points), dtype=bool)
+    path = [start]
+    visited[start] = True
+    current = start
+    for _ in range(len(points) - 1):
+        for candidate in neighbours[current]:
+            if not visited[candidate]:
+                current = int(candidate)
+                break
+        else:
+            distances = ((points - points[current]) ** 2).sum(axis=1)
+            distances[visited] = np.inf
+            current = int(np.argmin(distances))
+        visited[current] = True
+        path.append(current)
+    return path
+
+
+def two_opt(points, path, neighbours):
+    """
+    Shorten an open path, start fixed, by reversing segments while that
+    helps. Only moves joining a part to one of its neighbours are tried and
+    parts are looked at again only when an edge next to them changed.
+    """
+    count = len(path)
+    if count < 4:
+        return path
+    coords = points.tolist()
+    neighbours = neighbours.tolist()
+    path = list(path)
+    position = [0] * count
+    for index, point in enumerate(path):
+        position[point] = index
+
+    def distance(a, b):
+        return math.dist(coords[a], coords[b])
+
+    def reverse(first, last):
+        path[first:last + 1] = path[first:last + 1][::-1]
+        for index in range(first, last + 1):
+            position[path[index]] = index
+
+    queue = deque(path)
+    queued = [True] * count
+    while queue:
+        a = queue.popleft()
+        queued[a] = False
+        i = position[a]
+        b = path[i + 1] if i + 1 < count else None
+        removed = distance(a, b) if b is not None else 0.0
+
+        touched = None
+        for c in neighbours[a]:
+            j = position[c]
+            joined = distance(a, c)
+            if joined >= removed and b is not None:
+                # Neighbours are sorted, none further on can pay for the new edge
+                break
+            if j > i + 1:
+                # a b ... c d becomes a c ... b d
+                d = path[j + 1] if j + 1 < count else None
+                gain = removed - joined
+                if d is not None:
+                    gain += distance(c, d) - distance(b, d)
+                if gain > 1e-9:
+                    reverse(i + 1, j)
+                    touched = (a, b, c, d)
+                    break
+            elif j < i and j + 1 < i:
+                # c e ... a b becomes c a ... e b
+                e = path[j + 1]
+                gain = distance(c, e) - joined
+                if b is not None:
+                    gain += removed - distance(e, b)
+                if gain > 1e-9:
+                    reverse(j + 1, i)
+                    touched = (a, b, c, e)
+                    break
+        if touched is None:
+            continue
+
+        for point in touched:
+            if point is not None and not queued[point]:
+                queue.append(point)
+                queued[point] = True
+    return path
+
+
+def visiting_path(points, start=None):
+    """
+    Short open path through points (N x 2), nearest neighbour then 2-opt.
+    The path begins at the point closest to start, or the first point.
+    Returns the point indices in visiting order.
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    if not len(points):
+        return []
+    first = 0 if start is None else int(np.argmin(((points - np.asarray(start, dtype=float)) ** 2).sum(axis=1)))
+    if len(points) < 3:
+        return [first] + [index for index in range(len(points)) if index != first]
+    neighbours = nearest_neighbours(points, PATH_NEIGHBOURS)
+    return two_opt(points, nearest_neighbour_path(points, neighbours, first), neighbours)
+
+
+def plan_pages(scene, pages):
+    """
+    Placement order for a ComponentScene and the BOM pages (designators of
+    each BOM line). Returns the BOM line index of every page in order, and
+    the scene entries of every page in visiting order. Each page starts
+    next to where the previous one ended, the first one at the board origin.
+    """
+    page_entries = [np.asarray(scene.entries_of(designators), dtype=int) for designators in pages]
+    order = order_pages(pages, page_entries, outline_areas(scene.outlines))
+
+    paths = []
+    position = (0.0, 0.0)
+    for line in order:
+        entries = page_entries[line]
+        if len(entries):
+            entries = entries[visiting_path(scene.centers[entries], position)]
+            position = scene.centers[entries[-1]]
+        paths.append(entries)
+    return order, paths
@@ -0,0 +1,66 @@
+from collections import defaultdict
+
+import numpy as np
+
+from pcb_utils import bounding_boxes
+
+
+class OutlineIndex:
+    """
+    Uniform grid over footprint outlines in board mm for hit-testing.
+
+    Each outline is listed in every grid cell its bounding box overlaps, so a
+    point query only checks the few outlines of one cell. Where outlines
+    overlap the smallest one wins, so a resistor on top of a connector
+    footprint can still be picked.
+    """
+
+    def __init__(self, outlines, is_circle, cell_size=None):
+        self.outlines = np.asarray(outlines, dtype=float).reshape(-1, 4, 2)
+        self.is_circle = np.asarray(is_circle, dtype=bool).reshape(-1)
+        self.boxes = bounding_boxes(self.outlines)
+        sizes = self.boxes[:, 2:] - self.boxes[:, :2]
+        self.areas = sizes[:, 0] * sizes[:, 1]
+        self.centers = self.outlines.mean(axis=1)
+
+        if cell_size is None:
+            # About two typical parts per cell side
+            cell_size = 2 * float(np.median(sizes.max(axis=1))) if len(sizes) else 1.0
+        self.cell_size = max(cell_size, 0.1)
+
+        self.cells = defaultdict(list)
+        cell_ranges = np.floor(self.boxes / self.cell_size).astype(int)
+        for entry, (cx1, cy1, cx2, cy2) in enumerate(cell_ranges.tolist()):
+            for cx in range(cx1, cx2 + 1):
+                for cy in range(cy1, cy2 + 1):
+                    self.cells[(cx, cy)].append(entry)
+
+    def __len__(self):
+        return len(self.outlines)
+
+    def query_point(self, x, y):
+        """
+        Return the entry whose outline contains (x, y), or None.
+        """
+        best = None
+        for entry in self.cells.get((int(np.floor(x / self.cell_size)), int(np.floor(y / self.cell_size))), ()):
+            x1, y1, x2, y2 = self.boxes[entry]
+            if not (x1 <= x <= x2 and y1 <= y <= y2):
+                continue
+            if not self._contains(entry, x, y):
+                continue
+            if best is None or self.areas[entry] < self.areas[best]:
+                best = entry
+        return best
+
+    def _contains(self, entry, x, y):
+        if self.is_circle[entry]:
+            cx, cy = self.centers[entry]
+            radius = (self.boxes[entry, 2] - self.boxes[entry, 0]) / 2
+            return (x - cx) ** 2 + (y - cy) ** 2 <= radius ** 2
+
+        # Inside a convex quad when on the same side of all four edges
+        quad = self.outlines[entry]
+        edges = np.roll(quad, -1, axis=0) - quad
+        cross = edges[:, 0] * (y - quad[:, 1]) - edges[:, 1] * (x - quad[:, 0])
+        return bool((cross >= 0).all() or (cross <= 0).all())
@@ -0,0 +1,48 @@
+from bom import MAX_RANGE, Bom, cross_check, expand_designators, format_report
+
+
+def test_expand_designators():
+    assert expand_designators("R1, R3;R5 R7") == ["R1", "R3", "R5", "R7"]
+    assert expand_designators("R1-R4") == ["R1", "R2", "R3", "R4"]
+    assert expand_designators("C10-12") == ["C10", "C11", "C12"]
+    assert expand_designators("R1 - R3, C1") == ["R1", "R2", "R3", "C1"]
+    assert expand_designators("  ") == []
+
+
+def test_expand_designators_keeps_odd_ranges():
+    # Mixed prefixes, backwards and oversized ranges are kept as written
+    assert expand_designators("R1-C4") == ["R1-C4"]
+    assert expand_designators("R8-R2") == ["R8-R2"]
+    assert expand_designators(f"R1-R{MAX_RANGE + 1}") == [f"R1-R{MAX_RANGE + 1}"]
+
+
+def test_bom_index_and_duplicates():
+    bom = Bom([{"Designator": "R1-R3", "Quantity": "3"},
+               {"Designator": "C1, R2", "Quantity": "2"}])
+    assert bom.pages == [["R1", "R2", "R3"], ["C1", "R2"]]
+    assert bom.quantities == [3, 2]
+    assert bom.line_of("R2") == 0
+    assert bom.line_of("C1") == 1
+    assert bom.line_of("U1") is None
+    assert bom.duplicates == ["R2"]
+
+
+def test_cross_check():
+    bom = Bom([{"Designator": "R1-R3", "Quantity": "3"},
+               {"Designator": "C1, C2", "Quantity": "3"},
+               {"Designator": "U1", "Quantity": "1,0"},
+               {"Designator": "", "Quantity": ""}])
+    report = cross_check(bom, ["R1", "R2", "R3", "C1", "J1"])
+    assert report.missing_from_board == ["C2", "U1"]
+    assert report.not_in_bom == ["J1"]
+    assert report.unplaced_lines == [2]
+    assert report.quantity_mismatches == [(1, 3, 2)]
+    assert report.duplicates == []
+    assert "line 2 (3 vs 2)" in format_report(report)
+
+
+def test_cross_check_agrees():
+    bom = Bom([{"Designator": "R1-R2", "Quantity": "2"}])
+    report = cross_check(bom, ["R2", "R1"])
+    assert not any(report)
+    assert format_report(report) == ""
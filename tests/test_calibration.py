@@ -0,0 +1,118 @@
+import numpy as np
+
+from calibration import (MIN_OUTLINE_SIZE, BoardPose, Calibration, is_convex_quad, load_calibrations,
+                         save_calibrations)
+from pcb_utils import solve_homography, transform_points
+
+KEYSTONE = [(102.0, 610.0), (905.0, 580.0), (860.0, 95.0), (140.0, 120.0)]
+
+
+def test_homography_maps_board_corners_onto_clicked_corners():
+    calibration = Calibration(100.0, 60.0, KEYSTONE)
+    assert np.allclose(calibration.project(calibration.board_corners), KEYSTONE)
+
+
+def test_degenerate_corners_are_not_usable():
+    collinear = Calibration(100, 60, [(0, 0), (100, 0), (200, 0), (300, 0)])
+    assert not is_convex_quad(collinear.corners)
+    assert not collinear.usable
+    repeated = Calibration(100, 60, [(0, 0), (0, 0), (100, 100), (0, 100)])
+    assert not repeated.usable
+    tiny = Calibration(100, 60, [(0, 5), (5, 5), (5, 0), (0, 0)])
+    assert not tiny.usable
+
+
+def test_corners_out_of_order_are_not_usable():
+    # Top-right and top-left swapped cross the outline into a bow-tie
+    bow_tie = [KEYSTONE[0], KEYSTONE[1], KEYSTONE[3], KEYSTONE[2]]
+    assert not Calibration(100, 60, bow_tie).usable
+    assert Calibration(100, 60, KEYSTONE).usable
+    # Clicked the other way round, as through a mirror, is still a board
+    assert Calibration(100, 60, KEYSTONE[::-1]).usable
+
+
+def test_moved_corners_leave_the_calibration_alone():
+    calibration = Calibration(100.0, 60.0, KEYSTONE)
+    # Dragging top-right across the opposite corner
+    corners = calibration.moved_corners(2, 50.0, 700.0)
+    assert not is_convex_quad(corners)
+    assert calibration.corners == KEYSTONE
+    assert is_convex_quad(calibration.moved_corners(2, 870.0, 90.0))
+
+
+def test_homography_keeps_straight_lines():
+    matrix = solve_homography([(0, 0), (100, 0), (100, 60), (0, 60)], KEYSTONE)
+    # Points along a board edge stay on the projected edge
+    start, end = transform_points(matrix, [(0.0, 0.0), (100.0, 0.0)])
+    edge_x, edge_y = end - start
+    for point in transform_points(matrix, [(25.0, 0.0), (50.0, 0.0), (75.0, 0.0)]):
+        offset_x, offset_y = point - start
+        assert abs(edge_x * offset_y - edge_y * offset_x) < 1e-6
+
+
+def test_homography_of_a_rectangle_is_affine():
+    matrix = solve_homography([(0, 0), (10, 0), (10, 5), (0, 5)], [(0, 50), (100, 50), (100, 0), (0, 0)])
+    assert np.allclose(matrix[2], [0.0, 0.0, 1.0])
+    assert np.allclose(transform_points(matrix, [(5.0, 2.5)]), [(50.0, 25.0)])
+
+
+def test_move_corner_resolves_the_matrix():
+    calibration = Calibration(100.0, 60.0, KEYSTONE)
+    before = calibration.matrix.copy()
+    calibration.move_corner(2, 870.0, 90.0)
+    assert not np.allclose(calibration.matrix, before)
+    assert np.allclose(calibration.project([(100.0, 60.0)]), [(870.0, 90.0)])
+
+    calibration.translate(10.0, -5.0)
+    assert np.allclose(calibration.project([(0.0, 0.0)]), [(112.0, 605.0)])
+    assert calibration.bounding_box() == [112.0, 85.0, 915.0, 605.0]
+
+
+def test_calibrations_round_trip(tmp_path):
+    path = str(tmp_path / "calibration.json")
+    assert load_calibrations(path) == {}
+    calibration = Calibration(100.0, 60.5, KEYSTONE)
+    save_calibrations(path, {calibration.key: calibration})
+    loaded = load_calibrations(path)
+    assert list(loaded) == ["100x60.5"]
+    assert np.allclose(loaded["100x60.5"].matrix, calibration.matrix)
+
+
+def test_board_pose_matrix_unturned():
+    pose = BoardPose.from_outline([20, 40, 220, 140])
+    matrix = pose.matrix(100.0, 50.0)
+    # Board origin is bottom-left, canvas Y points down
+    assert np.allclose(transform_points(matrix, [(0, 0), (100, 50), (50, 25)]), [(20, 140), (220, 40), (120, 90)])
+    assert np.allclose(transform_points(pose.matrix(100.0, 50.0, mirror=True), [(0, 0)]), [(220, 140)])
+    assert np.allclose(pose.corners, [(20, 140), (220, 140), (220, 40), (20, 40)])
+
+
+def test_board_pose_turns_clockwise_about_its_center():
+    pose = BoardPose.from_outline([20, 40, 220, 140])
+    pose.rotate(90)
+    assert np.allclose(pose.corners, [(70, -10), (70, 190), (170, 190), (170, -10)])
+    assert np.allclose(pose.bounding_box(), [70, -10, 170, 190])
+
+
+def test_board_pose_full_turn_does_not_drift():
+    pose = BoardPose.from_outline([20, 40, 220, 140])
+    before = pose.matrix(100.0, 50.0)
+    for _ in range(360):
+        pose.rotate(1)
+    assert np.allclose(pose.matrix(100.0, 50.0), before)
+
+
+def test_board_pose_resize_keeps_opposite_corner():
+    pose = BoardPose.from_outline([20, 40, 220, 140], rotation=37)
+    fixed = pose.corners[0]
+    dragged_x, dragged_y = pose.corners[2]
+    assert pose.resize_corner(2, 15.0, -8.0)
+    assert np.allclose(pose.corners[0], fixed)
+    assert np.allclose(pose.corners[2], (dragged_x + 15.0, dragged_y - 8.0))
+    assert pose.rotation == 37
+
+    before = (pose.center_x, pose.center_y, pose.width, pose.length)
+    far_x, far_y = pose.corners[2]
+    fixed_x, fixed_y = fixed
+    assert not pose.resize_corner(2, fixed_x - far_x + MIN_OUTLINE_SIZE / 2, fixed_y - far_y)
+    assert (pose.center_x, pose.center_y, pose.width, pose.length) == before
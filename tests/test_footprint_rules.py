@@ -0,0 +1,51 @@
+from footprint_rules import PACKAGE_SIZES, PackageTable, find_package, resolve_footprint, size_from_name
+
+
+def test_find_package_whole_words():
+    assert find_package("Diode_SMA", PACKAGE_SIZES) == "sma"
+    assert find_package("Smart_Card", PACKAGE_SIZES) is None
+    # The longest key spanning whole words wins
+    assert find_package("SOT-23-5", PACKAGE_SIZES) == "sot235"
+    assert find_package("SOT-23", PACKAGE_SIZES) == "sot23"
+    assert find_package("SOT-89-3", PACKAGE_SIZES) == "sot89"
+    assert find_package("SOT-2", PACKAGE_SIZES) is None
+
+
+def test_size_from_name_rules():
+    footprint, rule = size_from_name("LED_D5.0mm")
+    assert rule == "diameter" and footprint['Shape'] == 'circle' and footprint['Width'] == 5.0
+    footprint, rule = size_from_name("SOIC-8_3.9x4.9mm")
+    assert rule == "size" and (footprint['Width'], footprint['Height']) == (3.9, 4.9)
+    footprint, rule = size_from_name("C_0805_2012Metric")
+    assert rule == "metric chip" and (footprint['Width'], footprint['Height']) == (2.0, 1.25)
+    footprint, rule = size_from_name("Resistor 0603")
+    assert rule == "imperial chip" and (footprint['Width'], footprint['Height']) == (1.6, 0.8)
+    footprint, rule = size_from_name("LED_1206")
+    assert rule == "imperial chip" and footprint['Width'] == 3.2
+    assert size_from_name("SOT-223")[1] == "package"
+    assert size_from_name("Connector_Custom") is None
+
+
+def test_kicad_pad_sizes_are_not_the_body():
+    footprint, rule = size_from_name("R_0805_2012Metric_Pad1.20x1.40mm_HandSolder")
+    assert rule == "metric chip" and (footprint['Width'], footprint['Height']) == (2.0, 1.25)
+    footprint, rule = size_from_name("C_0603_1608Metric_Pad1.08x0.95mm_HandSolder")
+    assert rule == "metric chip" and (footprint['Width'], footprint['Height']) == (1.6, 0.8)
+    footprint, rule = size_from_name("QFN-32-1EP_5x5mm_P0.5mm_EP3.45x3.45mm")
+    assert rule == "size" and (footprint['Width'], footprint['Height']) == (5.0, 5.0)
+    # A pad size alone says nothing about the body
+    assert size_from_name("TestPoint_Pad1.5x1.5mm") is None
+
+
+def test_chip_words_are_whole_words():
+    # "led" inside "angled" or "labeled", "fuse" inside "fused" do not make a chip code
+    assert size_from_name("PinHeader_Angled_1210") is None
+    assert size_from_name("Labeled_0805_Body") is None
+    assert size_from_name("Fused_Switch_2010") is None
+    assert size_from_name("L_Shielded_Inductor_1210")[1] == "imperial chip"
+
+
+def test_table_before_rules():
+    table = PackageTable({"qfn32": {'Shape': 'rectangle', 'Width': 5.0, 'Height': 5.0, 'CenterX': 0.0, 'CenterY': 0.0}})
+    assert resolve_footprint("QFN-32", table)[1] == "table"
+    assert resolve_footprint("SOT-23", table)[1] == "package"
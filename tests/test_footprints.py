@@ -0,0 +1,77 @@
+from footprints import FOOTPRINT_HEADER, FootprintLibrary, FootprintMatcher, normalize_footprint_name
+
+
+def library(*names):
+    return {name: {'Shape': 'rectangle', 'Width': float(index + 1), 'Height': 1.0, 'CenterX': 0.0, 'CenterY': 0.0}
+            for index, name in enumerate(names)}
+
+
+def test_normalize_footprint_name():
+    assert normalize_footprint_name("Capacitor,_0603_Imperial_(1608_Metric)") == "capacitor0603imperial1608metric"
+
+
+def test_exact_match_beats_shorter_containing_name():
+    matcher = FootprintMatcher(library("SOIC-8_3.9x4.9mm_Extra", "soic8", "SOIC 8 3.9x4.9mm"))
+    assert matcher.match_name("SOIC_8_3.9x4.9mm") == "SOIC 8 3.9x4.9mm"
+
+
+def test_shortest_containing_name_wins():
+    matcher = FootprintMatcher(library("Resistor_0603_Imperial_Long", "Resistor_0603_Imperial", "R0603"))
+    assert matcher.match_name("0603 Imperial") == "Resistor_0603_Imperial"
+
+
+def test_ties_go_to_first_listed():
+    matcher = FootprintMatcher(library("LED_0603_A", "LED_0603_B", "LED-0603-A"))
+    # Same normalized name, the first listed wins the exact match
+    assert matcher.match_name("led 0603 a") == "LED_0603_A"
+    # Same length containing names, the first listed wins
+    assert matcher.match_name("0603") == "LED_0603_A"
+
+
+def test_short_queries_and_misses():
+    matcher = FootprintMatcher(library("SMA", "Diode_SMA"))
+    assert matcher.match_name("sm") == "SMA"
+    assert matcher.match_name("QFN-32") is None
+    assert matcher.match_name("") is None
+    assert matcher.match("Diode SMA") == {'Shape': 'rectangle', 'Width': 2.0, 'Height': 1.0,
+                                          'CenterX': 0.0, 'CenterY': 0.0}
+
+
+def test_library_last_row_wins(tmp_path):
+    path = tmp_path / "footprints.csv"
+    path.write_text("Name,Shape,Width,Height,CenterX,CenterY\n"
+                    "R0603,Rectangle,1.6,0.8,0,0\n"
+                    "bad row\n"
+                    "R0603,rectangle,1.7,0.9,0,0\n")
+    footprints = FootprintLibrary.load(str(path))
+    assert len(footprints) == 1
+    assert footprints.get("R0603")['Width'] == 1.7
+    assert footprints.dirty
+    assert footprints.matcher.match_name("r 0603") == "R0603"
+
+
+def test_library_save_compacts_duplicates(tmp_path):
+    path = tmp_path / "footprints.csv"
+    path.write_text("R0603,rectangle,1.6,0.8,0,0\n"
+                    "C0805,circle,2,2,0,0\n"
+                    "R0603,rectangle,1.7,0.9,0.1,0\n")
+    footprints = FootprintLibrary.load(str(path))
+    assert footprints.dirty
+    assert not footprints.is_stale()
+
+    assert footprints.save()
+    assert not footprints.dirty
+    assert not footprints.is_stale()
+    lines = path.read_text().splitlines()
+    assert lines == [",".join(FOOTPRINT_HEADER), "R0603,rectangle,1.7,0.9,0.1,0.0", "C0805,circle,2.0,2.0,0.0,0.0"]
+    assert not (tmp_path / "footprints.csv.tmp").exists()
+    # Nothing changed since, nothing to write
+    assert not footprints.save()
+
+    footprints.set("SOT23", "Rectangle", 2.9, 2.4)
+    assert footprints.dirty and footprints.matcher.match_name("sot-23") == "SOT23"
+    footprints.save()
+    reloaded = FootprintLibrary.load(str(path))
+    assert not reloaded.dirty
+    assert reloaded.footprints == footprints.footprints
+    assert reloaded.get("SOT23")['Shape'] == "rectangle"
@@ -0,0 +1,70 @@
+import time
+
+import pytest
+
+from frames import FrameCache, render_frame
+
+
+def job(size):
+    return lambda: {"width": size, "height": size, "shapes": [(False, [1, 1, 8, 1, 8, 8, 1, 8]), (True, [2, 2, 6, 6])],
+                    "labels": [(5, 5, "R1", 90)]}
+
+
+def collect_until(cache, pages, timeout=10):
+    # The worker thread renders in the background, wait until every page is stored
+    added = []
+    deadline = time.monotonic() + timeout
+    while not all(page in cache for page in pages):
+        if time.monotonic() > deadline:
+            pytest.fail(f"pages {pages} not rendered")
+        added += cache.collect(lambda image: image.size)
+        time.sleep(0.001)
+    return added
+
+
+def test_render_frame():
+    frame = render_frame(20, 10, [(False, [1, 1, 8, 1, 8, 8, 1, 8])], [(10, 5, "C1", 0)], fill=True)
+    assert frame.size == (20, 10) and frame.mode == "RGBA"
+    assert frame.getpixel((4, 4)) != (0, 0, 0, 0)
+    assert frame.getpixel((19, 0)) == (0, 0, 0, 0)
+
+
+def test_least_recently_used_frame_is_evicted():
+    cache = FrameCache(max_frames=2)
+    cache.set_view("view")
+    for page in (1, 2):
+        cache.request(page, job(10))
+        collect_until(cache, [page])
+    # Page 1 was looked at last, page 2 goes when page 3 arrives
+    assert cache.get(1) == (10, 10)
+    cache.request(3, job(10))
+    collect_until(cache, [3])
+    assert 1 in cache and 3 in cache and 2 not in cache
+    assert not cache.pending
+
+
+def test_request_skips_cached_and_queued_pages():
+    cache = FrameCache()
+    cache.set_view("view")
+    cache.request(1, job(10))
+    # make_job is not even called for a page already queued or stored
+    cache.request(1, lambda: pytest.fail("rendered twice"))
+    collect_until(cache, [1])
+    cache.request(1, lambda: pytest.fail("rendered twice"))
+
+
+def test_frames_from_a_stale_view_are_dropped():
+    cache = FrameCache()
+    cache.set_view("before")
+    cache.request(1, job(10))
+    cache.set_view("after")
+    assert not cache.pending
+    cache.request(1, job(20))
+    # Results come back in order, the stale frame is dropped before the fresh one is stored
+    assert collect_until(cache, [1]) == [1]
+    assert cache.get(1) == (20, 20)
+
+    cache.set_view("after")
+    assert 1 in cache
+    cache.set_view("moved")
+    assert 1 not in cache and cache.get(1) is None
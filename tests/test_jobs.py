@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+
+from jobs import Job, JobManager, estimate_size
+
+MB = 1024 * 1024
+
+
+def model(megabytes):
+    return {"outlines": np.zeros(megabytes * MB, dtype=np.uint8), "pages": [["R1", "R2"], ["C1"]]}
+
+
+def job(tmp_path, name):
+    directory = tmp_path / name
+    directory.mkdir()
+    return Job(name, str(directory / "inputdata.csv"), str(tmp_path / "footprints.csv"))
+
+
+def test_estimate_size():
+    assert estimate_size(np.zeros(1000)) == 8000
+    assert MB < estimate_size(model(1)) < MB + 10000
+    # Shared objects are only counted once
+    array = np.zeros(MB, dtype=np.uint8)
+    assert estimate_size([array, array]) < 2 * MB
+    # Big containers are extrapolated from a sample
+    assert estimate_size([np.zeros(100, dtype=np.uint8) for _ in range(1000)]) >= 100 * 1000
+
+
+def test_store_evicts_least_recently_used_down_to_budget():
+    jobs = JobManager(budget=int(3.5 * MB))
+    jobs.store("a", model(1))
+    jobs.store("b", model(1))
+    jobs.store("c", model(1))
+    # Taking and storing "a" again makes it the most recently used
+    jobs.store("a", jobs.take("a"))
+    jobs.store("d", model(1))
+    assert not jobs.is_cached("b")
+    assert [jobs.is_cached(name) for name in "acd"] == [True, True, True]
+    assert jobs.memory_used <= jobs.budget
+
+
+def test_newest_model_is_kept_over_budget():
+    jobs = JobManager(budget=MB)
+    jobs.store("a", model(1))
+    jobs.store("big", model(3))
+    assert not jobs.is_cached("a")
+    assert jobs.is_cached("big")
+    assert jobs.memory_used > jobs.budget
+
+
+def test_take_removes_the_model():
+    jobs = JobManager()
+    stored = model(1)
+    jobs.store("a", stored)
+    assert jobs.take("a") is stored
+    assert not jobs.is_cached("a")
+    assert jobs.take("a") is None
+    assert jobs.memory_used == 0
+
+
+def test_add_and_remove(tmp_path):
+    jobs = JobManager()
+    jobs.add(job(tmp_path, "rev-a"))
+    with pytest.raises(ValueError):
+        jobs.add(job(tmp_path / "rev-a", "rev-a"))
+    assert jobs.unique_name("rev-a") == "rev-a (2)"
+    jobs.activate("rev-a")
+    jobs.store("rev-a", model(1))
+    jobs.remove("rev-a")
+    assert "rev-a" not in jobs and jobs.active is None and jobs.memory_used == 0
+
+
+def test_job_prefers_its_own_footprints(tmp_path):
+    shared = job(tmp_path, "shared")
+    assert shared.footprints_path == str(tmp_path / "footprints.csv")
+    directory = tmp_path / "own"
+    directory.mkdir()
+    (directory / "footprints.csv").write_text("")
+    own = Job("own", str(directory / "inputdata.csv"), str(tmp_path / "footprints.csv"))
+    assert own.footprints_path == str(directory / "footprints.csv")
+    assert own.paths["bom_path"] == str(directory / "BOM.csv")
+
+
+def test_load_save_round_trip(tmp_path):
+    path = str(tmp_path / "jobs.json")
+    jobs = JobManager()
+    for name in ("rev-a", "rev-b"):
+        jobs.add(job(tmp_path, name))
+    jobs.activate("rev-b")
+    jobs.save(path)
+
+    loaded = JobManager.load(path)
+    assert list(loaded.jobs) == ["rev-a", "rev-b"]
+    assert loaded.active == "rev-b"
+    assert loaded.get("rev-a").paths == jobs.get("rev-a").paths
+    assert len(JobManager.load(str(tmp_path / "missing.json"))) == 0
+
+
+@pytest.mark.parametrize("text", ['{"active": "a", "jobs": [{"name": "a"', '', '[]', '{"jobs": [{"name": "a"}]}',
+                                  '{"jobs": [1]}'])
+def test_corrupt_job_list_is_ignored(tmp_path, text):
+    path = tmp_path / "jobs.json"
+    path.write_text(text)
+    jobs = JobManager.load(str(path))
+    assert len(jobs) == 0 and jobs.active is None
@@ -0,0 +1,32 @@
+import numpy as np
+
+from panel import Panel
+from pcb_utils import transform_points
+
+
+def test_copies_skip_and_count_row_by_row():
+    panel = Panel(2, 3, 50.0, 40.0, skip={1, 4})
+    assert panel.copies() == [0, 2, 3, 5]
+    assert len(panel) == 4
+
+
+def test_size_covers_every_copy():
+    assert Panel(2, 3, 50.0, 40.0).size(30.0, 20.0) == (130.0, 60.0)
+
+
+def test_copy_matrix_offsets_and_turns_about_board_center():
+    panel = Panel(2, 2, 50.0, 40.0, rotations=[0, 0, 0, 180])
+    # Copy 3 is top-right, turned half way round its own center
+    origin = transform_points(panel.copy_matrix(3, 30.0, 20.0), [0.0, 0.0])
+    assert np.allclose(origin, [80.0, 60.0])
+
+
+def test_copy_matrices_follow_copies():
+    panel = Panel(1, 3, 50.0, 0.0, skip={1})
+    matrices = panel.copy_matrices(30.0, 20.0)
+    assert matrices.shape == (2, 3, 3)
+    assert np.allclose(matrices[:, :2, 2], [[0.0, 0.0], [100.0, 0.0]])
+
+
+def test_copy_matrices_empty_when_every_copy_is_skipped():
+    assert Panel(1, 2, 50.0, 0.0, skip={0, 1}).copy_matrices(30.0, 20.0).shape == (0, 3, 3)
@@ -0,0 +1,101 @@
+import os
+
+import numpy as np
+import pytest
+
+from board import Board, Placement
+from project_cache import layer_cache_path, load_project_cache, save_project_cache
+from readpickandplace import BOTTOM_LAYER, TOP_LAYER
+
+EXPORT = ("Designator,Comment,Layer,Footprint,Center-X(mm),Center-Y(mm),Rotation,Description\n"
+          "R1,10k,TopLayer,R0603,10,20,90,Resistor\n"
+          "C1,1uF,TopLayer,C0805,30,5,0,Capacitor\n"
+          "U1,MCU,TopLayer,QFN32,50,40,45,Controller\n")
+
+LIBRARY = {"R0603": {'Shape': 'rectangle', 'Width': 1.6, 'Height': 0.8, 'CenterX': 0.0, 'CenterY': 0.0},
+           "C0805": {'Shape': 'circle', 'Width': 2.0, 'Height': 2.0, 'CenterX': 0.0, 'CenterY': 0.0}}
+
+
+@pytest.fixture
+def job(tmp_path):
+    source = tmp_path / "inputdata.csv"
+    source.write_text(EXPORT)
+    bom = tmp_path / "BOM.csv"
+    bom.write_text("Designator,Quantity\nR1,1\n")
+    board = Board.load(str(source), layer=TOP_LAYER)
+    matches = [LIBRARY.get(name) for name in board.footprint_names]
+    placement = Placement.build(board, matches)
+    match_names = [name if name in LIBRARY else None for name in board.footprint_names]
+    cache_path = str(tmp_path / "pcbdata.cache.npz")
+    sources = [str(source), str(bom)]
+    save_project_cache(cache_path, sources, board, placement, match_names, [["R1"], ["C1", "U1"]])
+    return cache_path, sources, board, placement
+
+
+def test_layer_cache_path():
+    assert layer_cache_path("/job/pcbdata.cache.npz", TOP_LAYER) == "/job/pcbdata.cache.npz"
+    assert layer_cache_path("/job/pcbdata.cache.npz", BOTTOM_LAYER) == f"/job/pcbdata.cache.{BOTTOM_LAYER}.npz"
+
+
+def test_round_trip(job):
+    cache_path, sources, board, placement = job
+    assert not os.path.exists(cache_path + ".tmp")
+    cache = load_project_cache(cache_path, sources)
+    loaded = cache["board"]
+    assert loaded.designators == board.designators
+    assert list(loaded.x) == list(board.x) and list(loaded.rotation) == list(board.rotation)
+    assert loaded.footprint_names == board.footprint_names
+    assert loaded.index_of("U1") == board.index_of("U1")
+    assert cache["footprint_matches"] == ["R0603", "C0805", None]
+    assert cache["bom_pages"] == [["R1"], ["C1", "U1"]]
+    assert np.array_equal(cache["placement"].indices, placement.indices)
+    assert np.allclose(cache["placement"].outlines, placement.outlines)
+    assert cache["placement"].missing_footprints == {"QFN32"}
+
+
+def test_changed_source_invalidates(job):
+    cache_path, sources, _, _ = job
+    with open(sources[1], 'a') as f:
+        f.write("C1,1\n")
+    assert load_project_cache(cache_path, sources) is None
+
+
+def test_touched_source_with_same_content_is_kept(job):
+    cache_path, sources, _, _ = job
+    stat = os.stat(sources[0])
+    os.utime(sources[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+    assert load_project_cache(cache_path, sources) is not None
+
+    # Same size and a new mtime, but different content
+    with open(sources[0]) as f:
+        text = f.read()
+    with open(sources[0], 'w') as f:
+        f.write(text.replace("10k", "22k"))
+    assert load_project_cache(cache_path, sources) is None
+
+
+def test_missing_source_invalidates(job):
+    cache_path, sources, _, _ = job
+    os.remove(sources[1])
+    assert load_project_cache(cache_path, sources) is None
+    assert load_project_cache(cache_path + ".missing", sources[:1]) is None
+
+
+@pytest.mark.parametrize("damage", ["truncate", "empty", "garbage"])
+def test_damaged_cache_is_a_miss(job, damage):
+    cache_path, sources, _, _ = job
+    with open(cache_path, 'rb') as f:
+        data = f.read()
+    with open(cache_path, 'wb') as f:
+        f.write({"truncate": data[:len(data) // 2], "empty": b"", "garbage": b"not a zip file" * 10}[damage])
+    assert load_project_cache(cache_path, sources) is None
+
+
+def test_failed_save_leaves_no_temp_file(job):
+    cache_path, sources, board, placement = job
+    broken = Placement(placement.indices, placement.shapes, placement.outlines, [object()])
+    with pytest.raises(TypeError):
+        save_project_cache(cache_path, sources, board, broken, [None] * len(board.footprint_names), [])
+    assert not os.path.exists(cache_path + ".tmp")
+    # The previous cache is untouched
+    assert load_project_cache(cache_path, sources) is not None
@@ -0,0 +1,69 @@
+import pytest
+
+from readpickandplace import (BOTTOM_LAYER, TOP_LAYER, detect_encoding, read_pick_and_place,
+                              read_pick_and_place_chunks)
+
+EXPORT = (
+    "Altium Designer Pick and Place Locations\r\n"
+    "Units used in this file : mm\r\n"
+    "\r\n"
+    "Designator,Comment,Layer,Footprint,Center-X(mm),Center-Y(mm),Rotation,Description\r\n"
+    + "".join(f"R{index},10µF,{TOP_LAYER if index % 3 else BOTTOM_LAYER},0603,{index}.5,\"{index},25\",90,Résistance\r\n"
+              for index in range(1, 61))
+)
+
+
+def write_export(tmp_path, encoding):
+    path = tmp_path / "inputdata.csv"
+    path.write_bytes(EXPORT.encode(encoding))
+    return str(path)
+
+
+def chunked_rows(path, chunk_size, layer=None):
+    rows = []
+    for chunk in read_pick_and_place_chunks(path, layer=layer, chunk_size=chunk_size):
+        rows.extend(zip(chunk.designators, chunk.x, chunk.y, chunk.comments, chunk.layers, chunk.descriptions))
+    return rows
+
+
+def streamed_rows(path, layer=None):
+    return [(c.designator, c.x, c.y, c.comment, c.layer, c.description) for c in read_pick_and_place(path, layer=layer)]
+
+
+def test_detect_encoding():
+    assert detect_encoding(b'\xef\xbb\xbfDesignator') == 'utf-8-sig'
+    assert detect_encoding('Designator'.encode('utf-16')) == 'utf-16'
+    assert detect_encoding('Résistance'.encode('cp1252')) == 'cp1252'
+    # A multi-byte character cut off at the end of the sample is still UTF-8
+    assert detect_encoding('Résistance'.encode('utf-8')[:2]) == 'utf-8'
+
+
+@pytest.mark.parametrize("encoding", ['utf-8', 'utf-8-sig', 'utf-16', 'cp1252'])
+@pytest.mark.parametrize("chunk_size", [7, 64, 1001, 1 << 20])
+def test_chunked_reader_matches_streaming_reader(tmp_path, encoding, chunk_size):
+    path = write_export(tmp_path, encoding)
+    expected = streamed_rows(path)
+    assert len(expected) == 60
+    assert expected[0] == ('R1', 1.5, 1.25, '10µF', TOP_LAYER, 'Résistance')
+    assert chunked_rows(path, chunk_size) == expected
+
+
+def test_legacy_bytes_after_an_ascii_start(tmp_path):
+    path = tmp_path / "inputdata.csv"
+    path.write_bytes(("Designator,Center-X(mm),Center-Y(mm)\r\n" + "C1,1,2\r\n" * 200).encode('ascii')
+                     + "C2,3,4,Résistance\r\n".encode('cp1252'))
+    rows = chunked_rows(str(path), 256)
+    assert rows[-1][0] == 'C2' and len(rows) == 201
+
+
+def test_layer_filter(tmp_path):
+    path = write_export(tmp_path, 'utf-16')
+    bottom = chunked_rows(path, 100, layer=BOTTOM_LAYER)
+    assert [row[0] for row in bottom] == [f"R{index}" for index in range(3, 61, 3)]
+
+
+def test_missing_header(tmp_path):
+    path = tmp_path / "inputdata.csv"
+    path.write_text("just,some\r\ncolumns,here\r\n")
+    with pytest.raises(ValueError):
+        list(read_pick_and_place_chunks(str(path), chunk_size=8))
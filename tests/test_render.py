@@ -0,0 +1,87 @@
+from render import (DOT_MAX_PX, LABEL_MIN_PX, LOD_DOT, LOD_FULL, LOD_HIDDEN, LOD_OUTLINE, RenderScheduler,
+                    level_of_detail)
+
+
+class FakeWidget:
+    # Records the after() calls instead of running a Tk event loop
+    def __init__(self):
+        self.calls = []
+        self.cancelled = []
+
+    def after(self, ms, callback):
+        self.calls.append(("after", ms, callback))
+        return f"after#{len(self.calls)}"
+
+    def after_idle(self, callback):
+        self.calls.append(("idle", 0, callback))
+        return f"after#{len(self.calls)}"
+
+    def after_cancel(self, after_id):
+        self.cancelled.append(after_id)
+
+    def run_next(self):
+        _, _, callback = self.calls.pop(0)
+        callback()
+
+
+def test_requests_for_a_key_are_coalesced():
+    widget = FakeWidget()
+    scheduler = RenderScheduler(widget)
+    ran = []
+    for position in range(5):
+        scheduler.schedule("drag", lambda position=position: ran.append(("drag", position)))
+    scheduler.schedule("hover", lambda: ran.append(("hover", None)))
+    # One frame requested for all of them, the first one right away
+    assert [kind for kind, _, _ in widget.calls] == ["idle"]
+    widget.run_next()
+    assert ran == [("drag", 4), ("hover", None)]
+
+
+def test_next_frame_waits_for_the_frame_interval():
+    widget = FakeWidget()
+    scheduler = RenderScheduler(widget, frame_rate=10)
+    scheduler.schedule("drag", lambda: None)
+    widget.run_next()
+    scheduler.schedule("drag", lambda: None)
+    kind, ms, _ = widget.calls[0]
+    assert kind == "after" and 0 < ms <= 101
+
+
+def test_flush_runs_pending_now():
+    widget = FakeWidget()
+    scheduler = RenderScheduler(widget)
+    ran = []
+    scheduler.schedule("drag", lambda: ran.append(1))
+    scheduler.flush()
+    assert ran == [1]
+    assert widget.cancelled == ["after#1"]
+    # Nothing left for the frame that was cancelled, and flushing again is harmless
+    scheduler.flush()
+    assert ran == [1]
+
+
+def test_cancel_keeps_requests_for_the_next_schedule():
+    widget = FakeWidget()
+    scheduler = RenderScheduler(widget)
+    ran = []
+    scheduler.schedule("a", lambda: ran.append("a"))
+    scheduler.cancel()
+    scheduler.schedule("b", lambda: ran.append("b"))
+    assert len(widget.calls) == 2
+    widget.calls[-1][2]()
+    assert ran == ["a", "b"]
+
+
+def test_level_of_detail_thresholds():
+    boxes = [(10, 10, 10 + size, 12) for size in (DOT_MAX_PX, DOT_MAX_PX + 1, LABEL_MIN_PX - 1, LABEL_MIN_PX)]
+    assert level_of_detail(boxes, 800, 600).tolist() == [LOD_DOT, LOD_OUTLINE, LOD_OUTLINE, LOD_FULL]
+    # The longer side decides, whichever way the part is turned
+    assert level_of_detail([(10, 10, 12, 10 + LABEL_MIN_PX)], 800, 600).tolist() == [LOD_FULL]
+
+
+def test_level_of_detail_culls_off_canvas():
+    boxes = [(-30, 10, -1, 40), (801, 10, 830, 40), (10, -30, 40, -0.5), (10, 601, 40, 630),
+             # Partly on screen or touching the edge still counts
+             (-10, -10, 5, 5), (790, 590, 820, 620), (-20, 10, 0, 40)]
+    assert level_of_detail(boxes, 800, 600).tolist() == [LOD_HIDDEN] * 4 + [LOD_FULL] * 3
+    assert level_of_detail([], 800, 600).tolist() == []
@@ -0,0 +1,61 @@
+import numpy as np
+
+from board import Board, Placement
+from readpickandplace import TOP_LAYER
+from scene import ComponentScene
+
+HEADER = "Designator,Comment,Layer,Footprint,Center-X(mm),Center-Y(mm),Rotation,Description\n"
+
+LIBRARY = {"R0603": {'Shape': 'rectangle', 'Width': 1.6, 'Height': 0.8, 'CenterX': 0.0, 'CenterY': 0.0},
+           "LED3": {'Shape': 'circle', 'Width': 3.0, 'Height': 3.0, 'CenterX': 0.0, 'CenterY': 0.0}}
+
+
+def scene(tmp_path, rows, copies=(0,), copy_rotations=(0.0,), copy_matrices=None):
+    path = tmp_path / "inputdata.csv"
+    path.write_text(HEADER + "".join(row + "\n" for row in rows))
+    board = Board.load(str(path), layer=TOP_LAYER)
+    placement = Placement.build(board, [LIBRARY.get(name) for name in board.footprint_names])
+    if copy_matrices is None:
+        copy_matrices = np.eye(3)[np.newaxis]
+    return ComponentScene(board, placement, list(copies), list(copy_rotations), copy_matrices)
+
+
+BEFORE = ["R1,10k,TopLayer,R0603,10,10,0,",
+          "R2,10k,TopLayer,R0603,20,10,0,",
+          "D1,Red,TopLayer,LED3,30,10,0,",
+          "R3,10k,TopLayer,R0603,40,10,0,"]
+
+
+def test_match_entries_keeps_unchanged_entries(tmp_path):
+    previous = scene(tmp_path, BEFORE)
+    current = scene(tmp_path, ["R9,1k,TopLayer,R0603,50,10,0,",   # new
+                               "R3,10k,TopLayer,R0603,40,10,0,",   # unchanged, listed in another order
+                               "R1,22k,TopLayer,R0603,10,10,0,",   # only the value changed
+                               "R2,10k,TopLayer,R0603,20,12,0,",   # moved
+                               "D1,Red,TopLayer,LED3,30,10,90,"])  # rotated
+    keys = current.keys
+    assert current.match_entries(previous) == {keys.index("R3"): previous.keys.index("R3"),
+                                               keys.index("R1"): previous.keys.index("R1")}
+
+
+def test_match_entries_without_common_keys(tmp_path):
+    previous = scene(tmp_path, BEFORE[:1])
+    current = scene(tmp_path, ["R5,10k,TopLayer,R0603,10,10,0,"])
+    assert current.match_entries(previous) == {}
+
+
+def test_panel_copies_and_entries_of(tmp_path):
+    shifted = np.eye(3)
+    shifted[0, 2] = 100.0
+    panel = scene(tmp_path, BEFORE, copies=(0, 1), copy_rotations=(0.0, 0.0),
+                  copy_matrices=np.stack([np.eye(3), shifted]))
+    assert len(panel) == 8
+    assert panel.keys[:4] == ["R1", "R2", "D1", "R3"]
+    assert panel.keys[4:] == ["R1/2", "R2/2", "D1/2", "R3/2"]
+    assert panel.entries_of(["R2", "U7"]) == [1, 5]
+    assert np.allclose(panel.centers[5] - panel.centers[1], [100.0, 0.0])
+    assert panel.is_circle.tolist() == [False, False, True, False] * 2
+
+    # Only the first copy shares its keys with the single board
+    single = scene(tmp_path, BEFORE)
+    assert panel.match_entries(single) == {0: 0, 1: 1, 2: 2, 3: 3}
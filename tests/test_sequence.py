@@ -0,0 +1,69 @@
+import itertools
+import math
+import random
+
+import numpy as np
+
+from sequence import nearest_neighbours, order_pages, outline_areas, two_opt, visiting_path
+
+
+def path_length(points, path):
+    return sum(math.dist(points[a], points[b]) for a, b in zip(path, path[1:]))
+
+
+def test_outline_areas():
+    outlines = np.array([[[0, 0], [2, 0], [2, 1], [0, 1]], [[0, 0], [0, 3], [3, 3], [3, 0]]], dtype=float)
+    assert outline_areas(outlines).tolist() == [2.0, 9.0]
+
+
+def test_nearest_neighbours_match_brute_force():
+    rng = np.random.default_rng(1)
+    points = rng.uniform(0, 100, (300, 2))
+    neighbours = nearest_neighbours(points, 5)
+    distances = ((points[:, np.newaxis] - points[np.newaxis]) ** 2).sum(axis=2)
+    np.fill_diagonal(distances, np.inf)
+    expected = np.sort(distances, axis=1)[:, :5]
+    assert np.allclose(np.take_along_axis(distances, neighbours, axis=1), expected)
+
+
+def test_two_opt_untangles_crossing():
+    # 0 2 1 3 along a line zigzags back, reversing the middle removes the detour
+    points = np.array([[0, 0], [2, 0], [1, 0], [3, 0]], dtype=float)
+    path = two_opt(points, [0, 1, 2, 3], nearest_neighbours(points, 3))
+    assert path == [0, 2, 1, 3]
+
+
+def test_two_opt_keeps_start_and_never_lengthens():
+    rng = random.Random(3)
+    points = np.array([[rng.uniform(0, 50), rng.uniform(0, 50)] for _ in range(200)])
+    start = list(range(len(points)))
+    rng.shuffle(start)
+    path = two_opt(points, start, nearest_neighbours(points, 8))
+    assert path[0] == start[0]
+    assert sorted(path) == list(range(len(points)))
+    assert path_length(points, path) < path_length(points, start)
+
+
+def test_visiting_path_is_optimal_on_small_sets():
+    rng = random.Random(5)
+    for _ in range(20):
+        points = [(rng.uniform(0, 10), rng.uniform(0, 10)) for _ in range(6)]
+        path = visiting_path(points, points[0])
+        assert path[0] == 0
+        best = min(path_length(points, (0,) + rest) for rest in itertools.permutations(range(1, 6)))
+        # 2-opt is a local search, allow a little slack over the exact optimum
+        assert path_length(points, path) <= best * 1.25
+
+
+def test_visiting_path_start_on_tiny_sets():
+    assert visiting_path([]) == []
+    assert visiting_path([(5, 5)], (0, 0)) == [0]
+    assert visiting_path([(5, 5), (1, 1)], (0, 0)) == [1, 0]
+    assert visiting_path([(5, 5), (1, 1)]) == [0, 1]
+
+
+def test_order_pages_smallest_and_passives_first():
+    pages = [["U1"], ["R1", "R2"], ["D1"], ["J1"]]
+    page_entries = [np.array([0]), np.array([1, 2]), np.array([3]), np.array([], dtype=int)]
+    areas = np.array([25.0, 1.3, 1.2, 1.25])
+    assert order_pages(pages, page_entries, areas) == [1, 2, 0, 3]
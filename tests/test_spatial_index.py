@@ -0,0 +1,57 @@
+from pcb_utils import footprint_outlines
+from spatial_index import OutlineIndex
+
+
+def index(parts, cell_size=None):
+    # parts are (center x, center y, width, height, rotation, is circle)
+    outlines = footprint_outlines([(x, y) for x, y, *_ in parts], [part[4] for part in parts],
+                                  [(part[2], part[3]) for part in parts])
+    return OutlineIndex(outlines, [part[5] for part in parts], cell_size)
+
+
+def test_smallest_overlapping_outline_wins():
+    outlines = index([(5, 5, 10, 10, 0, False), (5, 5, 1.6, 0.8, 0, False), (5, 5, 3, 3, 0, False)])
+    assert outlines.query_point(5, 5) == 1
+    assert outlines.query_point(6, 5) == 2
+    assert outlines.query_point(1, 1) == 0
+
+
+def test_circle_and_rotated_quad_hit_tests():
+    outlines = index([(0, 0, 2, 2, 0, True), (10, 0, 2, 2, 45, False)])
+    # Inside the bounding box of both, outside the actual outline
+    assert outlines.query_point(0.9, 0.9) is None
+    assert outlines.query_point(0.7, 0.7) == 0
+    assert outlines.query_point(10.9, 0.9) is None
+    assert outlines.query_point(10.5, 0.5) == 1
+    assert outlines.query_point(11.4, 0) == 1
+
+
+def test_points_on_cell_borders():
+    outlines = index([(1, 1, 2, 2, 0, False), (3, 1, 2, 2, 0, False)], cell_size=1.0)
+    assert outlines.query_point(0, 0) == 0
+    assert outlines.query_point(1, 1) == 0
+    # Shared edge, both contain it and have the same area, the first listed wins
+    assert outlines.query_point(2, 1) == 0
+    assert outlines.query_point(4, 2) == 1
+    assert outlines.query_point(2.0001, 1) == 1
+
+
+def test_miss():
+    outlines = index([(5, 5, 1, 1, 0, False)])
+    assert outlines.query_point(50, 50) is None
+    assert outlines.query_point(-5, 5) is None
+    assert outlines.query_point(6, 5) is None
+    empty = OutlineIndex([], [])
+    assert len(empty) == 0 and empty.query_point(0, 0) is None
+
+
+def test_large_outline_spans_many_cells():
+    parts = [(x + 0.5, y + 0.5, 0.5, 0.5, 0, False) for x in range(0, 100, 10) for y in range(0, 100, 10)]
+    parts.append((50, 50, 100, 100, 0, False))
+    outlines = index(parts)
+    assert outlines.cell_size == 1.0
+    large = len(parts) - 1
+    assert sum(large in entries for entries in outlines.cells.values()) == 101 * 101
+    assert outlines.query_point(73.5, 12.25) == large
+    assert outlines.query_point(99.9, 0.1) == large
+    assert outlines.query_point(30.5, 40.5) == parts.index((30.5, 40.5, 0.5, 0.5, 0, False))
@@ -0,0 +1,82 @@
+import os
+
+import pytest
+
+from watcher import FileWatcher
+
+
+@pytest.fixture
+def watcher():
+    # Rounds are driven by calling poll(), the thread never gets to run one
+    watcher = FileWatcher(interval=3600)
+    yield watcher
+    watcher.stop()
+
+
+def write(path, text, mtime_step=0):
+    path.write_text(text)
+    if mtime_step:
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + mtime_step * 1_000_000_000))
+
+
+def test_change_reported_after_settling_for_two_rounds(tmp_path, watcher):
+    path = tmp_path / "BOM.csv"
+    write(path, "a")
+    watcher.watch({str(path): lambda name: open(name).read()})
+    watcher.poll()
+    assert watcher.collect() == []
+
+    write(path, "ab", mtime_step=1)
+    watcher.poll()
+    assert watcher.collect() == []
+    watcher.poll()
+    assert watcher.collect() == [(str(path), "ab", None)]
+    watcher.poll()
+    assert watcher.collect() == []
+
+
+def test_file_still_being_written_waits(tmp_path, watcher):
+    path = tmp_path / "inputdata.csv"
+    write(path, "a")
+    watcher.watch({str(path): None})
+    write(path, "ab", mtime_step=1)
+    watcher.poll()
+    write(path, "abc", mtime_step=2)
+    watcher.poll()
+    assert watcher.collect() == []
+    watcher.poll()
+    assert watcher.collect() == [(str(path), None, None)]
+
+
+def test_load_errors_and_deleted_files(tmp_path, watcher):
+    broken = tmp_path / "footprints.csv"
+    removed = tmp_path / "BOM.csv"
+    write(broken, "a")
+    write(removed, "a")
+
+    def load(name):
+        raise ValueError(name)
+
+    watcher.watch({str(broken): load, str(removed): load})
+    write(broken, "ab", mtime_step=1)
+    os.remove(removed)
+    watcher.poll()
+    watcher.poll()
+    changes = dict((path, (result, error)) for path, result, error in watcher.collect())
+    assert isinstance(changes[str(broken)][1], ValueError)
+    # A deleted file is reported without being loaded
+    assert changes[str(removed)] == (None, None)
+
+
+def test_changes_from_an_old_watch_are_dropped(tmp_path, watcher):
+    old, new = tmp_path / "old.csv", tmp_path / "new.csv"
+    write(old, "a")
+    write(new, "a")
+    watcher.watch({str(old): None})
+    write(old, "ab", mtime_step=1)
+    watcher.poll()
+    watcher.poll()
+    watcher.watch({str(new): None})
+    assert watcher.paths == [str(new)]
+    assert watcher.collect() == []
@@ -0,0 +1,100 @@
+import logging
+import queue
+import threading
+
+from project_cache import file_signature
+
+logger = logging.getLogger(__name__)
+
+# Seconds between two stat() rounds
+DEFAULT_POLL_INTERVAL = 1.0
+
+
+class FileWatcher:
+    """
+    Polls the size and mtime of a few files on a daemon thread.
+
+    A change is only reported once the file has looked the same for two
+    rounds in a row, so a file still being written is not read half way.
+    Each watched file can have a load(path) function that runs on the
+    watcher thread, keeping slow parsing off the Tk thread. collect()
+    hands back (path, result, error) tuples on the caller's thread.
+    """
+
+    def __init__(self, interval=DEFAULT_POLL_INTERVAL):
+        self.interval = interval
+        self._files = {}  # path -> [signature, pending signature, load]
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._changes = queue.Queue()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def watch(self, files):
+        """
+        Watch the paths of files, a dict of path to load function (or None),
+        instead of whatever was watched before. Changes already seen for the
+        old set are dropped.
+        """
+        watched = {path: [file_signature(path, with_hash=False), None, load] for path, load in files.items()}
+        with self._lock:
+            self._files = watched
+            self._generation += 1
+        if self._thread is None and watched:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    @property
+    def paths(self):
+        with self._lock:
+            return list(self._files)
+
+    def stop(self):
+        self._stop.set()
+
+    def collect(self):
+        changes = []
+        while True:
+            try:
+                generation, path, result, error = self._changes.get_nowait()
+            except queue.Empty:
+                break
+            if generation == self._generation:
+                changes.append((path, result, error))
+        return changes
+
+    def poll(self):
+        """
+        One stat() round, loading and queueing every file that changed and settled.
+        """
+        with self._lock:
+            generation = self._generation
+            files = list(self._files.items())
+
+        for path, state in files:
+            signature = file_signature(path, with_hash=False)
+            if signature == state[0]:
+                state[1] = None
+                continue
+            if signature != state[1]:
+                # Changed since the last round, wait until it stops changing
+                state[1] = signature
+                continue
+
+            state[0], state[1] = signature, None
+            result = error = None
+            load = state[2]
+            if load is not None and signature is not None:
+                try:
+                    result = load(path)
+                except Exception as e:
+                    error = e
+            logger.info("%s changed on disk", path)
+            self._changes.put((generation, path, result, error))
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.poll()
+            except Exception:
+                logger.exception("File watcher round failed")